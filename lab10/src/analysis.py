@@ -1,10 +1,15 @@
+import os
 import time
 import random
 import sys
 from typing import Dict, Tuple, Callable
-from modules.graph_representation import GraphMatrix, GraphList
+from modules.graph_representation import GraphMatrix, GraphList, GraphCSR
 from modules.graph_traversal import GraphExplorer
 from modules.shortest_path import PathFinder
+from main import MazeSolver
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from lab_loader import load_lab_module
 
 sys.setrecursionlimit(10000)
 
@@ -54,6 +59,16 @@ class Benchmark:
         
         return matrix_graph, list_graph
     
+    @staticmethod
+    def to_bit_matrix(list_graph: GraphList) -> GraphMatrix:
+        """Скопировать невзвешенный граф в битовую матрицу."""
+        bit_graph = GraphMatrix(list_graph.vertex_count, directed=list_graph.is_directed,
+                                storage='bits')
+        for u, neighbors in list_graph.adj_list.items():
+            for v in neighbors:
+                bit_graph.add_edge(u, v)
+        return bit_graph
+    
     @staticmethod
     def compare_memory():
         """Сравнить использование памяти."""
@@ -64,26 +79,76 @@ class Benchmark:
         sizes = [10, 50, 100, 200, 500]
         
         print("\nГраф с 50% рёбер:")
-        print(f"{'Вершины':<10} {'Матрица (KB)':<15} {'Список (KB)':<15} {'Экономия':<10}")
-        print("-" * 50)
+        print(f"{'Вершины':<10} {'Матрица (KB)':<15} {'Список (KB)':<15} {'CSR (KB)':<15} "
+              f"{'Биты (KB)':<15} {'Экономия':<10}")
+        print("-" * 80)
         
         for sz in sizes:
             mat_g, lst_g = Benchmark.make_dense_graph(sz)
+            csr_g = GraphCSR.from_graph_list(lst_g)
+            bit_g = Benchmark.to_bit_matrix(lst_g)
             mem_mat = mat_g.get_memory_usage() / 1024
             mem_lst = lst_g.get_memory_usage() / 1024
+            mem_csr = csr_g.get_memory_usage() / 1024
+            mem_bit = bit_g.get_memory_usage() / 1024
             saving = (1 - mem_lst / mem_mat) * 100
-            print(f"{sz:<10} {mem_mat:<15.2f} {mem_lst:<15.2f} {saving:<10.1f}%")
+            print(f"{sz:<10} {mem_mat:<15.2f} {mem_lst:<15.2f} {mem_csr:<15.2f} "
+                  f"{mem_bit:<15.2f} {saving:<10.1f}%")
         
         print("\nГраф с линейным числом рёбер:")
-        print(f"{'Вершины':<10} {'Матрица (KB)':<15} {'Список (KB)':<15} {'Экономия':<10}")
-        print("-" * 50)
+        print(f"{'Вершины':<10} {'Матрица (KB)':<15} {'Список (KB)':<15} {'CSR (KB)':<15} "
+              f"{'Биты (KB)':<15} {'Экономия':<10}")
+        print("-" * 80)
         
         for sz in sizes:
             mat_g, lst_g = Benchmark.make_sparse_graph(sz)
+            csr_g = GraphCSR.from_graph_list(lst_g)
+            bit_g = Benchmark.to_bit_matrix(lst_g)
             mem_mat = mat_g.get_memory_usage() / 1024
             mem_lst = lst_g.get_memory_usage() / 1024
+            mem_csr = csr_g.get_memory_usage() / 1024
+            mem_bit = bit_g.get_memory_usage() / 1024
             saving = (1 - mem_lst / mem_mat) * 100
-            print(f"{sz:<10} {mem_mat:<15.2f} {mem_lst:<15.2f} {saving:<10.1f}%")
+            print(f"{sz:<10} {mem_mat:<15.2f} {mem_lst:<15.2f} {mem_csr:<15.2f} "
+                  f"{mem_bit:<15.2f} {saving:<10.1f}%")
+        
+        print("\nПолучение соседей get_neighbors() в плотном графе:")
+        print(f"{'Вершины':<10} {'Матрица (мкс)':<15} {'Биты (мкс)':<15} {'Ускорение':<10}")
+        print("-" * 50)
+        
+        for sz in sizes:
+            mat_g, lst_g = Benchmark.make_dense_graph(sz)
+            bit_g = Benchmark.to_bit_matrix(lst_g)
+            time_mat = sum(Benchmark.time_function(mat_g.get_neighbors, v) for v in range(sz)) / sz
+            time_bit = sum(Benchmark.time_function(bit_g.get_neighbors, v) for v in range(sz)) / sz
+            ratio = time_mat / time_bit if time_bit > 0 else 0
+            print(f"{sz:<10} {time_mat*1e6:<15.2f} {time_bit*1e6:<15.2f} {ratio:<10.2f}x")
+        
+        print("\nПропускная способность BFS / Dijkstra (список vs CSR):")
+        print(f"{'Вершины':<10} {'BFS спис. (мс)':<16} {'BFS CSR (мс)':<16} "
+              f"{'Dijk. спис. (мс)':<18} {'Dijk. CSR (мс)':<16}")
+        print("-" * 76)
+        
+        for sz in [1000, 5000, 20000]:
+            lst_g = GraphList(sz)
+            weighted_lst = GraphList(sz, weighted=True)
+            for _ in range(sz * 4):
+                a = random.randint(0, sz - 1)
+                b = random.randint(0, sz - 1)
+                if a != b:
+                    lst_g.add_edge(a, b)
+                    weighted_lst.add_edge(a, b, weight=random.uniform(0.1, 10))
+            
+            csr_g = GraphCSR.from_graph_list(lst_g)
+            weighted_csr = GraphCSR.from_graph_list(weighted_lst)
+            
+            bfs_lst = Benchmark.time_function(GraphExplorer.bfs, lst_g, 0)
+            bfs_csr = Benchmark.time_function(GraphExplorer.bfs, csr_g, 0)
+            dijkstra_lst = Benchmark.time_function(PathFinder.dijkstra, weighted_lst, 0)
+            dijkstra_csr = Benchmark.time_function(PathFinder.dijkstra, weighted_csr, 0)
+            
+            print(f"{sz:<10} {bfs_lst*1e3:<16.2f} {bfs_csr*1e3:<16.2f} "
+                  f"{dijkstra_lst*1e3:<18.2f} {dijkstra_csr*1e3:<16.2f}")
     
     @staticmethod
     def compare_edge_check():
@@ -134,6 +199,43 @@ class Benchmark:
             ratio = time_lst / time_mat if time_mat > 0 else 0
             print(f"{sz:<10} {time_mat*1e6:<15.2f} {time_lst*1e6:<15.2f} {ratio:<10.2f}x")
     
+    @staticmethod
+    def compare_hub_weights():
+        """Сравнить поиск весов на звездообразном графе."""
+        print("\n" + "=" * 70)
+        print("ВЕСА РЁБЕР У ВЕРШИНЫ-ХАБА (звезда)")
+        print("=" * 70)
+        
+        sizes = [500, 1000, 2000, 4000]
+        
+        print(f"\n{'Степень':<10} {'Скан get_weight (мс)':<22} {'Индекс (мс)':<15} "
+              f"{'Итератор (мс)':<15} {'Dijkstra (мс)':<15}")
+        print("-" * 80)
+        
+        for sz in sizes:
+            plain = GraphList(sz + 1, weighted=True)
+            indexed = GraphList(sz + 1, weighted=True, indexed=True)
+            for v in range(1, sz + 1):
+                w = random.uniform(0.1, 10)
+                plain.add_edge(0, v, weight=w)
+                indexed.add_edge(0, v, weight=w)
+            
+            def relax_by_lookup(graph):
+                for nb in graph.get_neighbors(0):
+                    graph.get_weight(0, nb)
+            
+            def relax_by_iterator(graph):
+                for _ in graph.neighbors_with_weights(0):
+                    pass
+            
+            scan_time = Benchmark.time_function(relax_by_lookup, plain)
+            index_time = Benchmark.time_function(relax_by_lookup, indexed)
+            iter_time = Benchmark.time_function(relax_by_iterator, plain)
+            dijkstra_time = Benchmark.time_function(PathFinder.dijkstra, plain, 0)
+            
+            print(f"{sz:<10} {scan_time*1e3:<22.2f} {index_time*1e3:<15.2f} "
+                  f"{iter_time*1e3:<15.2f} {dijkstra_time*1e3:<15.2f}")
+    
     @staticmethod
     def compare_traversal():
         """Сравнить скорость обхода графа."""
@@ -189,6 +291,61 @@ class Benchmark:
             
             ratio = dijkstra_time / bfs_time if bfs_time > 0 else 0
             print(f"{sz:<10} {bfs_time*1e6:<15.2f} {dijkstra_time*1e6:<15.2f} {ratio:<10.2f}x")
+        
+        print("\nПоиск от точки до точки в лабиринте (зафиксировано вершин / время):")
+        print(f"{'Сторона':<10} {'Полный (шт)':<14} {'Ранняя ост.':<14} {'Двунапр.':<14} {'A*':<14} "
+              f"{'A* (мкс)':<12}")
+        print("-" * 80)
+        
+        for side in [20, 40, 80]:
+            route = None
+            while route is None:
+                layout = [['#' if random.random() < 0.15 else ' ' for _ in range(side)]
+                          for _ in range(side)]
+                layout[0][0] = 'S'
+                layout[side // 2][side // 2] = 'E'
+                graph, id_to_cell, start_id, end_id = MazeSolver.build_graph(layout)
+                route = GraphExplorer.bfs_shortest_path(graph, start_id, end_id)
+            
+            heuristic = PathFinder.manhattan_heuristic(id_to_cell)
+            
+            full = sum(1 for d in PathFinder.dijkstra_all_distances(graph, start_id).values()
+                       if d != float('inf'))
+            _, _, early = PathFinder.dijkstra_search(graph, start_id, end_id)
+            _, _, bidir = PathFinder.bidirectional_dijkstra(graph, start_id, end_id)
+            _, _, astar = PathFinder.a_star(graph, start_id, end_id, heuristic)
+            astar_time = Benchmark.time_function(PathFinder.a_star, graph, start_id, end_id, heuristic)
+            
+            print(f"{side:<10} {full:<14} {early:<14} {bidir:<14} {astar:<14} {astar_time*1e6:<12.2f}")
+    
+    @staticmethod
+    def compare_dijkstra_queues():
+        """Сравнить очереди Дейкстры (время и пиковую длину): heapq с ленивым удалением и IndexedHeap из lab7."""
+        print("\n" + "=" * 70)
+        print("DIJKSTRA: heapq (ленивое удаление) vs IndexedHeap (decrease_key)")
+        print("=" * 70)
+        
+        IndexedHeap = load_lab_module('lab7', 'heap').IndexedHeap
+        sizes = [200, 400, 800]
+        
+        print(f"\n{'Вершины':<10} {'Рёбра':<10} {'heapq (мс)':<15} {'Indexed (мс)':<15} {'Indexed d=4 (мс)':<18}")
+        print(f"{'':<10} {'':<10} {'пик очереди':<15} {'пик очереди':<15} {'пик очереди':<18}")
+        print("-" * 70)
+        
+        for sz in sizes:
+            g = GraphList(sz, weighted=True)
+            for u in range(sz):
+                for v in range(u + 1, sz):
+                    if random.random() < 0.5:
+                        g.add_edge(u, v, random.randint(1, 100))
+            
+            factories = [None, IndexedHeap, lambda: IndexedHeap(4)]
+            times = [Benchmark.time_function(PathFinder.dijkstra, g, 0, heap_factory=factory)
+                     for factory in factories]
+            peaks = [PathFinder.dijkstra_queue_peak(g, 0, heap_factory=factory) for factory in factories]
+            
+            print(f"{sz:<10} {g.edge_counter:<10} {times[0]*1e3:<15.2f} {times[1]*1e3:<15.2f} {times[2]*1e3:<18.2f}")
+            print(f"{'':<10} {'':<10} {peaks[0]:<15} {peaks[1]:<15} {peaks[2]:<18}")
     
     @staticmethod
     def scaling_report():
@@ -263,8 +420,10 @@ def run_benchmarks():
     SystemData.print_system_data()
     Benchmark.compare_memory()
     Benchmark.compare_edge_check()
+    Benchmark.compare_hub_weights()
     Benchmark.compare_traversal()
     Benchmark.compare_path_algorithms()
+    Benchmark.compare_dijkstra_queues()
     Benchmark.scaling_report()
 
 
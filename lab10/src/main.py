@@ -1,4 +1,4 @@
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from enum import Enum
 from modules.graph_representation import GraphMatrix, GraphList
 from modules.graph_traversal import GraphExplorer
@@ -22,11 +22,12 @@ class MazeSolver:
     """
     
     @staticmethod
-    def find_path(layout: List[List[str]]) -> Optional[List[Tuple[int, int]]]:
+    def build_graph(layout: List[List[str]]) -> Optional[Tuple[GraphList, Dict[int, Tuple[int, int]], int, int]]:
         """
-        Найти кратчайший путь от старта к финишу.
+        Преобразовать лабиринт в граф.
         
-        Сложность: O(rows * cols)
+        Возвращает (граф, вершина -> клетка, старт, финиш)
+        или None, если старт или финиш не найдены.
         """
         rows = len(layout)
         cols = len(layout[0]) if layout else 0
@@ -69,9 +70,20 @@ class MazeSolver:
                             nb_id = cell_to_id[(nr, nc)]
                             graph.add_edge(cur_id, nb_id)
         
-        start_id = cell_to_id[start_pos]
-        end_id = cell_to_id[end_pos]
+        return graph, id_to_cell, cell_to_id[start_pos], cell_to_id[end_pos]
+    
+    @staticmethod
+    def find_path(layout: List[List[str]]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Найти кратчайший путь от старта к финишу.
+        
+        Сложность: O(rows * cols)
+        """
+        built = MazeSolver.build_graph(layout)
+        if built is None:
+            return None
         
+        graph, id_to_cell, start_id, end_id = built
         route = GraphExplorer.bfs_shortest_path(graph, start_id, end_id)
         
         if route:
@@ -1,7 +1,14 @@
-from typing import Dict, List
+from typing import Dict, List, Iterable, Iterator, Tuple
 from collections import defaultdict
+from array import array
+from bisect import bisect_left
+from itertools import compress
 import sys
 
+# Байт матрицы, развёрнутый в 8 байт 0/1 (младший бит первым)
+_BYTE_BITS = [bytes(byte >> i & 1 for i in range(8)) for byte in range(256)]
+
+
 class GraphMatrix:
     """
     Представление графа матрицей смежности.
@@ -10,24 +17,59 @@ class GraphMatrix:
     - Добавление ребра: O(1)
     - Удаление ребра: O(1)
     - Проверка ребра: O(1)
-    - Получение соседей: O(V)
+    - Получение соседей: O(V), в режиме 'bits' без цикла на Python
     - Память: O(V²)
+    
+    Режимы хранения (storage):
+    - 'lists': список списков bool/float
+    - 'numpy': только для взвешенного графа, плотный массив float64
+      V×V с inf на месте отсутствующих рёбер (требует NumPy)
+    - 'bits': только для невзвешенного графа, строка - bytearray
+      из ceil(V / 8) байт, V²/8 байт на весь граф; соседи ищутся
+      разворачиванием строки в маску и compress на уровне C
     """
     
-    def __init__(self, vertices: int, directed: bool = False, weighted: bool = False):
+    def __init__(self, vertices: int, directed: bool = False, weighted: bool = False,
+                 storage: str = 'lists'):
+        if storage not in ('lists', 'bits', 'numpy'):
+            raise ValueError(f"Неизвестный режим хранения: {storage}")
+        if storage == 'bits' and weighted:
+            raise ValueError("Режим 'bits' поддерживает только невзвешенные графы")
+        if storage == 'numpy' and not weighted:
+            raise ValueError("Режим 'numpy' поддерживает только взвешенные графы")
+        
         self.vertex_count = vertices
         self.is_directed = directed
         self.is_weighted = weighted
+        self.storage = storage
         
-        if weighted:
+        if storage == 'numpy':
+            import numpy as np
+            self.matrix = np.full((vertices, vertices), np.inf, dtype=np.float64)
+            np.fill_diagonal(self.matrix, 0.0)
+        elif weighted:
             self.matrix = [[float('inf') for _ in range(vertices)] for _ in range(vertices)]
             for i in range(vertices):
                 self.matrix[i][i] = 0
+        elif storage == 'bits':
+            row_bytes = (vertices + 7) // 8
+            self.matrix = [bytearray(row_bytes) for _ in range(vertices)]
         else:
             self.matrix = [[False for _ in range(vertices)] for _ in range(vertices)]
         
         self.edge_counter = 0
     
+    def _set_bit(self, u: int, v: int, value: bool) -> None:
+        """Установить или сбросить бит (u, v) упакованной матрицы."""
+        if value:
+            self.matrix[u][v >> 3] |= 1 << (v & 7)
+        else:
+            self.matrix[u][v >> 3] &= ~(1 << (v & 7)) & 0xFF
+    
+    def _get_bit(self, u: int, v: int) -> bool:
+        """Прочитать бит (u, v) упакованной матрицы."""
+        return bool(self.matrix[u][v >> 3] >> (v & 7) & 1)
+    
     def add_edge(self, u: int, v: int, weight: float = 1) -> None:
         """Добавить ребро в граф."""
         if u >= self.vertex_count or v >= self.vertex_count or u < 0 or v < 0:
@@ -37,6 +79,10 @@ class GraphMatrix:
             self.matrix[u][v] = weight
             if not self.is_directed:
                 self.matrix[v][u] = weight
+        elif self.storage == 'bits':
+            self._set_bit(u, v, True)
+            if not self.is_directed:
+                self._set_bit(v, u, True)
         else:
             self.matrix[u][v] = True
             if not self.is_directed:
@@ -55,6 +101,12 @@ class GraphMatrix:
                 if not self.is_directed:
                     self.matrix[v][u] = float('inf')
                 self.edge_counter -= 1
+        elif self.storage == 'bits':
+            if self._get_bit(u, v):
+                self._set_bit(u, v, False)
+                if not self.is_directed:
+                    self._set_bit(v, u, False)
+                self.edge_counter -= 1
         else:
             if self.matrix[u][v]:
                 self.matrix[u][v] = False
@@ -68,7 +120,9 @@ class GraphMatrix:
             return False
         
         if self.is_weighted:
-            return self.matrix[u][v] != float('inf')
+            return bool(self.matrix[u][v] != float('inf'))
+        if self.storage == 'bits':
+            return self._get_bit(u, v)
         return self.matrix[u][v]
     
     def get_neighbors(self, vertex: int) -> List[int]:
@@ -76,6 +130,15 @@ class GraphMatrix:
         if vertex >= self.vertex_count or vertex < 0:
             raise ValueError(f"Вершина должна быть в диапазоне [0, {self.vertex_count-1}]")
         
+        if self.storage == 'bits':
+            mask = b''.join(map(_BYTE_BITS.__getitem__, self.matrix[vertex]))
+            return list(compress(range(self.vertex_count), mask))
+        
+        if self.storage == 'numpy':
+            row = self.matrix[vertex] != float('inf')
+            row[vertex] = False
+            return row.nonzero()[0].tolist()
+        
         neighbors = []
         for i in range(self.vertex_count):
             if self.is_weighted:
@@ -89,11 +152,20 @@ class GraphMatrix:
     def get_weight(self, u: int, v: int) -> float:
         """Получить вес ребра."""
         if self.is_weighted:
-            return self.matrix[u][v]
+            return float(self.matrix[u][v])
         return 1 if self.has_edge(u, v) else float('inf')
     
+    def neighbors_with_weights(self, vertex: int) -> Iterator[Tuple[int, float]]:
+        """Перебрать пары (сосед, вес) за один проход по строке."""
+        for nb in self.get_neighbors(vertex):
+            yield nb, self.get_weight(vertex, nb)
+    
     def get_memory_usage(self) -> int:
         """Получить приблизительное потребление памяти в байтах."""
+        if self.storage == 'bits':
+            return sys.getsizeof(self.matrix) + sum(sys.getsizeof(row) for row in self.matrix)
+        if self.storage == 'numpy':
+            return sys.getsizeof(self.matrix)
         element_size = sys.getsizeof(True) if not self.is_weighted else sys.getsizeof(1.0)
         return sys.getsizeof(self.matrix) + self.vertex_count**2 * element_size
 
@@ -105,24 +177,33 @@ class GraphList:
     Сложность операций:
     - Добавление ребра: O(1)
     - Удаление ребра: O(E) в худшем случае
-    - Проверка ребра: O(degree(v))
+    - Проверка ребра: O(degree(v)), O(1) с индексом
+    - Получение веса: O(degree(v)), O(1) с индексом
     - Получение соседей: O(degree(v))
     - Память: O(V + E)
+    
+    При indexed=True дополнительно хранится словарь {v: вес}
+    для каждой вершины (вес первого из кратных рёбер).
     """
     
-    def __init__(self, vertices: int, directed: bool = False, weighted: bool = False):
+    def __init__(self, vertices: int, directed: bool = False, weighted: bool = False,
+                 indexed: bool = False):
         self.vertex_count = vertices
         self.is_directed = directed
         self.is_weighted = weighted
+        self.is_indexed = indexed
         
         self.adj_list: Dict[int, List] = defaultdict(list)
+        self.weight_index: Dict[int, Dict[int, float]] = {}
         self.edge_counter = 0
+        self._reversed = None
     
     def add_edge(self, u: int, v: int, weight: float = 1) -> None:
         """Добавить ребро в граф."""
         if u >= self.vertex_count or v >= self.vertex_count or u < 0 or v < 0:
             raise ValueError(f"Вершины должны быть в диапазоне [0, {self.vertex_count-1}]")
         
+        self._reversed = None
         if self.is_weighted:
             self.adj_list[u].append((v, weight))
             if not self.is_directed:
@@ -132,6 +213,12 @@ class GraphList:
             if not self.is_directed:
                 self.adj_list[v].append(u)
         
+        if self.is_indexed:
+            w = weight if self.is_weighted else 1
+            self.weight_index.setdefault(u, {}).setdefault(v, w)
+            if not self.is_directed:
+                self.weight_index.setdefault(v, {}).setdefault(u, w)
+        
         self.edge_counter += 1
     
     def remove_edge(self, u: int, v: int) -> None:
@@ -139,6 +226,7 @@ class GraphList:
         if u >= self.vertex_count or v >= self.vertex_count or u < 0 or v < 0:
             raise ValueError(f"Вершины должны быть в диапазоне [0, {self.vertex_count-1}]")
         
+        self._reversed = None
         if self.is_weighted:
             before = len(self.adj_list[u])
             self.adj_list[u] = [(nb, w) for nb, w in self.adj_list[u] if nb != v]
@@ -150,6 +238,11 @@ class GraphList:
             if not self.is_directed:
                 self.adj_list[v] = [nb for nb in self.adj_list[v] if nb != u]
         
+        if self.is_indexed:
+            self.weight_index.get(u, {}).pop(v, None)
+            if not self.is_directed:
+                self.weight_index.get(v, {}).pop(u, None)
+        
         if len(self.adj_list[u]) < before:
             self.edge_counter -= 1
     
@@ -158,6 +251,8 @@ class GraphList:
         if u >= self.vertex_count or v >= self.vertex_count or u < 0 or v < 0:
             return False
         
+        if self.is_indexed:
+            return v in self.weight_index.get(u, {})
         if self.is_weighted:
             return any(nb == v for nb, _ in self.adj_list[u])
         return v in self.adj_list[u]
@@ -171,8 +266,45 @@ class GraphList:
             return [nb for nb, _ in self.adj_list[vertex]]
         return self.adj_list[vertex].copy()
     
+    def neighbors_with_weights(self, vertex: int) -> Iterator[Tuple[int, float]]:
+        """
+        Перебрать пары (сосед, вес) без повторного поиска веса.
+        
+        Сложность: O(degree(v)) на весь перебор
+        """
+        if vertex >= self.vertex_count or vertex < 0:
+            raise ValueError(f"Вершина должна быть в диапазоне [0, {self.vertex_count-1}]")
+        
+        if self.is_weighted:
+            return iter(self.adj_list[vertex])
+        return ((nb, 1) for nb in self.adj_list[vertex])
+    
+    def reversed_graph(self):
+        """
+        Граф с обращёнными рёбрами (CSR) для обратного поиска.
+        
+        Строится за O(V + E) при первом вызове и кэшируется до следующего
+        add_edge/remove_edge. Для неориентированного графа - сам граф.
+        """
+        if not self.is_directed:
+            return self
+        if self._reversed is None:
+            arcs = []
+            for u, neighbors in self.adj_list.items():
+                if self.is_weighted:
+                    arcs.extend((v, u, w) for v, w in neighbors)
+                else:
+                    arcs.extend((v, u, 1) for v in neighbors)
+            self._reversed = GraphCSR._build(self.vertex_count, arcs, True,
+                                             self.is_weighted, self.edge_counter)
+        return self._reversed
+    
     def get_weight(self, u: int, v: int) -> float:
         """Получить вес ребра."""
+        if self.is_indexed:
+            if u >= self.vertex_count or u < 0:
+                return float('inf')
+            return self.weight_index.get(u, {}).get(v, float('inf'))
         if self.is_weighted:
             for nb, w in self.adj_list[u]:
                 if nb == v:
@@ -190,4 +322,159 @@ class GraphList:
                     total += sys.getsizeof(nb)
                 else:
                     total += sys.getsizeof(nb)
-        return total
\ No newline at end of file
+        if self.is_indexed:
+            total += sys.getsizeof(self.weight_index)
+            for index in self.weight_index.values():
+                total += sys.getsizeof(index)
+        return total
+
+
+class GraphCSR:
+    """
+    Неизменяемое представление графа в формате CSR (compressed sparse row).
+    
+    Соседи вершины v лежат в targets[offsets[v]:offsets[v + 1]]
+    и отсортированы по номеру, веса - в параллельном массиве weights.
+    Все массивы - компактные array из стандартной библиотеки.
+    
+    Сложность операций:
+    - Построение: O(V + E log E)
+    - Проверка ребра: O(log degree(v))
+    - Получение соседей: O(degree(v))
+    - Память: O(V + E), 8 байт на вершину и 8-16 байт на ребро
+    """
+    
+    def __init__(self, vertices: int, offsets: array, targets: array,
+                 weights: array = None, directed: bool = False, edge_count: int = 0):
+        self.vertex_count = vertices
+        self.is_directed = directed
+        self.is_weighted = weights is not None
+        
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.edge_counter = edge_count
+        self._reversed = None
+    
+    @classmethod
+    def from_edges(cls, vertices: int, edges: Iterable[Tuple],
+                   directed: bool = False, weighted: bool = False) -> 'GraphCSR':
+        """
+        Построить граф из списка рёбер (u, v) или (u, v, weight).
+        
+        Для неориентированного графа каждое ребро хранится в обе стороны.
+        """
+        arcs = []
+        edge_count = 0
+        
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            w = edge[2] if len(edge) > 2 else 1
+            if u >= vertices or v >= vertices or u < 0 or v < 0:
+                raise ValueError(f"Вершины должны быть в диапазоне [0, {vertices-1}]")
+            
+            arcs.append((u, v, w))
+            if not directed:
+                arcs.append((v, u, w))
+            edge_count += 1
+        
+        return cls._build(vertices, arcs, directed, weighted, edge_count)
+    
+    @classmethod
+    def from_graph_list(cls, graph: 'GraphList') -> 'GraphCSR':
+        """Заморозить GraphList в CSR-представление."""
+        arcs = []
+        
+        for u, neighbors in graph.adj_list.items():
+            if graph.is_weighted:
+                arcs.extend((u, v, w) for v, w in neighbors)
+            else:
+                arcs.extend((u, v, 1) for v in neighbors)
+        
+        return cls._build(graph.vertex_count, arcs, graph.is_directed,
+                          graph.is_weighted, graph.edge_counter)
+    
+    @classmethod
+    def _build(cls, vertices: int, arcs: List[Tuple], directed: bool,
+               weighted: bool, edge_count: int) -> 'GraphCSR':
+        """Разложить дуги по строкам CSR."""
+        # Сортировка устойчивая: у кратных рёбер сохраняется порядок добавления
+        arcs.sort(key=lambda arc: (arc[0], arc[1]))
+        
+        offsets = array('q', [0]) * (vertices + 1)
+        for u, _, _ in arcs:
+            offsets[u + 1] += 1
+        for v in range(vertices):
+            offsets[v + 1] += offsets[v]
+        
+        targets = array('q', (v for _, v, _ in arcs))
+        weights = array('d', (w for _, _, w in arcs)) if weighted else None
+        
+        return cls(vertices, offsets, targets, weights, directed, edge_count)
+    
+    def _find(self, u: int, v: int) -> int:
+        """Индекс дуги u -> v в targets или -1."""
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        i = bisect_left(self.targets, v, lo, hi)
+        if i < hi and self.targets[i] == v:
+            return i
+        return -1
+    
+    def has_edge(self, u: int, v: int) -> bool:
+        """Проверить наличие ребра."""
+        if u >= self.vertex_count or v >= self.vertex_count or u < 0 or v < 0:
+            return False
+        return self._find(u, v) != -1
+    
+    def get_neighbors(self, vertex: int) -> List[int]:
+        """Получить всех соседей вершины."""
+        if vertex >= self.vertex_count or vertex < 0:
+            raise ValueError(f"Вершина должна быть в диапазоне [0, {self.vertex_count-1}]")
+        
+        return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]].tolist()
+    
+    def get_weight(self, u: int, v: int) -> float:
+        """Получить вес ребра."""
+        if u >= self.vertex_count or v >= self.vertex_count or u < 0 or v < 0:
+            return float('inf')
+        
+        i = self._find(u, v)
+        if i == -1:
+            return float('inf')
+        return self.weights[i] if self.is_weighted else 1
+    
+    def neighbors_with_weights(self, vertex: int) -> Iterator[Tuple[int, float]]:
+        """Перебрать пары (сосед, вес) по срезу строки CSR."""
+        if vertex >= self.vertex_count or vertex < 0:
+            raise ValueError(f"Вершина должна быть в диапазоне [0, {self.vertex_count-1}]")
+        
+        lo, hi = self.offsets[vertex], self.offsets[vertex + 1]
+        if self.is_weighted:
+            return zip(self.targets[lo:hi], self.weights[lo:hi])
+        return ((nb, 1) for nb in self.targets[lo:hi])
+    
+    def reversed_graph(self) -> 'GraphCSR':
+        """
+        Транспонированный граф для обратного поиска.
+        
+        Строится за O(V + E) один раз: граф неизменяемый. Для
+        неориентированного графа - сам граф.
+        """
+        if not self.is_directed:
+            return self
+        if self._reversed is None:
+            arcs = []
+            for u in range(self.vertex_count):
+                lo, hi = self.offsets[u], self.offsets[u + 1]
+                for i in range(lo, hi):
+                    arcs.append((self.targets[i], u, self.weights[i] if self.is_weighted else 1))
+            self._reversed = GraphCSR._build(self.vertex_count, arcs, True,
+                                             self.is_weighted, self.edge_counter)
+        return self._reversed
+    
+    def get_memory_usage(self) -> int:
+        """Получить приблизительное потребление памяти в байтах."""
+        total = sys.getsizeof(self.offsets) + sys.getsizeof(self.targets)
+        if self.weights is not None:
+            total += sys.getsizeof(self.weights)
+        return total
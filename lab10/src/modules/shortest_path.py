@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from collections import deque
 import heapq
 from modules.graph_representation import GraphList
@@ -7,22 +7,58 @@ class PathFinder:
     """Класс для алгоритмов поиска кратчайших путей."""
     
     @staticmethod
-    def dijkstra(graph: GraphList, start: int) -> Tuple[Dict[int, float], Dict[int, Optional[int]]]:
+    def dijkstra(graph: GraphList, start: int, target: Optional[int] = None,
+                 heap_factory: Optional[Callable] = None) -> Tuple[Dict[int, float], Dict[int, Optional[int]]]:
         """
         Алгоритм Дейкстры для поиска кратчайших путей.
         
         Сложность: O((V + E) log V)
         Память: O(V)
         
+        Веса берутся из neighbors_with_weights, поэтому релаксация
+        вершины стоит O(degree(v)), а не O(degree(v)²).
+        
+        Если задан target, поиск останавливается, как только target
+        зафиксирован; расстояния до незафиксированных вершин остаются
+        верхними оценками.
+        
+        heap_factory - фабрика индексированной кучи с методами push(key, priority),
+        pop() -> (priority, key), decrease_key и проверкой `in` (например,
+        IndexedHeap из lab7). С ней каждая вершина лежит в очереди не более
+        одного раза, и очередь не разрастается до O(E) записей.
+        
         Предусловия:
         - Все веса ребер должны быть неотрицательные
         - Граф должен быть взвешенным
         """
+        if heap_factory is not None:
+            distances, parents, _, _ = PathFinder._dijkstra_indexed(graph, start, target, heap_factory)
+        else:
+            distances, parents, _, _ = PathFinder._dijkstra(graph, start, target)
+        return distances, parents
+    
+    @staticmethod
+    def dijkstra_queue_peak(graph: GraphList, start: int, heap_factory: Optional[Callable] = None) -> int:
+        """
+        Наибольшая длина очереди за проход Дейкстры из start.
+        
+        С heapq очередь хранит устаревшие записи и может дорасти до O(E),
+        с индексированной кучей она не превышает V.
+        """
+        if heap_factory is not None:
+            return PathFinder._dijkstra_indexed(graph, start, None, heap_factory)[3]
+        return PathFinder._dijkstra(graph, start, None)[3]
+    
+    @staticmethod
+    def _dijkstra(graph: GraphList, start: int,
+                  target: Optional[int]) -> Tuple[Dict[int, float], Dict[int, Optional[int]], int, int]:
+        """Дейкстра с подсчётом зафиксированных вершин и наибольшей длины очереди."""
         distances = {i: float('inf') for i in range(graph.vertex_count)}
         distances[start] = 0
         parents = {start: None}
         
         pq = [(0, start)]
+        peak = 1
         visited = set()
         
         while pq:
@@ -33,12 +69,13 @@ class PathFinder:
             
             visited.add(v)
             
+            if v == target:
+                break
+            
             if cur_dist > distances[v]:
                 continue
             
-            for nb in graph.get_neighbors(v):
-                w = graph.get_weight(v, nb)
-                
+            for nb, w in graph.neighbors_with_weights(v):
                 if w != float('inf'):
                     new_dist = distances[v] + w
                     
@@ -46,20 +83,51 @@ class PathFinder:
                         distances[nb] = new_dist
                         parents[nb] = v
                         heapq.heappush(pq, (new_dist, nb))
+                        if len(pq) > peak:
+                            peak = len(pq)
         
-        return distances, parents
+        return distances, parents, len(visited), peak
     
     @staticmethod
-    def dijkstra_shortest_path(graph: GraphList, start: int, end: int) -> Optional[List[int]]:
-        """Найти кратчайший путь между двумя вершинами используя Дейкстру."""
-        if start == end:
-            return [start]
+    def _dijkstra_indexed(graph: GraphList, start: int, target: Optional[int],
+                          heap_factory: Callable) -> Tuple[Dict[int, float], Dict[int, Optional[int]], int, int]:
+        """Дейкстра на индексированной куче с decrease_key; возвращает также наибольшую длину очереди."""
+        distances = {i: float('inf') for i in range(graph.vertex_count)}
+        distances[start] = 0
+        parents = {start: None}
         
-        distances, parents = PathFinder.dijkstra(graph, start)
+        pq = heap_factory()
+        pq.push(start, 0)
+        peak = 1
+        visited = set()
         
-        if distances[end] == float('inf'):
-            return None
+        while pq:
+            _, v = pq.pop()
+            visited.add(v)
+            
+            if v == target:
+                break
+            
+            for nb, w in graph.neighbors_with_weights(v):
+                if nb in visited or w == float('inf'):
+                    continue
+                
+                new_dist = distances[v] + w
+                if new_dist < distances[nb]:
+                    distances[nb] = new_dist
+                    parents[nb] = v
+                    if nb in pq:
+                        pq.decrease_key(nb, new_dist)
+                    else:
+                        pq.push(nb, new_dist)
+                        if len(pq) > peak:
+                            peak = len(pq)
         
+        return distances, parents, len(visited), peak
+    
+    @staticmethod
+    def _build_path(parents: Dict[int, Optional[int]], end: int) -> List[int]:
+        """Восстановить путь от корня дерева parents до end."""
         path = []
         cur = end
         while cur is not None:
@@ -68,11 +136,216 @@ class PathFinder:
         
         return path[::-1]
     
+    @staticmethod
+    def dijkstra_shortest_path(graph: GraphList, start: int, end: int) -> Optional[List[int]]:
+        """Найти кратчайший путь между двумя вершинами используя Дейкстру."""
+        path, _, _ = PathFinder.dijkstra_search(graph, start, end)
+        return path
+    
+    @staticmethod
+    def dijkstra_search(graph: GraphList, start: int,
+                        end: int) -> Tuple[Optional[List[int]], float, int]:
+        """
+        Дейкстра от точки до точки с ранней остановкой.
+        
+        Возвращает (путь, длина пути, число зафиксированных вершин).
+        """
+        if start == end:
+            return [start], 0, 1
+        
+        distances, parents, settled, _ = PathFinder._dijkstra(graph, start, end)
+        
+        if distances[end] == float('inf'):
+            return None, float('inf'), settled
+        
+        return PathFinder._build_path(parents, end), distances[end], settled
+    
+    @staticmethod
+    def bidirectional_dijkstra(graph: GraphList, start: int,
+                               end: int) -> Tuple[Optional[List[int]], float, int]:
+        """
+        Двунаправленный алгоритм Дейкстры.
+        
+        Поиск ведётся одновременно от start по рёбрам и от end по
+        обратным рёбрам; на каждом шаге расширяется фронт с меньшей
+        очередью, так что поиск из «тесного» конца (угол лабиринта)
+        не отстаёт от поиска из открытого. Остановка - когда сумма
+        ключей фронтов не меньше лучшего найденного пути.
+        
+        Сложность: O((V + E) log V), на практике фронты покрывают
+        заметно меньше вершин, чем один поиск.
+        
+        Обратные рёбра ориентированного графа берутся из
+        graph.reversed_graph(): он строится при первом запросе и
+        переиспользуется последующими, пока граф не изменится.
+        
+        Возвращает (путь, длина пути, число зафиксированных вершин).
+        """
+        if start == end:
+            return [start], 0, 1
+        
+        dist = ({start: 0}, {end: 0})
+        parents = ({start: None}, {end: None})
+        settled = (set(), set())
+        queues = ([(0, start)], [(0, end)])
+        edges = (graph.neighbors_with_weights, graph.reversed_graph().neighbors_with_weights)
+        
+        best = float('inf')
+        meeting = None
+        
+        while queues[0] and queues[1]:
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+            
+            side = 0 if len(queues[0]) <= len(queues[1]) else 1
+            cur_dist, v = heapq.heappop(queues[side])
+            
+            if v in settled[side]:
+                continue
+            settled[side].add(v)
+            
+            other = 1 - side
+            for nb, w in edges[side](v):
+                new_dist = cur_dist + w
+                
+                if new_dist < dist[side].get(nb, float('inf')):
+                    dist[side][nb] = new_dist
+                    parents[side][nb] = v
+                    heapq.heappush(queues[side], (new_dist, nb))
+                
+                if nb in dist[other]:
+                    total = dist[side][nb] + dist[other][nb]
+                    if total < best:
+                        best = total
+                        meeting = nb
+        
+        settled_count = len(settled[0]) + len(settled[1])
+        if meeting is None:
+            return None, float('inf'), settled_count
+        
+        path = PathFinder._build_path(parents[0], meeting)
+        cur = parents[1][meeting]
+        while cur is not None:
+            path.append(cur)
+            cur = parents[1][cur]
+        
+        return path, best, settled_count
+    
+    @staticmethod
+    def a_star(graph: GraphList, start: int, end: int,
+               heuristic: Callable[[int, int], float]) -> Tuple[Optional[List[int]], float, int]:
+        """
+        Поиск A* с подключаемой эвристикой.
+        
+        heuristic(v, end) должна быть допустимой и согласованной
+        (не переоценивать оставшееся расстояние), иначе путь может
+        оказаться не кратчайшим. При heuristic = 0 совпадает
+        с Дейкстрой с ранней остановкой.
+        
+        Сложность: O((V + E) log V) в худшем случае
+        
+        Возвращает (путь, длина пути, число зафиксированных вершин).
+        """
+        dist = {start: 0}
+        parents = {start: None}
+        pq = [(heuristic(start, end), start)]
+        visited = set()
+        
+        while pq:
+            _, v = heapq.heappop(pq)
+            
+            if v in visited:
+                continue
+            visited.add(v)
+            
+            if v == end:
+                return PathFinder._build_path(parents, end), dist[end], len(visited)
+            
+            for nb, w in graph.neighbors_with_weights(v):
+                new_dist = dist[v] + w
+                
+                if new_dist < dist.get(nb, float('inf')):
+                    dist[nb] = new_dist
+                    parents[nb] = v
+                    heapq.heappush(pq, (new_dist + heuristic(nb, end), nb))
+        
+        return None, float('inf'), len(visited)
+    
+    @staticmethod
+    def manhattan_heuristic(coords: Dict[int, Tuple[int, int]]) -> Callable[[int, int], float]:
+        """
+        Манхэттенская эвристика для сеточных графов (например, из MazeSolver).
+        
+        coords - отображение вершина -> (строка, столбец).
+        Допустима, если шаг по сетке стоит не меньше 1.
+        """
+        def heuristic(v: int, target: int) -> float:
+            (r1, c1), (r2, c2) = coords[v], coords[target]
+            return abs(r1 - r2) + abs(c1 - c2)
+        
+        return heuristic
+    
     @staticmethod
     def dijkstra_all_distances(graph: GraphList, start: int) -> Dict[int, float]:
         """Получить кратчайшие расстояния от start до всех вершин."""
         distances, _ = PathFinder.dijkstra(graph, start)
         return distances
+    
+    @staticmethod
+    def floyd_warshall(graph: GraphList):
+        """
+        Алгоритм Флойда–Уоршелла для всех пар вершин (NumPy).
+        
+        Сложность: O(V³), но на каждую опорную вершину k выполняется
+        одна векторная операция над матрицей V×V вместо двух циклов.
+        Память: O(V²)
+        
+        Возвращает (dist, pred): матрицу расстояний float64 и матрицу
+        предшественников int64, где pred[i][j] - вершина перед j
+        на кратчайшем пути из i (-1, если пути нет).
+        
+        Предусловия:
+        - В графе нет циклов отрицательного веса
+        """
+        import numpy as np
+        
+        n = graph.vertex_count
+        if getattr(graph, 'storage', None) == 'numpy':
+            dist = graph.matrix.copy()
+        else:
+            dist = np.full((n, n), np.inf, dtype=np.float64)
+            for v in range(n):
+                for nb, w in graph.neighbors_with_weights(v):
+                    if w < dist[v, nb]:
+                        dist[v, nb] = w
+        np.fill_diagonal(dist, 0.0)
+        
+        pred = np.where(np.isfinite(dist), np.arange(n)[:, None], -1)
+        np.fill_diagonal(pred, -1)
+        
+        for k in range(n):
+            via = dist[:, k, None] + dist[k]
+            better = via < dist
+            np.copyto(dist, via, where=better)
+            np.copyto(pred, pred[k].copy(), where=better)
+        
+        return dist, pred
+    
+    @staticmethod
+    def floyd_warshall_path(pred, start: int, end: int) -> Optional[List[int]]:
+        """Восстановить путь по матрице предшественников Флойда–Уоршелла."""
+        if start == end:
+            return [start]
+        if pred[start][end] == -1:
+            return None
+        
+        path = [end]
+        cur = end
+        while cur != start:
+            cur = int(pred[start][cur])
+            path.append(cur)
+        
+        return path[::-1]
 
 class TopologicalSorter:
     """Класс для топологической сортировки."""
@@ -1,8 +1,14 @@
 import unittest
-from modules.graph_representation import GraphMatrix, GraphList
+import random
+import os
+import sys
+from modules.graph_representation import GraphMatrix, GraphList, GraphCSR
 from modules.graph_traversal import GraphExplorer
 from modules.shortest_path import PathFinder, TopologicalSorter
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from lab_loader import load_lab_module
+
 class TestGraphMatrix(unittest.TestCase):
     """Тесты для матричного представления графа."""
     
@@ -44,6 +50,34 @@ class TestGraphMatrix(unittest.TestCase):
         self.assertEqual(weighted_g.get_weight(0, 1), 5.0)
         self.assertEqual(weighted_g.get_weight(1, 0), 5.0)
 
+class TestGraphMatrixBits(unittest.TestCase):
+    """Тесты для битовой матрицы смежности."""
+    
+    def setUp(self):
+        self.g = GraphMatrix(20, storage='bits')
+    
+    def test_add_remove_edge(self):
+        self.g.add_edge(3, 17)
+        self.assertTrue(self.g.has_edge(3, 17))
+        self.assertTrue(self.g.has_edge(17, 3))
+        self.g.remove_edge(3, 17)
+        self.assertFalse(self.g.has_edge(3, 17))
+        self.assertEqual(self.g.edge_counter, 0)
+    
+    def test_get_neighbors_across_bytes(self):
+        for v in (0, 7, 8, 15, 19):
+            self.g.add_edge(5, v)
+        self.assertEqual(self.g.get_neighbors(5), [0, 7, 8, 15, 19])
+    
+    def test_memory_is_packed(self):
+        lists = GraphMatrix(200)
+        bits = GraphMatrix(200, storage='bits')
+        self.assertLess(bits.get_memory_usage() * 10, lists.get_memory_usage())
+    
+    def test_weighted_bits_rejected(self):
+        with self.assertRaises(ValueError):
+            GraphMatrix(3, weighted=True, storage='bits')
+
 class TestGraphList(unittest.TestCase):
     """Тесты для списочного представления графа."""
     
@@ -85,6 +119,83 @@ class TestGraphList(unittest.TestCase):
         self.assertEqual(weighted_g.get_weight(0, 1), 5.0)
         self.assertEqual(weighted_g.get_weight(1, 0), 5.0)
 
+class TestGraphListIndex(unittest.TestCase):
+    """Тесты для индекса весов GraphList."""
+    
+    def setUp(self):
+        self.g = GraphList(4, weighted=True, indexed=True)
+        self.g.add_edge(0, 1, 2.5)
+        self.g.add_edge(0, 2, 7.0)
+        self.g.add_edge(0, 1, 9.0)
+    
+    def test_get_weight_first_parallel_edge(self):
+        self.assertEqual(self.g.get_weight(0, 1), 2.5)
+        self.assertEqual(self.g.get_weight(2, 0), 7.0)
+        self.assertEqual(self.g.get_weight(0, 3), float('inf'))
+    
+    def test_remove_edge_updates_index(self):
+        self.g.remove_edge(0, 1)
+        self.assertFalse(self.g.has_edge(0, 1))
+        self.assertFalse(self.g.has_edge(1, 0))
+        self.assertEqual(self.g.get_weight(0, 1), float('inf'))
+    
+    def test_reads_do_not_grow_index(self):
+        self.assertFalse(self.g.has_edge(3, 0))
+        self.assertEqual(self.g.get_weight(3, 0), float('inf'))
+        self.g.remove_edge(3, 0)
+        self.assertNotIn(3, self.g.weight_index)
+    
+    def test_neighbors_with_weights(self):
+        self.assertEqual(list(self.g.neighbors_with_weights(0)), [(1, 2.5), (2, 7.0), (1, 9.0)])
+        unweighted = GraphList(3)
+        unweighted.add_edge(0, 2)
+        self.assertEqual(list(unweighted.neighbors_with_weights(0)), [(2, 1)])
+
+class TestGraphCSR(unittest.TestCase):
+    """Тесты для CSR-представления графа."""
+    
+    def setUp(self):
+        self.lst = GraphList(5, weighted=True)
+        self.lst.add_edge(0, 2, 1)
+        self.lst.add_edge(0, 1, 4)
+        self.lst.add_edge(2, 1, 2)
+        self.lst.add_edge(1, 3, 1)
+        self.lst.add_edge(3, 4, 3)
+        self.g = GraphCSR.from_graph_list(self.lst)
+    
+    def test_from_graph_list(self):
+        self.assertTrue(self.g.has_edge(0, 1))
+        self.assertTrue(self.g.has_edge(1, 0))
+        self.assertFalse(self.g.has_edge(0, 4))
+        self.assertEqual(self.g.edge_counter, 5)
+    
+    def test_get_neighbors_sorted(self):
+        self.assertEqual(self.g.get_neighbors(0), [1, 2])
+        self.assertEqual(self.g.get_neighbors(1), [0, 2, 3])
+    
+    def test_get_weight(self):
+        self.assertEqual(self.g.get_weight(0, 1), 4.0)
+        self.assertEqual(self.g.get_weight(1, 2), 2.0)
+        self.assertEqual(self.g.get_weight(0, 4), float('inf'))
+    
+    def test_from_edges_directed(self):
+        g = GraphCSR.from_edges(3, [(0, 1), (1, 2)], directed=True)
+        self.assertTrue(g.has_edge(0, 1))
+        self.assertFalse(g.has_edge(1, 0))
+        self.assertEqual(g.get_weight(1, 2), 1)
+    
+    def test_invalid_vertex(self):
+        with self.assertRaises(ValueError):
+            GraphCSR.from_edges(2, [(0, 5)])
+    
+    def test_algorithms_match_graph_list(self):
+        self.assertEqual(PathFinder.dijkstra(self.g, 0)[0], PathFinder.dijkstra(self.lst, 0)[0])
+        self.assertEqual(GraphExplorer.bfs(self.g, 0)[0], GraphExplorer.bfs(self.lst, 0)[0])
+    
+    def test_topological_sort(self):
+        dag = GraphCSR.from_edges(4, [(0, 1), (0, 2), (1, 3), (2, 3)], directed=True)
+        self.assertEqual(TopologicalSorter.topological_sort_kahn(dag)[0], 0)
+
 class TestBFS(unittest.TestCase):
     """Тесты для алгоритма BFS."""
     
@@ -206,6 +317,151 @@ class TestDijkstra(unittest.TestCase):
         distances, _ = PathFinder.dijkstra(disconnected, 0)
         self.assertEqual(distances[2], float('inf'))
 
+class TestPointToPoint(unittest.TestCase):
+    """Тесты для поиска пути от точки до точки."""
+    
+    def setUp(self):
+        random.seed(3)
+        self.graphs = []
+        for directed in (False, True):
+            g = GraphList(40, directed=directed, weighted=True)
+            for _ in range(120):
+                u, v = random.randrange(40), random.randrange(40)
+                if u != v and not g.has_edge(u, v):
+                    g.add_edge(u, v, random.randint(1, 9))
+            self.graphs.append(g)
+    
+    def check_search(self, search):
+        for g in self.graphs:
+            for end in range(40):
+                expected = PathFinder.dijkstra_all_distances(g, 0)[end]
+                path, length, settled = search(g, 0, end)
+                self.assertEqual(length, expected)
+                self.assertGreaterEqual(settled, 1)
+                if path is None:
+                    self.assertEqual(expected, float('inf'))
+                else:
+                    self.assertEqual((path[0], path[-1]), (0, end))
+                    self.assertEqual(sum(g.get_weight(a, b) for a, b in zip(path, path[1:])), length)
+    
+    def test_dijkstra_early_stop(self):
+        self.check_search(PathFinder.dijkstra_search)
+    
+    def test_bidirectional(self):
+        self.check_search(PathFinder.bidirectional_dijkstra)
+        self.check_search(lambda g, s, t: PathFinder.bidirectional_dijkstra(GraphCSR.from_graph_list(g), s, t))
+    
+    def test_reversed_graph_cached(self):
+        directed = self.graphs[1]
+        reverse = directed.reversed_graph()
+        self.assertIs(directed.reversed_graph(), reverse)
+        for u in range(40):
+            for v, w in directed.neighbors_with_weights(u):
+                self.assertEqual(reverse.get_weight(v, u), w)
+        directed.add_edge(0, 39, 1)
+        self.assertIsNot(directed.reversed_graph(), reverse)
+        self.assertTrue(directed.reversed_graph().has_edge(39, 0))
+        self.assertIs(self.graphs[0].reversed_graph(), self.graphs[0])
+    
+    def test_a_star_zero_heuristic(self):
+        self.check_search(lambda g, s, t: PathFinder.a_star(g, s, t, lambda v, target: 0))
+    
+    def test_a_star_manhattan_settles_less(self):
+        side = 15
+        coords = {r * side + c: (r, c) for r in range(side) for c in range(side)}
+        grid = GraphList(side * side)
+        for r in range(side):
+            for c in range(side):
+                if c + 1 < side:
+                    grid.add_edge(r * side + c, r * side + c + 1)
+                if r + 1 < side:
+                    grid.add_edge(r * side + c, (r + 1) * side + c)
+        
+        heuristic = PathFinder.manhattan_heuristic(coords)
+        path, length, settled = PathFinder.a_star(grid, 0, side - 1, heuristic)
+        _, _, full = PathFinder.dijkstra_search(grid, 0, side - 1)
+        self.assertEqual(length, side - 1)
+        self.assertEqual(len(path), side)
+        self.assertLess(settled, full)
+
+class TestFloydWarshall(unittest.TestCase):
+    """Тесты для алгоритма Флойда–Уоршелла."""
+    
+    def setUp(self):
+        self.edges = [(0, 1, 4), (0, 2, 1), (2, 1, 2), (1, 3, 1), (2, 3, 5), (3, 4, 3)]
+        self.lst = GraphList(6, weighted=True)
+        self.mat = GraphMatrix(6, weighted=True, storage='numpy')
+        for u, v, w in self.edges:
+            self.lst.add_edge(u, v, w)
+            self.mat.add_edge(u, v, w)
+    
+    def test_numpy_storage(self):
+        self.assertTrue(self.mat.has_edge(0, 2))
+        self.assertFalse(self.mat.has_edge(0, 4))
+        self.assertEqual(self.mat.get_weight(2, 1), 2.0)
+        self.assertEqual(self.mat.get_neighbors(1), [0, 2, 3])
+    
+    def test_matches_dijkstra(self):
+        for graph in (self.lst, self.mat):
+            dist, _ = PathFinder.floyd_warshall(graph)
+            for s in range(6):
+                expected = PathFinder.dijkstra_all_distances(self.lst, s)
+                for t in range(6):
+                    self.assertEqual(dist[s][t], expected[t])
+    
+    def test_path_reconstruction(self):
+        _, pred = PathFinder.floyd_warshall(self.mat)
+        self.assertEqual(PathFinder.floyd_warshall_path(pred, 0, 4), [0, 2, 1, 3, 4])
+        self.assertEqual(PathFinder.floyd_warshall_path(pred, 4, 4), [4])
+        self.assertIsNone(PathFinder.floyd_warshall_path(pred, 0, 5))
+    
+    def test_random_directed(self):
+        random.seed(7)
+        g = GraphList(30, directed=True, weighted=True)
+        for _ in range(150):
+            u, v = random.randrange(30), random.randrange(30)
+            if u != v and not g.has_edge(u, v):
+                g.add_edge(u, v, random.randint(1, 20))
+        dist, pred = PathFinder.floyd_warshall(g)
+        expected = PathFinder.dijkstra_all_distances(g, 0)
+        for t in range(30):
+            self.assertEqual(dist[0][t], expected[t])
+            path = PathFinder.floyd_warshall_path(pred, 0, t)
+            if path is not None:
+                self.assertEqual(sum(g.get_weight(a, b) for a, b in zip(path, path[1:])), dist[0][t])
+
+class TestDijkstraIndexedHeap(unittest.TestCase):
+    """Тесты для Дейкстры на индексированной куче."""
+    
+    def test_matches_heapq_version(self):
+        IndexedHeap = load_lab_module('lab7', 'heap').IndexedHeap
+        random.seed(11)
+        g = GraphList(60, weighted=True)
+        for _ in range(400):
+            u, v = random.randrange(60), random.randrange(60)
+            if u != v:
+                g.add_edge(u, v, random.randint(1, 50))
+        
+        expected, _ = PathFinder.dijkstra(g, 0)
+        for arity in (2, 4):
+            distances, _ = PathFinder.dijkstra(g, 0, heap_factory=lambda: IndexedHeap(arity))
+            self.assertEqual(distances, expected)
+    
+    def test_queue_peak(self):
+        IndexedHeap = load_lab_module('lab7', 'heap').IndexedHeap
+        # Полный граф, где каждая новая вершина улучшает оценки всех оставшихся:
+        # heapq копит устаревшие записи, индексированная куча — нет
+        n = 30
+        g = GraphList(n, directed=True, weighted=True)
+        for u in range(n):
+            for v in range(u + 1, n):
+                g.add_edge(u, v, 2 * (v - u) * n - u)
+        
+        heapq_peak = PathFinder.dijkstra_queue_peak(g, 0)
+        indexed_peak = PathFinder.dijkstra_queue_peak(g, 0, heap_factory=IndexedHeap)
+        self.assertLessEqual(indexed_peak, n - 1)
+        self.assertGreater(heapq_peak, indexed_peak)
+
 class TestTopologicalSort(unittest.TestCase):
     """Тесты для топологической сортировки."""
     
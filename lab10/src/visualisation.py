@@ -104,6 +104,61 @@ class GraphPlotter:
         plt.savefig('memory_comparison.png', dpi=150)
         print("✓ График сохранён: memory_comparison.png")
     
+    @staticmethod
+    def plot_all_pairs_crossover():
+        """Сравнить Флойда–Уоршелла (NumPy) и V запусков Дейкстры."""
+        from modules.graph_representation import GraphMatrix
+        
+        sizes = list(range(20, 261, 40))
+        densities = [0.05, 0.5]
+        fw_times = {d: [] for d in densities}
+        dijkstra_times = {d: [] for d in densities}
+        
+        print("Сбор данных для графика всех пар вершин...")
+        
+        for density in densities:
+            for sz in sizes:
+                mat_g = GraphMatrix(sz, weighted=True, storage='numpy')
+                lst_g = GraphList(sz, weighted=True, indexed=True)
+                
+                for i in range(sz):
+                    for j in range(i + 1, sz):
+                        if random.random() < density:
+                            w = random.uniform(1, 10)
+                            mat_g.add_edge(i, j, w)
+                            lst_g.add_edge(i, j, w)
+                
+                start = time.perf_counter()
+                PathFinder.floyd_warshall(mat_g)
+                fw_times[density].append((time.perf_counter() - start) * 1000)
+                
+                start = time.perf_counter()
+                for v in range(sz):
+                    PathFinder.dijkstra_all_distances(lst_g, v)
+                dijkstra_times[density].append((time.perf_counter() - start) * 1000)
+        
+        plt.figure(figsize=(12, 6))
+        
+        for density, style in zip(densities, ['-', '--']):
+            label = f"{int(density * 100)}% рёбер"
+            plt.plot(sizes, fw_times[density], 'b' + style + 'o',
+                     label=f'Флойд–Уоршелл NumPy, {label}', linewidth=2, markersize=6)
+            plt.plot(sizes, dijkstra_times[density], 'r' + style + 's',
+                     label=f'V × Dijkstra, {label}', linewidth=2, markersize=6)
+        
+        plt.xlabel('Количество вершин', fontsize=12)
+        plt.ylabel('Время (мс)', fontsize=12)
+        plt.title('Кратчайшие пути между всеми парами вершин', fontsize=14, fontweight='bold')
+        plt.yscale('log')
+        plt.legend(fontsize=11)
+        plt.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        plt.savefig('all_pairs_comparison.png', dpi=150)
+        print("✓ График сохранён: all_pairs_comparison.png")
+        
+        return sizes, fw_times, dijkstra_times
+    
     @staticmethod
     def plot_operations_complexity():
         """Визуализировать сложность операций."""
@@ -265,6 +320,7 @@ def run_plots():
     
     GraphPlotter.plot_scaling()
     GraphPlotter.plot_memory_usage()
+    GraphPlotter.plot_all_pairs_crossover()
     GraphPlotter.plot_operations_complexity()
     GraphPlotter.draw_sample_graphs()
     
@@ -9,7 +9,9 @@ import psutil
 
 from kmp_search import kmp_search, kmp_search_first
 from z_function import z_search
-from string_matching import boyer_moore_search, rabin_karp_search
+from suffix_array import SuffixArrayIndex
+from string_matching import (boyer_moore_search, boyer_moore_full_search, horspool_search, sunday_search,
+                             rabin_karp_search, rabin_karp_multiple_search, aho_corasick_search)
 
 def make_random_sequence(length: int, alphabet_size: int = 4) -> str:
     alphabet = string.ascii_uppercase[:alphabet_size]
@@ -199,12 +201,17 @@ def run_worst_case_test() -> Dict:
         "Паттерн в конце": (make_random_sequence(5000, 4) + "PQRSTU", "PQR"),
         "Паттерн отсутствует": (make_random_sequence(5000, 4), "WXY"),
         "Частичные совпадения": (make_repeating_sequence("AABAAAB", 500), "AABAAC"),
+        "Повторы, паттерн не совпадает": (make_single_char_sequence("A", 5000), "B" + "A" * 29),
+        "Повторы, совпадение везде": (make_single_char_sequence("A", 5000), "A" * 30),
     }
     
     algorithms = {
         "KMP": kmp_search,
         "Z-алгоритм": z_search,
         "Бойер-Мур": boyer_moore_search,
+        "Бойер-Мур (полный)": boyer_moore_full_search,
+        "Хорспул": horspool_search,
+        "Санди": sunday_search,
         "Рабин-Карп": rabin_karp_search,
     }
     
@@ -267,6 +274,137 @@ def run_pattern_length_test() -> Dict:
     
     return output_data
 
+def run_alphabet_size_test() -> Dict:
+    print("\n" + "=" * 80)
+    print("ВЫБОР АЛГОРИТМА ПО РАЗМЕРУ АЛФАВИТА")
+    print("=" * 80)
+    
+    output_data = {"alphabet_size_impact": {}, "best_engine": {}}
+    
+    alphabet_sizes = [2, 4, 8, 16, 26]
+    pattern_len = 12
+    
+    algorithms = {
+        "KMP": kmp_search,
+        "Бойер-Мур": boyer_moore_search,
+        "Бойер-Мур (полный)": boyer_moore_full_search,
+        "Хорспул": horspool_search,
+        "Санди": sunday_search,
+    }
+    
+    for alphabet_size in alphabet_sizes:
+        text_sample = make_random_sequence(50000, alphabet_size=alphabet_size)
+        pattern_sample = make_random_sequence(pattern_len, alphabet_size=alphabet_size)
+        
+        print(f"|Σ| = {alphabet_size:2d} - ", end="", flush=True)
+        size_results = {}
+        
+        for algo_name, algo_func in algorithms.items():
+            start_point = time.perf_counter()
+            algo_func(text_sample, pattern_sample)
+            elapsed_time = time.perf_counter() - start_point
+            
+            size_results[algo_name] = elapsed_time * 1e6
+            print(f"{algo_name}: {elapsed_time*1e3:7.2f} мс | ", end="", flush=True)
+        
+        best_name = min(size_results, key=size_results.get)
+        print(f"лучший: {best_name}")
+        output_data["alphabet_size_impact"][alphabet_size] = size_results
+        output_data["best_engine"][alphabet_size] = best_name
+    
+    return output_data
+
+def run_index_query_test() -> Dict:
+    print("\n" + "=" * 80)
+    print("МНОГО ЗАПРОСОВ К ОДНОМУ КОРПУСУ: KMP ПРОТИВ СУФФИКСНОГО МАССИВА")
+    print("=" * 80)
+    
+    output_data = {"index_queries": {}}
+    
+    text_sample = make_random_sequence(50000, alphabet_size=4)
+    query_counts = [1, 10, 100, 500]
+    
+    start_point = time.perf_counter()
+    index = SuffixArrayIndex(text_sample)
+    build_time = time.perf_counter() - start_point
+    output_data["index_queries"]["build_microseconds"] = build_time * 1e6
+    
+    print(f"Длина текста: {len(text_sample)}, построение индекса: {build_time*1e3:.2f} мс\n")
+    
+    algorithms = {
+        "KMP": lambda pattern_sample: kmp_search(text_sample, pattern_sample),
+        "Суффиксный массив": index.find,
+    }
+    
+    for count in query_counts:
+        queries = []
+        for _ in range(count):
+            length = random.randint(5, 15)
+            start = random.randint(0, len(text_sample) - length)
+            queries.append(text_sample[start:start + length])
+        
+        print(f"Запросов: {count:4d} - ", end="", flush=True)
+        count_results = {}
+        
+        for algo_name, algo_func in algorithms.items():
+            start_point = time.perf_counter()
+            for pattern_sample in queries:
+                algo_func(pattern_sample)
+            elapsed_time = time.perf_counter() - start_point
+            
+            count_results[algo_name] = elapsed_time * 1e6
+            print(f"{algo_name}: {elapsed_time*1e3:9.2f} мс | ", end="", flush=True)
+        
+        print()
+        output_data["index_queries"][count] = count_results
+    
+    return output_data
+
+def run_multi_pattern_test() -> Dict:
+    print("\n" + "=" * 80)
+    print("ПОИСК МНОЖЕСТВА ШАБЛОНОВ: РАБИН-КАРП ПО КАЖДОМУ ПРОТИВ АХО-КОРАСИК")
+    print("=" * 80)
+    
+    output_data = {"multi_pattern": {}}
+    
+    text_sample = make_random_sequence(10000, alphabet_size=26)
+    pattern_counts = [1, 10, 50, 100, 250, 500]
+    
+    algorithms = {
+        "Рабин-Карп (по шаблону)": rabin_karp_multiple_search,
+        "Ахо-Корасик": aho_corasick_search,
+    }
+    
+    print(f"Длина текста: {len(text_sample)}\n")
+    
+    for count in pattern_counts:
+        # Половина шаблонов — фрагменты текста, половина — случайные строки
+        patterns_list = []
+        for idx in range(count):
+            length = random.randint(4, 12)
+            if idx % 2 == 0:
+                start = random.randint(0, len(text_sample) - length)
+                patterns_list.append(text_sample[start:start + length])
+            else:
+                patterns_list.append(make_random_sequence(length, alphabet_size=26))
+        patterns_list = list(dict.fromkeys(patterns_list))
+        
+        print(f"Шаблонов: {count:4d} - ", end="", flush=True)
+        count_results = {}
+        
+        for algo_name, algo_func in algorithms.items():
+            start_point = time.perf_counter()
+            found = algo_func(text_sample, patterns_list)
+            elapsed_time = time.perf_counter() - start_point
+            
+            count_results[algo_name] = elapsed_time * 1e6
+            print(f"{algo_name}: {elapsed_time*1e3:9.2f} мс | ", end="", flush=True)
+        
+        print(f"вхождений: {sum(len(v) for v in found.values())}")
+        output_data["multi_pattern"][count] = count_results
+    
+    return output_data
+
 if __name__ == "__main__":
     final_results = {}
     
@@ -281,6 +419,15 @@ if __name__ == "__main__":
     pattern_analysis_data = run_pattern_length_test()
     final_results.update(pattern_analysis_data)
     
+    alphabet_data = run_alphabet_size_test()
+    final_results.update(alphabet_data)
+    
+    index_data = run_index_query_test()
+    final_results.update(index_data)
+    
+    multi_pattern_data = run_multi_pattern_test()
+    final_results.update(multi_pattern_data)
+    
     print("\n" + "=" * 80)
     print("СОХРАНЕНИЕ ИТОГОВЫХ ДАННЫХ")
     print("=" * 80)
@@ -1,9 +1,15 @@
+import mmap
+import os
+from typing import Iterable, Iterator, Union
+
 from prefix_function import compute_prefix_function
+from text_codes import as_code_pair
 
 def kmp_search(text: str, pattern: str) -> list[int]:
     """
     Алгоритм Кнута-Морриса-Пратта для поиска паттерна.
     Возвращает список индексов всех вхождений.
+    Принимает str или байтовые данные (bytes, bytearray, memoryview, mmap).
     
     Сложность: O(n + m)
     Память: O(m)
@@ -15,6 +21,7 @@ def kmp_search(text: str, pattern: str) -> list[int]:
     if m > n:
         return []
     
+    text, pattern = as_code_pair(text, pattern)
     prefix_array = compute_prefix_function(pattern)
     matches = []
     pattern_idx = 0
@@ -44,6 +51,7 @@ def kmp_search_first(text: str, pattern: str) -> int:
     if m > n:
         return -1
     
+    text, pattern = as_code_pair(text, pattern)
     prefix_array = compute_prefix_function(pattern)
     pattern_idx = 0
     
@@ -105,6 +113,101 @@ def kmp_search_with_steps(text: str, pattern: str) -> tuple[list[int], list[str]
     
     return matches, steps
 
+class KMPStreamMatcher:
+    """
+    Потоковый KMP: текст подаётся частями, состояние автомата
+    (длина совпавшего префикса) переносится через границы частей.
+    
+    Шаблон и части должны быть одного рода: str или байтовые
+    (bytes, bytearray, memoryview, mmap). Байтовые части читаются через
+    memoryview без копирования, позиции — абсолютные смещения в байтах.
+    
+    Сложность: O(n + m) на весь поток
+    Память: O(m) независимо от длины потока
+    """
+    
+    def __init__(self, pattern: Union[str, bytes], prefix_array: list[int] = None):
+        if not pattern:
+            raise ValueError("Пустой паттерн")
+        self.is_text = isinstance(pattern, str)
+        self.pattern = pattern if self.is_text else bytes(pattern)
+        self.prefix_array = prefix_array if prefix_array is not None else compute_prefix_function(self.pattern)
+        self.pattern_idx = 0
+        self.offset = 0
+    
+    def feed(self, chunk) -> list[int]:
+        """Обработать очередную часть; вернуть абсолютные позиции вхождений, закончившихся в ней."""
+        if isinstance(chunk, str) != self.is_text:
+            raise TypeError("Тип части текста не совпадает с типом паттерна")
+        if not self.is_text:
+            chunk = memoryview(chunk).cast('B')
+        
+        pattern, prefix_array = self.pattern, self.prefix_array
+        m = len(pattern)
+        pattern_idx = self.pattern_idx
+        base = self.offset - m + 1
+        matches = []
+        
+        for i, char in enumerate(chunk):
+            while pattern_idx > 0 and char != pattern[pattern_idx]:
+                pattern_idx = prefix_array[pattern_idx - 1]
+            
+            if char == pattern[pattern_idx]:
+                pattern_idx += 1
+            
+            if pattern_idx == m:
+                matches.append(base + i)
+                pattern_idx = prefix_array[m - 1]
+        
+        self.pattern_idx = pattern_idx
+        self.offset += len(chunk)
+        return matches
+    
+    def matches(self, chunks: Iterable) -> Iterator[int]:
+        """Генератор абсолютных позиций вхождений по потоку частей."""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+    
+    def reset(self) -> None:
+        self.pattern_idx = 0
+        self.offset = 0
+
+def kmp_search_stream(chunks: Iterable, pattern: Union[str, bytes]) -> Iterator[int]:
+    """
+    Поиск паттерна в потоке частей текста (str или bytes).
+    """
+    return KMPStreamMatcher(pattern).matches(chunks)
+
+def kmp_search_file(path: str, pattern: Union[str, bytes], chunk_size: int = 1 << 20,
+                    use_mmap: bool = True) -> Iterator[int]:
+    """
+    Поиск паттерна в файле, который может не помещаться в память.
+    Строковый паттерн кодируется в UTF-8, позиции — смещения в байтах.
+    
+    С use_mmap файл отображается в память и обходится срезами memoryview
+    по chunk_size байт без копирования, иначе читается блоками.
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+    matcher = KMPStreamMatcher(pattern)
+    
+    with open(path, "rb") as f:
+        if not use_mmap or os.fstat(f.fileno()).st_size == 0:
+            while chunk := f.read(chunk_size):
+                yield from matcher.feed(chunk)
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for start in range(0, len(view), chunk_size):
+                    part = view[start:start + chunk_size]
+                    found = matcher.feed(part)
+                    part.release()
+                    yield from found
+            finally:
+                view.release()
+
 if __name__ == "__main__":
     test_data = [
         ("ABABDABACDABABCABAB", "ABABCABAB"),
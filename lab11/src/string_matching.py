@@ -1,6 +1,13 @@
+from array import array
+from collections import deque
+
+from text_codes import as_codes, as_code_pair, check_same_kind
+from z_function import compute_z_function
+
 def boyer_moore_search(text_data: str, pattern_data: str) -> list[int]:
     """
     Алгоритм Бойера-Мура для поиска подстроки.
+    Принимает str или байтовые данные (bytes, bytearray, memoryview, mmap).
     
     Сложность: O(n/m) в среднем, O(nm) в худшем
     Память: O(|Σ|)
@@ -12,6 +19,7 @@ def boyer_moore_search(text_data: str, pattern_data: str) -> list[int]:
     if m > n:
         return []
     
+    text_data, pattern_data = as_code_pair(text_data, pattern_data)
     bad_char_dict = {}
     for i in range(m - 1):
         bad_char_dict[pattern_data[i]] = m - 1 - i
@@ -41,6 +49,12 @@ def boyer_moore_search(text_data: str, pattern_data: str) -> list[int]:
 def boyer_moore_search_optimized(text_data: str, pattern_data: str) -> list[int]:
     """
     Улучшенная версия алгоритма Бойера-Мура.
+    Принимает str или байтовые данные (bytes, bytearray, memoryview, mmap).
+    
+    Таблица плохих символов индексируется кодом символа и имеет размер
+    max(код в паттерне) + 1: для байтов не больше 256, для str — сколько
+    нужно алфавиту паттерна (кириллица и т.п.); коды вне таблицы
+    в паттерне не встречаются (-1).
     """
     if not pattern_data or not text_data:
         return []
@@ -49,9 +63,11 @@ def boyer_moore_search_optimized(text_data: str, pattern_data: str) -> list[int]
     if m > n:
         return []
     
-    bad_char_table = [-1] * 256
+    text_data, pattern_data = as_code_pair(text_data, pattern_data)
+    table_size = max(pattern_data) + 1
+    bad_char_table = [-1] * table_size
     for i in range(m):
-        bad_char_table[ord(pattern_data[i])] = i
+        bad_char_table[pattern_data[i]] = i
     
     matches_list = []
     shift_val = 0
@@ -64,15 +80,180 @@ def boyer_moore_search_optimized(text_data: str, pattern_data: str) -> list[int]
         
         if j < 0:
             matches_list.append(shift_val)
-            shift_val += 1 if shift_val + m >= n else m - bad_char_table[ord(text_data[shift_val + m])]
+            if shift_val + m >= n:
+                shift_val += 1
+            else:
+                code = text_data[shift_val + m]
+                shift_val += m - (bad_char_table[code] if code < table_size else -1)
         else:
-            shift_val += max(1, j - bad_char_table[ord(text_data[shift_val + j])])
+            code = text_data[shift_val + j]
+            shift_val += max(1, j - (bad_char_table[code] if code < table_size else -1))
+    
+    return matches_list
+
+def compute_good_suffix_tables(pattern_codes) -> tuple[list[int], list[int]]:
+    """
+    Таблицы сильного правила хорошего суффикса (по Гасфилду) через Z-функцию.
+    
+    suffix_lengths[j] — длина наибольшего общего суффикса pattern[:j + 1]
+    и pattern (Z-функция перевёрнутого паттерна, прочитанная с конца).
+    big_l[i] — правый конец (1-based) самого правого вхождения суффикса
+    pattern[i:], перед которым стоит другой символ, или 0;
+    small_l[i] — длина наибольшего префикса паттерна, являющегося
+    суффиксом pattern[i:].
+    
+    Сложность: O(m)
+    Память: O(m)
+    """
+    m = len(pattern_codes)
+    reversed_z = compute_z_function(pattern_codes[::-1])
+    suffix_lengths = reversed_z[::-1]
+    
+    big_l = [0] * m
+    for j in range(m - 1):
+        i = m - suffix_lengths[j]
+        if i < m:
+            big_l[i] = j + 1
+    
+    small_l = [0] * m
+    for j in range(m):
+        if suffix_lengths[j] == j + 1:
+            small_l[m - j - 1] = j + 1
+    for i in range(m - 2, -1, -1):
+        if small_l[i] == 0:
+            small_l[i] = small_l[i + 1]
+    
+    return big_l, small_l
+
+def boyer_moore_full_search(text_data: str, pattern_data: str) -> list[int]:
+    """
+    Полный алгоритм Бойера-Мура: плохой символ + сильный хороший суффикс
+    + правило Галиля. После вхождения сдвиг равен периоду паттерна,
+    и уже известный префикс следующего окна повторно не сравнивается,
+    поэтому худший случай линеен даже на текстах вида "AAAA...".
+    
+    Сложность: O(n + m) в худшем, O(n/m) в среднем
+    Память: O(m + |Σ|)
+    """
+    if not pattern_data or not text_data:
+        return []
+    
+    n, m = len(text_data), len(pattern_data)
+    if m > n:
+        return []
+    
+    text_data, pattern_data = as_code_pair(text_data, pattern_data)
+    table_size = max(pattern_data) + 1
+    bad_char_table = [-1] * table_size
+    for i in range(m):
+        bad_char_table[pattern_data[i]] = i
+    
+    big_l, small_l = compute_good_suffix_tables(pattern_data)
+    # Сдвиг при несовпадении в позиции j (совпал суффикс pattern[j + 1:])
+    good_suffix_shift = [0] * m
+    for j in range(m - 1):
+        good_suffix_shift[j] = m - big_l[j + 1] if big_l[j + 1] > 0 else m - small_l[j + 1]
+    period = m - small_l[1] if m > 1 else 1
+    
+    matches_list = []
+    shift_val = 0
+    known_prefix = 0
+    
+    while shift_val <= n - m:
+        j = m - 1
+        while j >= known_prefix and pattern_data[j] == text_data[shift_val + j]:
+            j -= 1
+        
+        if j < known_prefix:
+            matches_list.append(shift_val)
+            shift_val += period
+            # Правило Галиля: первые m - period символов окна уже совпали
+            known_prefix = m - period
+        else:
+            code = text_data[shift_val + j]
+            bad_char_shift = j - (bad_char_table[code] if code < table_size else -1)
+            shift_val += max(1, bad_char_shift, good_suffix_shift[j])
+            known_prefix = 0
+    
+    return matches_list
+
+def horspool_search(text_data: str, pattern_data: str) -> list[int]:
+    """
+    Алгоритм Хорспула: сдвиг по символу текста под последней позицией окна.
+    
+    Сложность: O(n/m) в среднем, O(nm) в худшем
+    Память: O(|Σ|)
+    """
+    if not pattern_data or not text_data:
+        return []
+    
+    n, m = len(text_data), len(pattern_data)
+    if m > n:
+        return []
+    
+    text_data, pattern_data = as_code_pair(text_data, pattern_data)
+    table_size = max(pattern_data) + 1
+    shift_table = [m] * table_size
+    for i in range(m - 1):
+        shift_table[pattern_data[i]] = m - 1 - i
+    
+    matches_list = []
+    shift_val = 0
+    
+    while shift_val <= n - m:
+        j = m - 1
+        while j >= 0 and pattern_data[j] == text_data[shift_val + j]:
+            j -= 1
+        if j < 0:
+            matches_list.append(shift_val)
+        
+        code = text_data[shift_val + m - 1]
+        shift_val += shift_table[code] if code < table_size else m
+    
+    return matches_list
+
+def sunday_search(text_data: str, pattern_data: str) -> list[int]:
+    """
+    Алгоритм Санди (Quick Search): сдвиг по символу сразу за окном,
+    поэтому максимальный сдвиг m + 1. Выгоден на больших алфавитах.
+    
+    Сложность: O(n/m) в среднем, O(nm) в худшем
+    Память: O(|Σ|)
+    """
+    if not pattern_data or not text_data:
+        return []
+    
+    n, m = len(text_data), len(pattern_data)
+    if m > n:
+        return []
+    
+    text_data, pattern_data = as_code_pair(text_data, pattern_data)
+    table_size = max(pattern_data) + 1
+    shift_table = [m + 1] * table_size
+    for i in range(m):
+        shift_table[pattern_data[i]] = m - i
+    
+    matches_list = []
+    shift_val = 0
+    
+    while shift_val <= n - m:
+        j = 0
+        while j < m and pattern_data[j] == text_data[shift_val + j]:
+            j += 1
+        if j == m:
+            matches_list.append(shift_val)
+        
+        if shift_val + m >= n:
+            break
+        code = text_data[shift_val + m]
+        shift_val += shift_table[code] if code < table_size else m + 1
     
     return matches_list
 
 def rabin_karp_search(text_data: str, pattern_data: str, prime_val: int = 101) -> list[int]:
     """
     Алгоритм Рабина-Карпа для поиска подстроки.
+    Принимает str или байтовые данные (bytes, bytearray, memoryview, mmap).
     
     Сложность: O(n + m) в среднем, O(nm) в худшем
     Память: O(1)
@@ -84,6 +265,8 @@ def rabin_karp_search(text_data: str, pattern_data: str, prime_val: int = 101) -
     if m > n:
         return []
     
+    text_data, pattern_data = as_code_pair(text_data, pattern_data)
+    
     BASE = 256
     MOD = 101 * 10**9 + 7
     
@@ -95,8 +278,8 @@ def rabin_karp_search(text_data: str, pattern_data: str, prime_val: int = 101) -
         power_base = (power_base * BASE) % MOD
     
     for i in range(m):
-        pattern_hash = (BASE * pattern_hash + ord(pattern_data[i])) % MOD
-        text_hash = (BASE * text_hash + ord(text_data[i])) % MOD
+        pattern_hash = (BASE * pattern_hash + pattern_data[i]) % MOD
+        text_hash = (BASE * text_hash + text_data[i]) % MOD
     
     matches_list = []
     
@@ -106,7 +289,7 @@ def rabin_karp_search(text_data: str, pattern_data: str, prime_val: int = 101) -
                 matches_list.append(i)
         
         if i < n - m:
-            text_hash = (BASE * (text_hash - ord(text_data[i]) * power_base) + ord(text_data[i + m])) % MOD
+            text_hash = (BASE * (text_hash - text_data[i] * power_base) + text_data[i + m]) % MOD
             if text_hash < 0:
                 text_hash += MOD
     
@@ -115,6 +298,8 @@ def rabin_karp_search(text_data: str, pattern_data: str, prime_val: int = 101) -
 def rabin_karp_multiple_search(text_data: str, patterns_list: list[str]) -> dict[str, list[int]]:
     """
     Поиск нескольких шаблонов одновременно.
+    Принимает str или байтовые данные (текст и шаблоны одного рода).
+    Повторы шаблона в списке ищутся один раз; у пустого шаблона вхождений нет.
     """
     if not patterns_list or not text_data:
         return {}
@@ -125,19 +310,24 @@ def rabin_karp_multiple_search(text_data: str, patterns_list: list[str]) -> dict
     BASE = 256
     MOD = 101 * 10**9 + 7
     
+    text_codes = as_codes(text_data)
+    pattern_codes = {}
     pattern_hashes = {}
     for pattern in patterns_list:
+        check_same_kind(text_data, pattern)
+        pattern_codes[pattern] = as_codes(pattern)
         h_val = 0
-        for char in pattern:
-            h_val = (BASE * h_val + ord(char)) % MOD
+        for char in pattern_codes[pattern]:
+            h_val = (BASE * h_val + char) % MOD
         pattern_hashes[pattern] = h_val
     
-    for pattern in patterns_list:
+    for pattern in pattern_codes:
         m = len(pattern)
-        if m > n:
+        if m == 0 or m > n:
             continue
         
         pattern_hash = pattern_hashes[pattern]
+        codes = pattern_codes[pattern]
         power_base = 1
         
         for i in range(m - 1):
@@ -145,20 +335,124 @@ def rabin_karp_multiple_search(text_data: str, patterns_list: list[str]) -> dict
         
         text_hash = 0
         for i in range(m):
-            text_hash = (BASE * text_hash + ord(text_data[i])) % MOD
+            text_hash = (BASE * text_hash + text_codes[i]) % MOD
         
         for i in range(n - m + 1):
             if pattern_hash == text_hash:
-                if text_data[i:i + m] == pattern:
+                if text_codes[i:i + m] == codes:
                     results_dict[pattern].append(i)
             
             if i < n - m:
-                text_hash = (BASE * (text_hash - ord(text_data[i]) * power_base) + ord(text_data[i + m])) % MOD
+                text_hash = (BASE * (text_hash - text_codes[i] * power_base) + text_codes[i + m]) % MOD
                 if text_hash < 0:
                     text_hash += MOD
     
     return results_dict
 
+class AhoCorasick:
+    """
+    Автомат Ахо-Корасик для одновременного поиска многих шаблонов.
+    
+    Таблицы хранятся в плоских массивах: goto_table[state * A + c] —
+    переход по символу с номером c (A — число различных символов в
+    шаблонах; переходы уже дополнены суффиксными ссылками, поэтому при
+    поиске цикла по fail нет), fail_link — суффиксная ссылка,
+    output_link — ближайшее по суффиксным ссылкам конечное состояние,
+    node_pattern — номер шаблона, оканчивающегося в состоянии (или -1).
+    
+    Сложность: построение O(L·A), поиск O(n + z)
+    (L — суммарная длина шаблонов, z — число вхождений)
+    Память: O(L·A)
+    """
+    
+    def __init__(self, patterns_list: list[str]):
+        self.patterns = list(dict.fromkeys(p for p in patterns_list if p))
+        self.char_index = {}
+        for pattern in self.patterns:
+            for char in pattern:
+                self.char_index.setdefault(char, len(self.char_index))
+        self.alphabet_size = max(1, len(self.char_index))
+        
+        # Бор: переходы -1 пока не вычислены
+        A = self.alphabet_size
+        goto_table = array('i', [-1]) * A
+        node_pattern = array('i', [-1])
+        for pattern_idx, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                c = self.char_index[char]
+                if goto_table[state * A + c] == -1:
+                    goto_table[state * A + c] = len(node_pattern)
+                    goto_table.extend(array('i', [-1]) * A)
+                    node_pattern.append(-1)
+                state = goto_table[state * A + c]
+            node_pattern[state] = pattern_idx
+        
+        # Обход в ширину: суффиксные ссылки и полный автомат
+        states_count = len(node_pattern)
+        fail_link = array('i', [0]) * states_count
+        output_link = array('i', [0]) * states_count
+        queue = deque()
+        for c in range(A):
+            child = goto_table[c]
+            if child == -1:
+                goto_table[c] = 0
+            else:
+                queue.append(child)
+        
+        while queue:
+            state = queue.popleft()
+            fail = fail_link[state]
+            output_link[state] = fail if node_pattern[fail] != -1 else output_link[fail]
+            for c in range(A):
+                child = goto_table[state * A + c]
+                if child == -1:
+                    goto_table[state * A + c] = goto_table[fail * A + c]
+                else:
+                    fail_link[child] = goto_table[fail * A + c]
+                    queue.append(child)
+        
+        self.goto_table = goto_table
+        self.fail_link = fail_link
+        self.output_link = output_link
+        self.node_pattern = node_pattern
+    
+    def search(self, text_data: str) -> dict[str, list[int]]:
+        """Все вхождения всех шаблонов за один проход по тексту."""
+        positions = [[] for _ in self.patterns]
+        lengths = [len(p) for p in self.patterns]
+        goto_table, output_link, node_pattern = self.goto_table, self.output_link, self.node_pattern
+        char_index, A = self.char_index, self.alphabet_size
+        
+        state = 0
+        for i, char in enumerate(text_data):
+            c = char_index.get(char, -1)
+            state = goto_table[state * A + c] if c >= 0 else 0
+            
+            node = state if node_pattern[state] != -1 else output_link[state]
+            while node > 0:
+                pattern_idx = node_pattern[node]
+                positions[pattern_idx].append(i - lengths[pattern_idx] + 1)
+                node = output_link[node]
+        
+        return dict(zip(self.patterns, positions))
+
+def aho_corasick_search(text_data: str, patterns_list: list[str]) -> dict[str, list[int]]:
+    """
+    Поиск нескольких шаблонов за один проход (Ахо-Корасик).
+    Результат совпадает с rabin_karp_multiple_search, в том числе для
+    повторяющихся и пустых шаблонов.
+    
+    Сложность: O(L·A + n + z) вместо O(k·n) у поиска по каждому шаблону
+    Память: O(L·A)
+    """
+    if not patterns_list or not text_data:
+        return {}
+    
+    results_dict = {pattern: [] for pattern in patterns_list}
+    results_dict.update(AhoCorasick(patterns_list).search(text_data))
+    return results_dict
+
 if __name__ == "__main__":
     test_cases = [
         ("ABABDABACDABABCABAB", "ABABCABAB"),
@@ -196,5 +490,13 @@ if __name__ == "__main__":
     results = rabin_karp_multiple_search(text_sample, patterns)
     
     print(f"Текст: '{text_sample}'")
+    for pattern_val, positions_list in results.items():
+        print(f"  Шаблон '{pattern_val}': {positions_list}")
+    
+    print("\n" + "=" * 60)
+    print("АХО-КОРАСИК (ОДИН ПРОХОД):")
+    print("=" * 60)
+    
+    results = aho_corasick_search(text_sample, patterns)
     for pattern_val, positions_list in results.items():
         print(f"  Шаблон '{pattern_val}': {positions_list}")
\ No newline at end of file
@@ -0,0 +1,197 @@
+import numpy as np
+
+from text_codes import as_codes
+
+_FORMAT_VERSION = 1
+
+def build_suffix_array(codes) -> np.ndarray:
+    """
+    Суффиксный массив удвоением префиксов на NumPy.
+    
+    На шаге k суффиксы упорядочены по первым 2k символам: ключ суффикса i —
+    пара (ранг i, ранг i + k), упакованная в одно int64. Каждый шаг —
+    одна векторная сортировка; цикл завершается, как только все ранги
+    различны, то есть за O(log L) шагов, где L — длина наибольшего
+    повтора.
+    
+    Сложность: O(n log² n) в худшем случае
+    Память: O(n)
+    """
+    codes = np.asarray(codes)
+    n = len(codes)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    
+    # Начальные ранги — плотная нумерация кодов символов
+    _, rank = np.unique(codes, return_inverse=True)
+    rank = rank.astype(np.int64).reshape(-1)
+    suffix_array = np.argsort(rank, kind="stable")
+    
+    k = 1
+    while rank[suffix_array[-1]] < n - 1:
+        second = np.full(n, -1, dtype=np.int64)
+        if k < n:
+            second[:n - k] = rank[k:]
+        key = rank * (n + 1) + (second + 1)
+        
+        suffix_array = np.argsort(key, kind="stable")
+        sorted_key = key[suffix_array]
+        rank = np.empty(n, dtype=np.int64)
+        rank[suffix_array[0]] = 0
+        rank[suffix_array[1:]] = np.cumsum(sorted_key[1:] != sorted_key[:-1])
+        k *= 2
+    
+    return suffix_array.astype(np.int64)
+
+def compute_lcp_array(codes, suffix_array) -> np.ndarray:
+    """
+    LCP-массив алгоритмом Касаи: lcp[i] — длина общего префикса
+    суффиксов suffix_array[i - 1] и suffix_array[i], lcp[0] = 0.
+    
+    Массивы остаются в NumPy, цикл читает и пишет их через memoryview:
+    обращение по индексу возвращает int без создания скаляров NumPy
+    и без копирования в списки Python.
+    
+    Сложность: O(n)
+    Память: O(n) — ранги и результат по 8 байт на символ
+    """
+    n = len(suffix_array)
+    suffix_array = np.ascontiguousarray(suffix_array, dtype=np.int64)
+    rank_array = np.empty(n, dtype=np.int64)
+    rank_array[suffix_array] = np.arange(n, dtype=np.int64)
+    lcp_array = np.zeros(n, dtype=np.int64)
+    
+    text = memoryview(np.ascontiguousarray(codes))
+    sa, rank, lcp = memoryview(suffix_array), memoryview(rank_array), memoryview(lcp_array)
+    h = 0
+    for i in range(n):
+        r = rank[i]
+        if r == 0:
+            h = 0
+            continue
+        j = sa[r - 1]
+        while i + h < n and j + h < n and text[i + h] == text[j + h]:
+            h += 1
+        lcp[r] = h
+        if h:
+            h -= 1
+    
+    return lcp_array
+
+class SuffixArrayIndex:
+    """
+    Индекс по неизменному корпусу: суффиксный массив + LCP.
+    
+    Строится один раз, после чего запросы не просматривают весь текст:
+    вхождения паттерна образуют непрерывный диапазон суффиксного
+    массива, который находится двумя двоичными поисками.
+    Принимает str или байтовые данные (bytes, bytearray, memoryview, mmap);
+    позиции — индексы символов для str и байтов для байтовых данных.
+    
+    Сложность: построение O(n log² n), find O(m log n + k log k),
+    count O(m log n), longest_repeated_substring O(n) (по готовому LCP),
+    distinct_substring_count O(n)
+    Память: O(n)
+    """
+    
+    def __init__(self, text_data, suffix_array=None, lcp_array=None):
+        self._is_str = isinstance(text_data, str)
+        self.text = text_data if self._is_str else bytes(text_data)
+        self.codes = np.frombuffer(as_codes(self.text), dtype=np.uint32 if self._is_str else np.uint8)
+        
+        if suffix_array is None:
+            suffix_array = build_suffix_array(self.codes)
+        if lcp_array is None:
+            lcp_array = compute_lcp_array(self.codes, suffix_array)
+        self.suffix_array = suffix_array
+        self.lcp = lcp_array
+    
+    def __len__(self):
+        return len(self.text)
+    
+    def _check_kind(self, pattern_data):
+        if isinstance(pattern_data, str) != self._is_str:
+            raise TypeError("Текст и паттерн должны быть оба str или оба байтовыми")
+        return pattern_data if self._is_str else bytes(pattern_data)
+    
+    def _range(self, pattern_data) -> tuple[int, int]:
+        """
+        Полуинтервал [lo, hi) суффиксного массива, суффиксы которого
+        начинаются с паттерна. Порядок срезов str/bytes совпадает с
+        порядком кодов, по которому построен массив.
+        """
+        text_data, suffix_array = self.text, self.suffix_array
+        m = len(pattern_data)
+        
+        lo, hi = 0, len(suffix_array)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = int(suffix_array[mid])
+            if text_data[start:start + m] < pattern_data:
+                lo = mid + 1
+            else:
+                hi = mid
+        
+        first = lo
+        hi = len(suffix_array)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = int(suffix_array[mid])
+            if text_data[start:start + m] == pattern_data:
+                lo = mid + 1
+            else:
+                hi = mid
+        
+        return first, lo
+    
+    def find(self, pattern_data) -> list[int]:
+        """Все вхождения паттерна в порядке возрастания позиций."""
+        pattern_data = self._check_kind(pattern_data)
+        if not pattern_data or not self.text:
+            return []
+        lo, hi = self._range(pattern_data)
+        return np.sort(self.suffix_array[lo:hi]).tolist()
+    
+    def count(self, pattern_data) -> int:
+        """Число вхождений паттерна без построения списка позиций."""
+        pattern_data = self._check_kind(pattern_data)
+        if not pattern_data or not self.text:
+            return 0
+        lo, hi = self._range(pattern_data)
+        return hi - lo
+    
+    def longest_repeated_substring(self):
+        """Самая длинная подстрока, встречающаяся не менее двух раз (пустая, если повторов нет)."""
+        if len(self.lcp) == 0 or int(self.lcp.max()) == 0:
+            return self.text[:0]
+        i = int(np.argmax(self.lcp))
+        start = int(self.suffix_array[i])
+        return self.text[start:start + int(self.lcp[i])]
+    
+    def distinct_substring_count(self) -> int:
+        """Число различных непустых подстрок: n(n + 1)/2 − Σ lcp."""
+        n = len(self.text)
+        return n * (n + 1) // 2 - int(self.lcp.sum())
+    
+    def save(self, path) -> None:
+        """Сохранить текст, суффиксный массив и LCP в файл .npz."""
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                version=np.array(_FORMAT_VERSION),
+                is_str=np.array(self._is_str),
+                # Коды символов всегда в little-endian, чтобы файл был переносимым
+                codes=self.codes.astype("<u4") if self._is_str else self.codes,
+                suffix_array=self.suffix_array,
+                lcp=self.lcp,
+            )
+    
+    @classmethod
+    def load(cls, path) -> "SuffixArrayIndex":
+        """Загрузить индекс, сохранённый save, без повторного построения."""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != _FORMAT_VERSION:
+                raise ValueError(f"{path}: неподдерживаемая версия индекса {int(data['version'])}")
+            raw = data["codes"].tobytes()
+            text_data = raw.decode("utf-32-le", errors="surrogatepass") if bool(data["is_str"]) else raw
+            return cls(text_data, data["suffix_array"], data["lcp"])
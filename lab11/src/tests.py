@@ -1,11 +1,16 @@
+import mmap
+import os
+import tempfile
 import unittest
 from prefix_function import compute_prefix_function, compute_prefix_function_verbose
-from kmp_search import kmp_search, kmp_search_first
+from kmp_search import kmp_search, kmp_search_first, KMPStreamMatcher, kmp_search_stream, kmp_search_file
 from z_function import (
     compute_z_function, z_search, find_period, is_cyclic_shift
 )
+from suffix_array import build_suffix_array, compute_lcp_array, SuffixArrayIndex
 from string_matching import (
-    boyer_moore_search, rabin_karp_search, rabin_karp_multiple_search
+    boyer_moore_search, boyer_moore_search_optimized, boyer_moore_full_search, horspool_search, sunday_search,
+    compute_good_suffix_tables, rabin_karp_search, rabin_karp_multiple_search, AhoCorasick, aho_corasick_search
 )
 
 class TestPrefixFunction(unittest.TestCase):
@@ -83,6 +88,38 @@ class TestKMPSearch(unittest.TestCase):
         self.assertEqual(kmp_search("HELLO", "hello"), [])
         self.assertEqual(kmp_search("Hello", "hello"), [])
 
+class TestKMPStream(unittest.TestCase):
+    
+    def test_match_across_chunks(self):
+        chunks = ["AAB", "AACAADA", "AB", "AABA"]
+        self.assertEqual(list(kmp_search_stream(chunks, "AABA")), [0, 9, 12])
+        
+    def test_bytes_chunks(self):
+        chunks = [b"ZZ", bytearray(b"Z"), memoryview(b"ZZ")]
+        self.assertEqual(list(kmp_search_stream(chunks, b"ZZ")), [0, 1, 2, 3])
+        
+    def test_feed_keeps_state(self):
+        matcher = KMPStreamMatcher("MNM")
+        self.assertEqual(matcher.feed("MN"), [])
+        self.assertEqual(matcher.feed("MNM"), [0, 2])
+        self.assertEqual(matcher.offset, 5)
+        with self.assertRaises(TypeError):
+            matcher.feed(b"MN")
+            
+    def test_file_search(self):
+        text_data = "лог: ошибка; " * 50 + "ABABCABAB"
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "log.txt")
+            with open(path, "wb") as f:
+                f.write(text_data.encode("utf-8"))
+            
+            raw = text_data.encode("utf-8")
+            expected = [i for i in range(len(raw)) if raw.startswith("ошибка".encode("utf-8"), i)]
+            for use_mmap in (True, False):
+                found = list(kmp_search_file(path, "ошибка", chunk_size=16, use_mmap=use_mmap))
+                self.assertEqual(found, expected)
+            self.assertEqual(list(kmp_search_file(path, b"ABABCABAB")), [len(raw) - 9])
+
 class TestZFunction(unittest.TestCase):
     
     def test_simple_strings(self):
@@ -166,6 +203,79 @@ class TestRabinKarp(unittest.TestCase):
         self.assertEqual(results["AAB"], [0, 9, 12])
         self.assertEqual(results["ABA"], [1, 10, 13])
 
+class TestAhoCorasick(unittest.TestCase):
+    
+    def test_same_as_rabin_karp(self):
+        text_data = "AABAACAADAABAABA"
+        patterns_list = ["AABA", "AAB", "ABA", "CAAD", "XYZ"]
+        self.assertEqual(
+            aho_corasick_search(text_data, patterns_list),
+            rabin_karp_multiple_search(text_data, patterns_list)
+        )
+        
+    def test_duplicate_and_empty_patterns(self):
+        patterns_list = ["B", "AB", "B", "", "AB"]
+        expected = {"B": [1, 3], "AB": [0, 2], "": []}
+        self.assertEqual(aho_corasick_search("ABAB", patterns_list), expected)
+        self.assertEqual(rabin_karp_multiple_search("ABAB", patterns_list), expected)
+        
+    def test_nested_patterns(self):
+        results = aho_corasick_search("ushers", ["he", "she", "his", "hers"])
+        self.assertEqual(results, {"he": [2], "she": [1], "his": [], "hers": [2]})
+        
+    def test_overlapping_and_unicode(self):
+        results = aho_corasick_search("барабанщик", ["ба", "раба", "а"])
+        self.assertEqual(results["ба"], [0, 4])
+        self.assertEqual(results["раба"], [2])
+        self.assertEqual(results["а"], [1, 3, 5])
+        
+    def test_empty_inputs(self):
+        self.assertEqual(aho_corasick_search("", ["A"]), {})
+        self.assertEqual(aho_corasick_search("ABC", []), {})
+        self.assertEqual(aho_corasick_search("ABC", ["", "B"]), {"": [], "B": [1]})
+        
+    def test_automaton_reuse(self):
+        automaton = AhoCorasick(["ZZ", "Z"])
+        self.assertEqual(automaton.search("ZZZ"), {"ZZ": [0, 1], "Z": [0, 1, 2]})
+        self.assertEqual(automaton.search("AZA"), {"ZZ": [], "Z": [1]})
+
+class TestBoyerMooreFamily(unittest.TestCase):
+    
+    ALGORITHMS = [boyer_moore_full_search, horspool_search, sunday_search]
+    
+    def test_good_suffix_tables(self):
+        big_l, small_l = compute_good_suffix_tables(list(map(ord, "ANPANMAN")))
+        self.assertEqual(big_l, [0, 0, 0, 0, 0, 0, 5, 0])
+        self.assertEqual(small_l, [8, 2, 2, 2, 2, 2, 2, 0])
+        big_l, small_l = compute_good_suffix_tables(list(map(ord, "ABAB")))
+        self.assertEqual(small_l, [4, 2, 2, 0])
+        
+    def test_periodic_patterns(self):
+        for algorithm in self.ALGORITHMS:
+            self.assertEqual(algorithm("A" * 10, "AAA"), list(range(8)))
+            self.assertEqual(algorithm("ABABABAB", "ABAB"), [0, 2, 4])
+            self.assertEqual(algorithm("A" * 10, "BAAA"), [])
+            
+    def test_same_as_kmp(self):
+        cases = [
+            ("ABABDABACDABABCABAB", "ABABCABAB"),
+            ("AABAACAADAABAABA", "AABA"),
+            ("MISSISSIPPI", "ISS"),
+            ("барабанщик", "бан"),
+            ("ABCDABCDABCDABD", "ABCDABD"),
+        ]
+        for text_sample, pattern_sample in cases:
+            for algorithm in self.ALGORITHMS:
+                self.assertEqual(algorithm(text_sample, pattern_sample), kmp_search(text_sample, pattern_sample))
+                
+    def test_edge_cases(self):
+        for algorithm in self.ALGORITHMS:
+            self.assertEqual(algorithm("", "A"), [])
+            self.assertEqual(algorithm("A", ""), [])
+            self.assertEqual(algorithm("AB", "ABC"), [])
+            self.assertEqual(algorithm("ABC", "C"), [2])
+            self.assertEqual(algorithm("ABC", "Z"), [])
+
 class TestAlgorithmConsistency(unittest.TestCase):
     
     def test_all_algorithms_same_results(self):
@@ -228,6 +338,100 @@ class TestPracticalProblems(unittest.TestCase):
         self.assertFalse(is_cyclic_shift("abcd", "abdc"))
         self.assertFalse(is_cyclic_shift("abc", "abcd"))
 
+class TestBinaryInputs(unittest.TestCase):
+    
+    ALGORITHMS = [kmp_search, z_search, boyer_moore_search, boyer_moore_search_optimized,
+                  boyer_moore_full_search, horspool_search, sunday_search, rabin_karp_search]
+    
+    def test_bytes_like_inputs(self):
+        raw = "барабанщик # ABAB#AB".encode("utf-8")
+        pattern = "ба".encode("utf-8")
+        expected = [i for i in range(len(raw)) if raw.startswith(pattern, i)]
+        for algorithm in self.ALGORITHMS:
+            for text_data in (raw, bytearray(raw), memoryview(raw)):
+                self.assertEqual(algorithm(text_data, pattern), expected)
+            self.assertEqual(algorithm(raw, b"#AB"), [raw.index(b"#AB")])
+            
+    def test_mmap_input(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b"\x00\xff\x00\xff\xff\x00" * 100)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for algorithm in self.ALGORITHMS:
+                    self.assertEqual(len(algorithm(mapped, b"\xff\x00")), 200)
+                self.assertEqual(len(rabin_karp_multiple_search(mapped, [b"\x00\xff"])[b"\x00\xff"]), 200)
+                
+    def test_non_latin_text(self):
+        for algorithm in self.ALGORITHMS:
+            self.assertEqual(algorithm("барабанщик", "рабан"), [2])
+    
+    def test_lone_surrogates(self):
+        # Имена файлов из os.fsdecode могут содержать одиночные суррогаты
+        for algorithm in self.ALGORITHMS:
+            self.assertEqual(algorithm("a\udc80b\udc80b", "\udc80b"), [1, 3])
+        self.assertEqual(kmp_search("a\ud800b", "b"), [2])
+            
+    def test_mixed_kinds_rejected(self):
+        for algorithm in self.ALGORITHMS:
+            with self.assertRaises(TypeError):
+                algorithm("ABAB", b"AB")
+        with self.assertRaises(TypeError):
+            rabin_karp_multiple_search("ABAB", ["AB", b"AB"])
+
+class TestSuffixArrayIndex(unittest.TestCase):
+    
+    def test_banana(self):
+        index = SuffixArrayIndex("banana")
+        self.assertEqual(index.suffix_array.tolist(), [5, 3, 1, 0, 4, 2])
+        self.assertEqual(index.lcp.tolist(), [0, 1, 3, 0, 0, 2])
+        self.assertEqual(index.find("ana"), [1, 3])
+        self.assertEqual(index.count("a"), 3)
+        self.assertEqual(index.count("nab"), 0)
+        self.assertEqual(index.longest_repeated_substring(), "ana")
+        self.assertEqual(index.distinct_substring_count(), 15)
+        
+    def test_same_as_kmp(self):
+        text_data = "ABABDABACDABABCABAB" * 5 + "барабан"
+        index = SuffixArrayIndex(text_data)
+        for pattern_data in ["ABAB", "A", "CDAB", "BABCABABA", "раба", "XYZ", text_data]:
+            self.assertEqual(index.find(pattern_data), kmp_search(text_data, pattern_data))
+            self.assertEqual(index.count(pattern_data), len(kmp_search(text_data, pattern_data)))
+            
+    def test_suffix_order(self):
+        text_data = "mississippi"
+        suffix_array = build_suffix_array([ord(c) for c in text_data])
+        self.assertEqual(suffix_array.tolist(), sorted(range(len(text_data)), key=lambda i: text_data[i:]))
+        self.assertEqual(compute_lcp_array([ord(c) for c in text_data], suffix_array).tolist(),
+                         [0, 1, 1, 4, 0, 0, 1, 0, 2, 1, 3])
+        
+    def test_edge_cases(self):
+        index = SuffixArrayIndex("")
+        self.assertEqual(index.find("A"), [])
+        self.assertEqual(index.longest_repeated_substring(), "")
+        self.assertEqual(index.distinct_substring_count(), 0)
+        index = SuffixArrayIndex("AAAA")
+        self.assertEqual(index.find(""), [])
+        self.assertEqual(index.longest_repeated_substring(), "AAA")
+        self.assertEqual(index.distinct_substring_count(), 4)
+        
+    def test_bytes_and_kinds(self):
+        index = SuffixArrayIndex(memoryview(b"\x00\xff\x00\xff"))
+        self.assertEqual(index.find(b"\x00\xff"), [0, 2])
+        with self.assertRaises(TypeError):
+            index.find("A")
+            
+    def test_save_load(self):
+        for text_data in ("барабанщик", "a\ud800a\ud800", b"abracadabra"):
+            index = SuffixArrayIndex(text_data)
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "index.npz")
+                index.save(path)
+                loaded = SuffixArrayIndex.load(path)
+            self.assertEqual(loaded.text, text_data)
+            self.assertEqual(loaded.suffix_array.tolist(), index.suffix_array.tolist())
+            self.assertEqual(loaded.lcp.tolist(), index.lcp.tolist())
+            self.assertEqual(loaded.find(text_data[1:3]), index.find(text_data[1:3]))
+
 class TestIntegration(unittest.TestCase):
     
     def test_complex_text_search(self):
@@ -0,0 +1,27 @@
+import sys
+
+_UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+def as_codes(data):
+    """
+    Текст как последовательность целых кодов.
+    
+    Байтовые данные (bytes, bytearray, memoryview, mmap) оборачиваются
+    в memoryview без копирования — элементы это значения байтов 0..255.
+    Строка один раз кодируется в UTF-32, элементы — коды символов,
+    поэтому позиции совпадают с индексами символов; одиночные суррогаты
+    (например, из os.fsdecode) кодируются как есть, а не вызывают ошибку.
+    """
+    if isinstance(data, str):
+        return memoryview(data.encode(_UTF32, errors="surrogatepass")).cast("I")
+    return memoryview(data).cast("B")
+
+def check_same_kind(text_data, pattern_data):
+    """Смешивать str и байтовые данные нельзя."""
+    if isinstance(text_data, str) != isinstance(pattern_data, str):
+        raise TypeError("Текст и паттерн должны быть оба str или оба байтовыми")
+
+def as_code_pair(text_data, pattern_data):
+    """Текст и паттерн как коды; смешивать str и байтовые данные нельзя."""
+    check_same_kind(text_data, pattern_data)
+    return as_codes(text_data), as_codes(pattern_data)
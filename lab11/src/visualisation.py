@@ -43,7 +43,7 @@ def plot_algorithm_comparison():
     ax.set_xlabel("Тип теста", fontsize=12)
     ax.set_ylabel("Время (микросекунды)", fontsize=12)
     ax.set_title("Сравнение алгоритмов поиска", fontsize=14, fontweight='bold')
-    ax.set_xticks([p + bar_width * 1.5 for p in x_positions])
+    ax.set_xticks([p + bar_width * (len(algorithms_list) - 1) / 2 for p in x_positions])
     ax.set_xticklabels([name[:20] for name in test_names], rotation=45, ha='right')
     ax.legend()
     ax.grid(True, alpha=0.3)
@@ -141,12 +141,12 @@ def plot_worst_case_analysis():
         return
     
     test_cases = list(worst_case_data.keys())
-    algorithms_list = ["KMP", "Z-алгоритм", "Бойер-Мур", "Рабин-Карп"]
+    algorithms_list = ["KMP", "Z-алгоритм", "Бойер-Мур", "Бойер-Мур (полный)", "Хорспул", "Санди", "Рабин-Карп"]
     
     fig, ax = plt.subplots(figsize=(14, 6))
     
     x_positions = range(len(test_cases))
-    bar_width = 0.2
+    bar_width = 0.8 / len(algorithms_list)
     
     for idx, algo_name in enumerate(algorithms_list):
         times_data = []
@@ -159,7 +159,7 @@ def plot_worst_case_analysis():
     ax.set_xlabel("Тестовый сценарий", fontsize=12)
     ax.set_ylabel("Время (микросекунды)", fontsize=12)
     ax.set_title("Анализ неудачных случаев", fontsize=14, fontweight='bold')
-    ax.set_xticks([p + bar_width * 1.5 for p in x_positions])
+    ax.set_xticks([p + bar_width * (len(algorithms_list) - 1) / 2 for p in x_positions])
     ax.set_xticklabels(test_cases, rotation=45, ha='right')
     ax.legend()
     ax.grid(True, alpha=0.3, axis='y')
@@ -169,6 +169,78 @@ def plot_worst_case_analysis():
     print("Сохранён график: 04_worst_case_analysis.png")
     plt.close()
 
+def plot_alphabet_size_influence():
+    """Время семейства Бойера-Мура и KMP в зависимости от размера алфавита."""
+    
+    try:
+        with open("benchmark_results.json", "r", encoding="utf-8") as f:
+            results_data = json.load(f)
+    except FileNotFoundError:
+        return
+    
+    alphabet_data = results_data.get("alphabet_size_impact", {})
+    
+    if not alphabet_data:
+        return
+    
+    alphabet_sizes = sorted([int(k) for k in alphabet_data.keys()])
+    algorithms_list = list(alphabet_data[str(alphabet_sizes[0])].keys())
+    
+    fig, ax = plt.subplots(figsize=(12, 7))
+    
+    for algo_name in algorithms_list:
+        times_data = [alphabet_data[str(size)].get(algo_name, 0) / 1000 for size in alphabet_sizes]
+        ax.plot(alphabet_sizes, times_data, marker='o', linewidth=2, markersize=8, label=algo_name)
+    
+    ax.set_xlabel("Размер алфавита |Σ|", fontsize=12)
+    ax.set_ylabel("Время (миллисекунды)", fontsize=12)
+    ax.set_title("Влияние размера алфавита на скорость поиска", fontsize=14, fontweight='bold')
+    ax.legend(fontsize=11)
+    ax.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig("08_alphabet_size.png", dpi=150)
+    print("Сохранён график: 08_alphabet_size.png")
+    plt.close()
+
+def plot_multi_pattern_scaling():
+    """Время поиска k шаблонов: Рабин-Карп по каждому против Ахо-Корасик."""
+    
+    try:
+        with open("benchmark_results.json", "r", encoding="utf-8") as f:
+            results_data = json.load(f)
+    except FileNotFoundError:
+        return
+    
+    multi_data = results_data.get("multi_pattern", {})
+    
+    if not multi_data:
+        return
+    
+    pattern_counts = sorted([int(k) for k in multi_data.keys()])
+    
+    fig, ax = plt.subplots(figsize=(12, 7))
+    
+    algorithms_list = ["Рабин-Карп (по шаблону)", "Ахо-Корасик"]
+    
+    for algo_name in algorithms_list:
+        times_data = [multi_data[str(count)].get(algo_name, 0) / 1000 for count in pattern_counts]
+        ax.plot(pattern_counts, times_data, marker='o', linewidth=2, markersize=8, label=algo_name)
+    
+    ax.set_xlabel("Число шаблонов k", fontsize=12)
+    ax.set_ylabel("Время (миллисекунды)", fontsize=12)
+    ax.set_title("Поиск множества шаблонов", fontsize=14, fontweight='bold')
+    ax.legend(fontsize=11)
+    ax.grid(True, alpha=0.3)
+    
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    
+    plt.tight_layout()
+    plt.savefig("07_multi_pattern.png", dpi=150)
+    print("Сохранён график: 07_multi_pattern.png")
+    plt.close()
+
 def visualize_prefix_function():
     """Визуализация префикс-функции."""
     
@@ -339,7 +411,7 @@ def create_summary_visualization():
       → Используйте Бойера-Мура
     
     • Поиск нескольких шаблонов сразу
-      → Используйте Рабина-Карпа
+      → Используйте Ахо-Корасик
     
     • Требования реального времени
       → Используйте Бойера-Мура
@@ -374,6 +446,12 @@ if __name__ == "__main__":
     print("\nСоздание графика анализа неудачных случаев...")
     plot_worst_case_analysis()
     
+    print("\nСоздание графика влияния размера алфавита...")
+    plot_alphabet_size_influence()
+    
+    print("\nСоздание графика поиска множества шаблонов...")
+    plot_multi_pattern_scaling()
+    
     print("\nСоздание визуализации префикс-функции...")
     visualize_prefix_function()
     
@@ -1,3 +1,5 @@
+from text_codes import as_code_pair
+
 def compute_z_function(input_string: str) -> list[int]:
     """
     Вычисление Z-функции для строки.
@@ -85,6 +87,14 @@ def compute_z_function_verbose(input_string: str) -> tuple[list[int], list[str]]
 def z_search(text_data: str, pattern_data: str) -> list[int]:
     """
     Поиск паттерна с использованием Z-функции.
+    Принимает str или байтовые данные (bytes, bytearray, memoryview, mmap).
+    
+    Z-функция считается только для паттерна, а текст проходится тем же
+    окном [left, right): без склейки «паттерн + разделитель + текст»,
+    поэтому разделитель не может совпасть с символом или байтом текста.
+    
+    Сложность: O(n + m)
+    Память: O(m)
     """
     if not pattern_data or not text_data:
         return []
@@ -95,13 +105,20 @@ def z_search(text_data: str, pattern_data: str) -> list[int]:
     if m > n:
         return []
     
-    combined_string = pattern_data + "#" + text_data
-    z_result = compute_z_function(combined_string)
+    text_codes, pattern_codes = as_code_pair(text_data, pattern_data)
+    z_pattern = compute_z_function(pattern_codes)
     
     matches_list = []
-    for i in range(m + 1, len(combined_string)):
-        if z_result[i] == m:
-            matches_list.append(i - m - 1)
+    left_idx, right_idx = 0, 0
+    for i in range(n - m + 1):
+        # Внутри окна text[left:right] == pattern[:right - left]
+        length = min(z_pattern[i - left_idx], right_idx - i) if i < right_idx else 0
+        while length < m and text_codes[i + length] == pattern_codes[length]:
+            length += 1
+        if i + length > right_idx:
+            left_idx, right_idx = i, i + length
+        if length == m:
+            matches_list.append(i)
     
     return matches_list
 
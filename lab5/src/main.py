@@ -1,7 +1,7 @@
 from modules.hash_functions import HashFunction, sum_hash, poly_hash, djb2_hash
 from modules.hash_table_chaining import HashTableChaining
 from modules.hash_table_open_addressing import OpenAddressingHashTable
-from modules import performance_analysis, plot_generator
+from modules import performance_analysis, plot_generator, hash_analytics
 
 def demo_hash_tables():
     print("=== Демонстрация работы HashTableChaining ===")
@@ -39,9 +39,74 @@ def demo_performance_analysis():
             print(f"    OpenAddressing: insert={timings['open_addressing']['insert_time']:.6f}s, "
                   f"get={timings['open_addressing']['get_time']:.6f}s, "
                   f"delete={timings['open_addressing']['delete_time']:.6f}s")
+            robin_hood = timings['robin_hood']
+            print(f"    RobinHood: insert={robin_hood['insert_time']:.6f}s, "
+                  f"get={robin_hood['get_time']:.6f}s, "
+                  f"delete={robin_hood['delete_time']:.6f}s, "
+                  f"max_probe={robin_hood['probe_stats']['max_probe']}, "
+                  f"mean_probe={robin_hood['probe_stats']['mean_probe']:.2f}")
+            cuckoo = timings['cuckoo']
+            print(f"    Cuckoo: insert={cuckoo['insert_time']:.6f}s, "
+                  f"get={cuckoo['get_time']:.6f}s, "
+                  f"delete={cuckoo['delete_time']:.6f}s")
+    return results
+
+def demo_insert_latency():
+    print("\n=== Задержка вставки: обычное и постепенное перехеширование ===")
+    results = performance_analysis.compare_incremental_resize()
+    for label, stats in results.items():
+        print(f"  {label}: p50={stats['p50'] / 1e3:.1f}мкс, p99={stats['p99'] / 1e3:.1f}мкс, "
+              f"p99.9={stats['p999'] / 1e3:.1f}мкс, max={stats['max'] / 1e6:.2f}мс, "
+              f"всего={stats['total_time']:.3f}s")
+    return results
+
+def demo_chaining_storage():
+    print("\n=== Метод цепочек: узлы против плоских массивов ===")
+    results = performance_analysis.compare_chaining_storage()
+    for name, stats in results.items():
+        print(f"  {name}: {stats['bytes_per_entry']:.1f} байт/запись, "
+              f"insert={stats['insert_ops_per_sec']:.0f} оп/с, get={stats['get_ops_per_sec']:.0f} оп/с")
+    return results
+
+def demo_bulk_load():
+    print("\n=== Пакетные операции (hash_many) ===")
+    results = performance_analysis.compare_bulk_load()
+    for name, stats in results.items():
+        print(f"  {name}: insert={stats['insert_time']:.3f}s, insert_many={stats['insert_many_time']:.3f}s, "
+              f"get={stats['get_time']:.3f}s, get_many={stats['get_many_time']:.3f}s")
+    return results
+
+def demo_hash_quality():
+    print("\n=== Качество хеш-функций ===")
+    df = hash_analytics.to_dataframe(hash_analytics.collect_stats(performance_analysis.HASH_FUNCTIONS))
+    columns = ['distribution', 'hash_function', 'table', 'resizes', 'chi2_ratio', 'max_bucket', 'mean_probe', 'max_probe']
+    print(df[columns].to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+    return df
+
+def demo_persistent_table():
+    print("\n=== Персистентная таблица (mmap) ===")
+    stats = performance_analysis.compare_persistent_table()
+    print(f"  Файл: {stats['file_size'] / 2**20:.1f} МБ, построение {stats['build_time']:.3f}s")
+    print(f"  Старт: перестройка в памяти {stats['rebuild_time']:.3f}s, открытие mmap {stats['open_time'] * 1e3:.3f}мс")
+    print(f"  get: в памяти {stats['get_ops_per_sec']:.0f} оп/с, mmap {stats['mmap_get_ops_per_sec']:.0f} оп/с")
+    return stats
+
+def demo_concurrent_tables():
+    print("\n=== Многопоточный доступ: общая блокировка против разделённых ===")
+    results = performance_analysis.compare_concurrent_tables()
+    print(f"  GIL включён: {results.pop('gil_enabled')}")
+    for label, throughput in results.items():
+        row = ", ".join(f"{n} поток.: {ops:.0f} оп/с" for n, ops in throughput.items())
+        print(f"  {label}: {row}")
     return results
 
 if __name__ == "__main__":
     demo_hash_tables()
     demo_performance_analysis()
     plot_generator.generate_all_plots(demo_performance_analysis())
+    plot_generator.plot_insert_latency(demo_insert_latency())
+    demo_chaining_storage()
+    demo_bulk_load()
+    plot_generator.plot_hash_quality(demo_hash_quality())
+    demo_persistent_table()
+    demo_concurrent_tables()
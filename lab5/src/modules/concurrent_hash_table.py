@@ -0,0 +1,119 @@
+import threading
+from typing import Any, List, Tuple
+from modules.hash_functions import HashFunction
+from modules.hash_table_chaining import _Node
+
+
+class ConcurrentHashTableChaining:
+    """Потокобезопасный метод цепочек с разделением блокировок (lock striping).
+
+    Бакеты разбиты на num_stripes непрерывных диапазонов, у каждого своя
+    блокировка: записи в разные диапазоны идут параллельно. Бакет — кортеж
+    узлов; запись заменяет его новым кортежем (copy-on-write), поэтому
+    get читает без блокировок и видит либо старую, либо новую цепочку
+    целиком — это верно и для сборок CPython без GIL.
+
+    Перестройка захватывает все блокировки по порядку и подменяет массив
+    бакетов одной ссылкой. Писатель, захвативший блокировку старого
+    массива, замечает подмену и повторяет попытку. Таблица только растёт:
+    сжатие при удалении потребовало бы той же координации на каждом delete.
+
+    Временная сложность операций:
+    - average: insert/get/delete — O(1)
+    - worst: insert/get/delete — O(n)
+    """
+
+    def __init__(self, initial_capacity: int = 11, hash_fn: HashFunction = None, num_stripes: int = 16):
+        self._buckets: List[Tuple[_Node, ...]] = [()] * initial_capacity
+        self._locks = [threading.Lock() for _ in range(num_stripes)]
+        # Число ключей по диапазонам: меняется только под своей блокировкой
+        self._counts = [0] * num_stripes
+        self._hash_fn = hash_fn or HashFunction(lambda k: sum(ord(c) for c in k), "sum_hash")
+
+    @property
+    def size(self):
+        return sum(self._counts)
+
+    def capacity(self):
+        return len(self._buckets)
+
+    def _stripe(self, idx: int, capacity: int) -> int:
+        return idx * len(self._locks) // capacity
+
+    def _locked_bucket(self, h: int):
+        """Захватить блокировку диапазона бакета h; вернуть (бакеты, индекс, диапазон)."""
+        while True:
+            buckets = self._buckets
+            idx = h % len(buckets)
+            stripe = self._stripe(idx, len(buckets))
+            self._locks[stripe].acquire()
+            if buckets is self._buckets:
+                return buckets, idx, stripe
+            # Пока ждали, таблицу перестроили — индекс устарел
+            self._locks[stripe].release()
+
+    def insert(self, key: str, value: Any) -> None:
+        h = self._hash_fn(key)
+        buckets, idx, stripe = self._locked_bucket(h)
+        try:
+            bucket = buckets[idx]
+            for node in bucket:
+                if node.key == key:
+                    node.value = value
+                    return
+            buckets[idx] = bucket + (_Node(key, value, h),)
+            self._counts[stripe] += 1
+        finally:
+            self._locks[stripe].release()
+
+        if self.size / len(buckets) > 0.75:
+            self._resize(len(buckets))
+
+    def get(self, key: str):
+        h = self._hash_fn(key)
+        buckets = self._buckets
+        for node in buckets[h % len(buckets)]:
+            if node.key == key:
+                return node.value
+        return None
+
+    def delete(self, key: str) -> bool:
+        h = self._hash_fn(key)
+        buckets, idx, stripe = self._locked_bucket(h)
+        try:
+            bucket = buckets[idx]
+            for i, node in enumerate(bucket):
+                if node.key == key:
+                    buckets[idx] = bucket[:i] + bucket[i + 1:]
+                    self._counts[stripe] -= 1
+                    return True
+            return False
+        finally:
+            self._locks[stripe].release()
+
+    def _resize(self, seen_capacity: int) -> None:
+        """Рост вдвое под всеми блокировками (если другой поток ещё не перестроил)."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            old = self._buckets
+            if len(old) != seen_capacity or sum(self._counts) / len(old) <= 0.75:
+                return
+
+            new_capacity = len(old) * 2 + 1
+            chains = [[] for _ in range(new_capacity)]
+            for bucket in old:
+                for node in bucket:
+                    chains[node.hash % new_capacity].append(node)
+
+            counts = [0] * len(self._locks)
+            for idx, chain in enumerate(chains):
+                counts[self._stripe(idx, new_capacity)] += len(chain)
+            self._counts = counts
+            self._buckets = [tuple(chain) for chain in chains]
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
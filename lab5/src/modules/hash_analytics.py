@@ -0,0 +1,137 @@
+"""Аналитика качества хеширования для таблиц lab5.
+
+Распределения снимаются с уже заполненной таблицы по сохранённым хешам,
+поэтому хеш-функция повторно не вызывается. Во время самих операций
+таблица ведёт только счётчик перестроек, и то при instrumented=True.
+"""
+import itertools
+import random
+import string
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from modules.hash_functions import HashFunction
+from modules.hash_table_chaining import HashTableChaining, CompactHashTableChaining
+from modules.hash_table_open_addressing import OpenAddressingHashTable
+
+
+def _sequential_keys(n: int) -> List[str]:
+    return [f"key_{i}" for i in range(n)]
+
+def _random_keys(n: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits
+    return [''.join(rng.choices(alphabet, k=rng.randint(6, 12))) for _ in range(n)]
+
+def _anagram_keys(n: int) -> List[str]:
+    """Перестановки одних и тех же букв: у sum_hash все они совпадают."""
+    return [''.join(p) for p in itertools.islice(itertools.permutations("abcdefghij"), n)]
+
+KEY_DISTRIBUTIONS = {
+    "sequential": _sequential_keys,
+    "random": _random_keys,
+    "anagrams": _anagram_keys,
+}
+
+
+def live_hashes(ht) -> List[int]:
+    """Хеши всех живых ключей таблицы."""
+    if isinstance(ht, OpenAddressingHashTable):
+        return [h for _, _, h in ht._entries()]
+    if isinstance(ht, CompactHashTableChaining):
+        return [h for k, h in zip(ht._keys, ht._hashes) if k is not None]
+
+    buckets = list(ht._buckets)
+    if ht._old_buckets is not None:
+        buckets += ht._old_buckets
+    return [node.hash for bucket in buckets for node in bucket]
+
+def home_counts(ht) -> List[int]:
+    """Число ключей, чей домашний индекс (хеш по модулю ёмкости) равен i."""
+    counts = [0] * ht.capacity()
+    for h in live_hashes(ht):
+        counts[h % len(counts)] += 1
+    return counts
+
+def bucket_length_histogram(ht) -> Dict[int, int]:
+    """Длина цепочки (число ключей с общим домашним индексом) → число бакетов."""
+    return dict(sorted(Counter(home_counts(ht)).items()))
+
+def probe_length_histogram(ht) -> Dict[int, int]:
+    """Число сравнений при успешном поиске → число ключей.
+
+    Для открытой адресации — длина последовательности проб до ключа,
+    для цепочек — позиция ключа в цепочке.
+    """
+    if isinstance(ht, OpenAddressingHashTable):
+        lengths = [ht._probe_length(i) for i, k in enumerate(ht._keys)
+                   if k is not None and k is not ht._deleted]
+    else:
+        lengths = [position for length in home_counts(ht) for position in range(1, length + 1)]
+    return dict(sorted(Counter(lengths).items()))
+
+def chi_squared(ht) -> Tuple[float, int]:
+    """Статистика χ² равномерности домашних индексов и число степеней свободы.
+
+    При равномерном хешировании χ² / dof ≈ 1, заметно большее значение
+    означает скопления ключей в отдельных бакетах.
+    """
+    counts = home_counts(ht)
+    n, m = sum(counts), len(counts)
+    if n == 0:
+        return 0.0, m - 1
+    expected = n / m
+    return sum((c - expected) ** 2 for c in counts) / expected, m - 1
+
+def table_stats(ht) -> dict:
+    """Сводка по заполненной таблице: χ², длины цепочек и проб, перестройки."""
+    chi2, dof = chi_squared(ht)
+    buckets = bucket_length_histogram(ht)
+    probes = probe_length_histogram(ht)
+    probed = sum(probes.values())
+    return {
+        "size": ht.size,
+        "capacity": ht.capacity(),
+        "resizes": ht.resize_count,
+        "chi2": chi2,
+        "dof": dof,
+        "chi2_ratio": chi2 / dof if dof else 0.0,
+        "max_bucket": max(buckets),
+        "empty_buckets": buckets.get(0, 0) / ht.capacity(),
+        "max_probe": max(probes, default=0),
+        "mean_probe": sum(length * count for length, count in probes.items()) / probed if probed else 0.0,
+        "bucket_histogram": buckets,
+        "probe_histogram": probes
+    }
+
+
+TABLE_FACTORIES = {
+    "chaining": lambda hf: HashTableChaining(hash_fn=hf, instrumented=True),
+    "open_addressing": lambda hf: OpenAddressingHashTable(method='linear', hash_fn=hf, instrumented=True),
+}
+
+def collect_stats(hash_functions: List[HashFunction], num_keys: int = 2000,
+                  distributions: Dict = None, tables: Dict = None) -> List[dict]:
+    """Записи table_stats для всех сочетаний распределения ключей, хеш-функции и таблицы."""
+    distributions = distributions or KEY_DISTRIBUTIONS
+    tables = tables or TABLE_FACTORIES
+    records = []
+    for dist_name, make_keys in distributions.items():
+        keys = make_keys(num_keys)
+        for hf in hash_functions:
+            for table_name, factory in tables.items():
+                ht = factory(hf)
+                ht.insert_many(zip(keys, range(len(keys))))
+                records.append({
+                    "distribution": dist_name,
+                    "hash_function": hf.name,
+                    "table": table_name,
+                    **table_stats(ht)
+                })
+    return records
+
+def to_dataframe(records: List[dict]):
+    """Записи collect_stats в pandas.DataFrame."""
+    import pandas as pd
+
+    return pd.DataFrame.from_records(records)
@@ -1,4 +1,6 @@
-from typing import Callable
+from typing import Callable, List
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
 
 class HashFunction:
     def __init__(self, fn: Callable[[str], int], name: str = None):
@@ -9,6 +11,18 @@ class HashFunction:
     def __call__(self, key: str) -> int:
         return self.fn(key)
 
+    def hash_many(self, keys: List[str]) -> List[int]:
+        """Хеши списка ключей за один вызов.
+
+        Для sum_hash, poly_hash и djb2_hash ключи кодируются в один буфер
+        кодов символов и хешируются векторно в NumPy; результат совпадает
+        с поэлементным вызовом. Прочие функции вызываются по одному ключу.
+        """
+        batch = _BATCH_HASHERS.get(self.fn)
+        if batch is None or not keys:
+            return [self.fn(k) for k in keys]
+        return batch(keys).tolist()
+
 # 1) Простая хеш-функция: сумма кодов символов
 def sum_hash(key: str) -> int:
     s = 0
@@ -20,7 +34,7 @@ def sum_hash(key: str) -> int:
 def poly_hash(key: str, base: int = 257) -> int:
     h = 0
     for ch in key:
-        h = h * base + ord(ch)
+        h = (h * base + ord(ch)) & _MASK64 # по модулю 2^64, как djb2
     return h
 
 # 3) DJB2
@@ -29,3 +43,54 @@ def djb2_hash(key: str) -> int:
     for ch in key:
         h = ((h << 5) + h) + ord(ch) # h * 33 + c
     return h & 0xFFFFFFFFFFFFFFFF
+
+
+# Пакетное хеширование (NumPy)
+def _char_codes(keys: List[str]):
+    """Коды символов всех ключей одним буфером, длины ключей и начала ключей в буфере.
+
+    Одиночные суррогаты кодируются как есть (surrogatepass): ord() скалярных
+    функций их тоже принимает.
+    """
+    import numpy as np
+
+    codes = np.frombuffer("".join(keys).encode("utf-32-le", errors="surrogatepass"), dtype="<u4").astype(np.uint64)
+    lengths = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+    starts = np.cumsum(lengths) - lengths
+    return codes, lengths, starts
+
+def _horner_many(keys: List[str], seed: int, base: int):
+    """h = h * base + c в арифметике uint64 (по модулю 2^64).
+
+    Ключи группируются по длине: у каждой группы своя матрица
+    count × length без выравнивания по самому длинному ключу,
+    поэтому память O(суммарной длины ключей).
+    """
+    import numpy as np
+
+    codes, lengths, starts = _char_codes(keys)
+    result = np.empty(len(keys), dtype=np.uint64)
+    base_u = np.uint64(base)
+    for length in np.unique(lengths).tolist():
+        group = np.flatnonzero(lengths == length)
+        # Столбцы подряд в памяти: хеши считаются по столбцам
+        matrix = np.asfortranarray(codes[starts[group, None] + np.arange(length)])
+        h = np.full(len(group), seed, dtype=np.uint64)
+        for j in range(length):
+            h = h * base_u + matrix[:, j]
+        result[group] = h
+    return result
+
+def _sum_hash_many(keys: List[str]):
+    """Сумма кодов ключа — разность префиксных сумм по общему буферу."""
+    import numpy as np
+
+    codes, lengths, starts = _char_codes(keys)
+    prefix = np.concatenate(([np.uint64(0)], np.cumsum(codes, dtype=np.uint64)))
+    return prefix[starts + lengths] - prefix[starts]
+
+_BATCH_HASHERS = {
+    sum_hash: _sum_hash_many,
+    poly_hash: lambda keys: _horner_many(keys, 0, 257),
+    djb2_hash: lambda keys: _horner_many(keys, 5381, 33),
+}
@@ -1,10 +1,16 @@
-from typing import Any, List
+from array import array
+from typing import Any, Iterable, List, Tuple
 from modules.hash_functions import HashFunction
 
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
 class _Node:
-    def __init__(self, key: str, value: Any):
+    __slots__ = ('key', 'value', 'hash')
+
+    def __init__(self, key: str, value: Any, h: int = 0):
         self.key = key
         self.value = value
+        self.hash = h
 
 class HashTableChaining:
     """Метод цепочек c динамическим масштабированием.
@@ -12,12 +18,27 @@ class HashTableChaining:
     Временная сложность операций:
     - average: insert/get/delete — O(1)
     - worst: insert/get/delete — O(n)
+
+    incremental=True — постепенное перехеширование (как dict в Redis):
+    при росте или сжатии старый массив бакетов сохраняется, и каждая
+    операция переносит в новый не более _REHASH_STEP бакетов. Поиск
+    смотрит в обе таблицы, новые ключи попадают только в новую.
+    Так исключаются паузы O(n) внутри отдельного insert.
     """
 
-    def __init__(self, initial_capacity: int = 11, hash_fn: HashFunction = None):
+    _REHASH_STEP = 4
+
+    def __init__(self, initial_capacity: int = 11, hash_fn: HashFunction = None, incremental: bool = False,
+                 instrumented: bool = False):
         self._buckets: List[List[_Node]] = [[] for _ in range(initial_capacity)]
         self._size = 0
         self._hash_fn = hash_fn or HashFunction(lambda k: sum(ord(c) for c in k), "sum_hash")
+        # Счётчик перестроек (для modules.hash_analytics), ведётся только по флагу
+        self._instrumented = instrumented
+        self.resize_count = 0
+        self._incremental = incremental
+        self._old_buckets = None
+        self._rehash_idx = 0
 
     @property
     def size(self):
@@ -26,56 +47,252 @@ class HashTableChaining:
     def capacity(self):
         return len(self._buckets)
 
+    @property
+    def rehashing(self) -> bool:
+        return self._old_buckets is not None
+
     def _index(self, key: str) -> int:
         return self._hash_fn(key) % self.capacity()
 
-    def insert(self, key: str, value: Any) -> None:
-        idx = self._index(key)
-        bucket = self._buckets[idx]
+    def _find_node(self, key: str, h: int):
+        """Бакет и узел с ключом key (узел None, если ключа нет)."""
+        if self._old_buckets is not None:
+            bucket = self._old_buckets[h % len(self._old_buckets)]
+            for node in bucket:
+                if node.key == key:
+                    return bucket, node
 
+        bucket = self._buckets[h % len(self._buckets)]
         for node in bucket:
             if node.key == key:
-                node.value = value
-                return
+                return bucket, node
+        return bucket, None
 
-        bucket.append(_Node(key, value))
+    def insert(self, key: str, value: Any) -> None:
+        self._insert(key, value, self._hash_fn(key))
+
+    def insert_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """Вставка пар (ключ, значение); хеши считаются одним вызовом hash_many."""
+        items = list(items)
+        hashes = self._hash_fn.hash_many([key for key, _ in items])
+        for (key, value), h in zip(items, hashes):
+            self._insert(key, value, h)
+
+    def _insert(self, key: str, value: Any, h: int) -> None:
+        if self._old_buckets is not None:
+            self._rehash_step()
+
+        bucket, node = self._find_node(key, h)
+        if node is not None:
+            node.value = value
+            return
+
+        bucket.append(_Node(key, value, h))
         self._size += 1
 
         if self._size / self.capacity() > 0.75:
             self._resize(self.capacity() * 2 + 1)
 
     def get(self, key: str):
-        idx = self._index(key)
-        for node in self._buckets[idx]:
-            if node.key == key:
-                return node.value
-        return None
+        return self._get(key, self._hash_fn(key))
+
+    def get_many(self, keys: List[str]) -> List[Any]:
+        """Значения для списка ключей (None для отсутствующих)."""
+        return [self._get(key, h) for key, h in zip(keys, self._hash_fn.hash_many(keys))]
+
+    def _get(self, key: str, h: int):
+        if self._old_buckets is not None:
+            self._rehash_step()
+
+        _, node = self._find_node(key, h)
+        return node.value if node is not None else None
 
     def delete(self, key: str) -> bool:
-        idx = self._index(key)
-        bucket = self._buckets[idx]
+        if self._old_buckets is not None:
+            self._rehash_step()
 
-        for i, node in enumerate(bucket):
-            if node.key == key:
-                del bucket[i]
-                self._size -= 1
+        bucket, node = self._find_node(key, self._hash_fn(key))
+        if node is None:
+            return False
 
-                if self.capacity() > 11 and self._size / self.capacity() < 0.2:
-                    new_cap = max(11, (self.capacity() // 2) | 1)
-                    self._resize(new_cap)
+        bucket.remove(node)
+        self._size -= 1
 
-                return True
+        if self.capacity() > 11 and self._size / self.capacity() < 0.2:
+            new_cap = max(11, (self.capacity() // 2) | 1)
+            self._resize(new_cap)
 
-        return False
+        return True
 
     def _resize(self, new_capacity: int) -> None:
+        if self._instrumented:
+            self.resize_count += 1
+        if self._incremental:
+            # Новый рост не начинается, пока не закончен предыдущий перенос
+            if self._old_buckets is not None:
+                self._rehash_step(len(self._old_buckets))
+            self._old_buckets = self._buckets
+            self._buckets = [[] for _ in range(new_capacity)]
+            self._rehash_idx = 0
+            return
+
         old = self._buckets
         self._buckets = [[] for _ in range(new_capacity)]
         self._size = 0
 
         for bucket in old:
             for node in bucket:
-                self.insert(node.key, node.value)
+                self._insert(node.key, node.value, node.hash)
+
+    def _rehash_step(self, n: int = None) -> None:
+        """Перенести n непустых бакетов из старой таблицы (не более 10·n пустых подряд)."""
+        n = n or self._REHASH_STEP
+        old, new = self._old_buckets, self._buckets
+        cap = len(new)
+        empty_visits = n * 10
+
+        while n > 0 and self._rehash_idx < len(old):
+            bucket = old[self._rehash_idx]
+            self._rehash_idx += 1
+            if not bucket:
+                empty_visits -= 1
+                if empty_visits == 0:
+                    break
+                continue
+            for node in bucket:
+                new[node.hash % cap].append(node)
+            bucket.clear()
+            n -= 1
+
+        if self._rehash_idx == len(old):
+            self._old_buckets = None
+            self._rehash_idx = 0
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+class CompactHashTableChaining:
+    """Метод цепочек на параллельных плоских массивах.
+
+    Вместо объекта-узла на каждую запись цепочки хранятся в массивах
+    _keys/_values/_hashes/_next (индекс следующей записи, -1 — конец),
+    _heads[b] — индекс первой записи бакета b. Освободившиеся записи
+    связываются в список свободных через _next и используются повторно.
+    Хеш хранится в 64 битах (array 'Q'), поэтому бакет выбирается по нему.
+
+    Временная сложность операций та же, что у HashTableChaining:
+    - average: insert/get/delete — O(1)
+    - worst: insert/get/delete — O(n)
+    """
+
+    def __init__(self, initial_capacity: int = 11, hash_fn: HashFunction = None, instrumented: bool = False):
+        self._heads = array('q', [-1]) * initial_capacity
+        self._keys: List[Any] = []
+        self._values: List[Any] = []
+        self._hashes = array('Q')
+        self._next = array('q')
+        self._free = -1
+        self._size = 0
+        self._hash_fn = hash_fn or HashFunction(lambda k: sum(ord(c) for c in k), "sum_hash")
+        self._instrumented = instrumented
+        self.resize_count = 0
+
+    @property
+    def size(self):
+        return self._size
+
+    def capacity(self):
+        return len(self._heads)
+
+    def _find(self, key: str, h: int) -> int:
+        keys, hashes, nxt = self._keys, self._hashes, self._next
+        i = self._heads[h % len(self._heads)]
+        while i != -1:
+            if hashes[i] == h and keys[i] == key:
+                return i
+            i = nxt[i]
+        return -1
+
+    def insert(self, key: str, value: Any) -> None:
+        h = self._hash_fn(key) & _MASK64
+        i = self._find(key, h)
+        if i != -1:
+            self._values[i] = value
+            return
+
+        b = h % len(self._heads)
+        if self._free != -1:
+            i = self._free
+            self._free = self._next[i]
+            self._keys[i] = key
+            self._values[i] = value
+            self._hashes[i] = h
+            self._next[i] = self._heads[b]
+        else:
+            i = len(self._keys)
+            self._keys.append(key)
+            self._values.append(value)
+            self._hashes.append(h)
+            self._next.append(self._heads[b])
+        self._heads[b] = i
+        self._size += 1
+
+        if self._size / self.capacity() > 0.75:
+            self._resize(self.capacity() * 2 + 1)
+
+    def get(self, key: str):
+        i = self._find(key, self._hash_fn(key) & _MASK64)
+        return self._values[i] if i != -1 else None
+
+    def delete(self, key: str) -> bool:
+        h = self._hash_fn(key) & _MASK64
+        b = h % len(self._heads)
+        keys, hashes, nxt = self._keys, self._hashes, self._next
+
+        prev, i = -1, self._heads[b]
+        while i != -1:
+            if hashes[i] == h and keys[i] == key:
+                break
+            prev, i = i, nxt[i]
+        else:
+            return False
+
+        if prev == -1:
+            self._heads[b] = nxt[i]
+        else:
+            nxt[prev] = nxt[i]
+        keys[i] = None
+        self._values[i] = None
+        nxt[i] = self._free
+        self._free = i
+        self._size -= 1
+
+        if self.capacity() > 11 and self._size / self.capacity() < 0.2:
+            self._resize(max(11, (self.capacity() // 2) | 1))
+
+        return True
+
+    def _resize(self, new_capacity: int) -> None:
+        """Перестроить бакеты, попутно уплотнив массивы (список свободных обнуляется)."""
+        if self._instrumented:
+            self.resize_count += 1
+        live = [i for i in range(len(self._keys)) if self._keys[i] is not None]
+        keys = [self._keys[i] for i in live]
+        values = [self._values[i] for i in live]
+        hashes = array('Q', [self._hashes[i] for i in live])
+        heads = array('q', [-1]) * new_capacity
+        nxt = array('q', [-1]) * len(live)
+
+        # Хеши сохранены — хеш-функция не вызывается
+        for i, h in enumerate(hashes):
+            b = h % new_capacity
+            nxt[i] = heads[b]
+            heads[b] = i
+
+        self._keys, self._values, self._hashes = keys, values, hashes
+        self._heads, self._next = heads, nxt
+        self._free = -1
 
     def __contains__(self, key: str) -> bool:
         return self.get(key) is not None
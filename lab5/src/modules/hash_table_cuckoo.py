@@ -0,0 +1,185 @@
+import random
+from collections import Counter
+from typing import Any, List, Optional, Tuple
+from modules.hash_functions import HashFunction, djb2_hash
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _mix(x: int) -> int:
+    """Финализатор splitmix64: перемешивает все биты 64-битного слова."""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class CuckooHashTable:
+    """Кукушкино хеширование: num_tables таблиц, у ключа по одной ячейке в каждой.
+
+    Позиция в таблице i — значение hash_fn, перемешанное с сидом таблицы i
+    (splitmix64), так что размещение определяет hash_fn и не зависит
+    от PYTHONHASHSEED. Значение hash_fn хранится рядом с ключом: при
+    выталкивании и перестройке ключ заново не хешируется. Вставка в занятые
+    ячейки выталкивает жильца в другую его таблицу, не более max_kicks раз;
+    бездомный ключ уходит в небольшой stash. Если и stash полон, таблица
+    перестраивается с новыми сидами, а через раз — и с ростом ёмкости.
+
+    Ключи с одинаковым hash_fn (анаграммы у sum_hash) получают одни и те же
+    ячейки во всех таблицах, и сверх num_tables таких ключей помещается
+    только в stash. Поэтому при перестройке stash расширяется на удвоенное
+    число таких ключей: вставка не зацикливается, но поиск для плохой
+    хеш-функции вырождается в просмотр stash.
+
+    Временная сложность операций:
+    - get/delete — O(1) в худшем случае при хеш-функции без полных коллизий:
+      не более num_tables ячеек и stash_size записей stash
+    - insert — O(1) в среднем (амортизированно, с учётом перестроек)
+    """
+
+    def __init__(self, initial_capacity: int = 17, hash_fn: HashFunction = None,
+                 num_tables: int = 2, stash_size: int = 4, max_kicks: int = 100):
+        if num_tables < 2:
+            raise ValueError("Нужно хотя бы две таблицы")
+        self._num_tables = num_tables
+        self._stash_size = stash_size
+        self._stash_limit = stash_size
+        self._max_kicks = max_kicks
+        # Двум таблицам выше ~0.5 заполнения не подняться, трём и более — ~0.9
+        self._max_load = 0.45 if num_tables == 2 else 0.85
+        self._rng = random.Random(0)
+        self._hash_fn = hash_fn or HashFunction(djb2_hash)
+        self._table_capacity = max(3, -(-initial_capacity // num_tables))
+        self._reset()
+
+    def _reset(self) -> None:
+        """Пустые таблицы текущей ёмкости и новые сиды."""
+        d, cap = self._num_tables, self._table_capacity
+        self._keys: List[List[Optional[str]]] = [[None] * cap for _ in range(d)]
+        self._values: List[List[Any]] = [[None] * cap for _ in range(d)]
+        self._hashes: List[List[int]] = [[0] * cap for _ in range(d)]
+        self._stash: List[Tuple[str, Any, int]] = []
+        self._seeds = [self._rng.getrandbits(64) for _ in range(d)]
+        self._size = 0
+
+    @property
+    def size(self):
+        return self._size
+
+    def capacity(self):
+        return self._num_tables * self._table_capacity
+
+    def _slot(self, h: int, table: int) -> int:
+        return _mix((h ^ self._seeds[table]) & _MASK64) % self._table_capacity
+
+    def _find(self, key: str, h: int) -> Tuple[int, int]:
+        """(таблица, ячейка) ключа; (-1, i) — i-я запись stash; (-1, -1) — нет ключа."""
+        for t in range(self._num_tables):
+            idx = self._slot(h, t)
+            if self._hashes[t][idx] == h and self._keys[t][idx] == key:
+                return t, idx
+        for i, (k, _, stash_h) in enumerate(self._stash):
+            if stash_h == h and k == key:
+                return -1, i
+        return -1, -1
+
+    def _try_place(self, key: str, value: Any, h: int) -> Optional[Tuple[str, Any, int]]:
+        """Разместить новый ключ; вернуть запись, оставшуюся без места, или None."""
+        keys, values, hashes = self._keys, self._values, self._hashes
+        d = self._num_tables
+
+        for t in range(d):
+            idx = self._slot(h, t)
+            if keys[t][idx] is None:
+                keys[t][idx], values[t][idx], hashes[t][idx] = key, value, h
+                self._size += 1
+                return None
+
+        # Выталкивание: занимаем ячейку в случайной таблице, жилец ищет место в своих
+        t = self._rng.randrange(d)
+        for _ in range(self._max_kicks):
+            idx = self._slot(h, t)
+            keys[t][idx], key = key, keys[t][idx]
+            values[t][idx], value = value, values[t][idx]
+            hashes[t][idx], h = h, hashes[t][idx]
+
+            for other in range(d):
+                if other == t:
+                    continue
+                other_idx = self._slot(h, other)
+                if keys[other][other_idx] is None:
+                    keys[other][other_idx], values[other][other_idx], hashes[other][other_idx] = key, value, h
+                    self._size += 1
+                    return None
+
+            t = (t + 1 + self._rng.randrange(d - 1)) % d
+
+        if len(self._stash) < self._stash_limit:
+            self._stash.append((key, value, h))
+            self._size += 1
+            return None
+        return key, value, h
+
+    def _drain(self) -> List[Tuple[str, Any, int]]:
+        entries = list(self._stash)
+        for keys, values, hashes in zip(self._keys, self._values, self._hashes):
+            entries.extend((k, v, h) for k, v, h in zip(keys, values, hashes) if k is not None)
+        return entries
+
+    def _rehash(self, homeless: Tuple[str, Any, int], grow: bool) -> None:
+        """Перестроить таблицу с новыми сидами (чередуя с ростом), пока все ключи не разместятся."""
+        entries = self._drain() + [homeless]
+        # Ключи с одинаковым хешем сверх числа таблиц могут жить только в stash
+        same_hash = Counter(h for _, _, h in entries)
+        overflow = sum(c - self._num_tables for c in same_hash.values() if c > self._num_tables)
+        self._stash_limit = self._stash_size + 2 * overflow
+        attempt = 0
+        while True:
+            if grow or attempt % 2 == 1:
+                self._table_capacity = self._table_capacity * 2 + 1
+                grow = False
+            self._reset()
+            failed = [lo for lo in (self._try_place(*e) for e in entries) if lo is not None]
+            if not failed:
+                return
+            entries = self._drain() + failed
+            attempt += 1
+
+    def insert(self, key: str, value: Any) -> None:
+        h = self._hash_fn(key)
+        t, idx = self._find(key, h)
+        if t != -1:
+            self._values[t][idx] = value
+            return
+        if idx != -1:
+            self._stash[idx] = (key, value, h)
+            return
+
+        if self._size + 1 > self._max_load * self.capacity():
+            self._rehash((key, value, h), grow=True)
+            return
+
+        homeless = self._try_place(key, value, h)
+        if homeless is not None:
+            self._rehash(homeless, grow=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        t, idx = self._find(key, self._hash_fn(key))
+        if t != -1:
+            return self._values[t][idx]
+        return self._stash[idx][1] if idx != -1 else None
+
+    def delete(self, key: str) -> bool:
+        t, idx = self._find(key, self._hash_fn(key))
+        if t != -1:
+            self._keys[t][idx] = None
+            self._values[t][idx] = None
+            self._hashes[t][idx] = 0
+        elif idx != -1:
+            del self._stash[idx]
+        else:
+            return False
+        self._size -= 1
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
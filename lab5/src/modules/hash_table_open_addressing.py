@@ -1,25 +1,62 @@
-from typing import Any, Optional
+from typing import Any, Iterable, List, Optional, Tuple
 from modules.hash_functions import HashFunction
 
 class _Deleted:
     pass
 
 class OpenAddressingHashTable:
-    """Открытая адресация: поддержка линейного пробирования и двойного хеширования.
+    """Открытая адресация: линейное пробирование, двойное хеширование и Robin Hood.
 
     Временная сложность операций:
     - average: insert/get/delete — O(1) (при низкой нагрузке и хорошем хешировании)
     - worst: insert/get/delete — O(n)
+
+    Хеш ключа вычисляется один раз за операцию и хранится рядом
+    с ключом: при пробировании строки сравниваются только при
+    совпадении полных хешей, а _resize не вызывает хеш-функцию.
+
+    method='robin_hood' — линейное пробирование, при котором вставка
+    вытесняет ключ, находящийся ближе к своей домашней ячейке
+    (выравнивание длин проб). Удаление сдвигает следующие ключи назад,
+    поэтому маркеры удаления не нужны, а допустимая загрузка выше (0.9).
+
+    В остальных режимах число удалённых ячеек учитывается: когда живые
+    ключи вместе с ними занимают больше max_load таблицы, она
+    перестраивается (с ростом, только если велика живая загрузка), а при
+    загрузке ниже 0.15 сжимается вдвое. Поэтому в таблице всегда есть
+    пустые ячейки и промах не сканирует её целиком.
+
+    incremental=True — постепенное перехеширование: старые массивы
+    сохраняются, и каждая операция переносит из них не более
+    _REHASH_STEP живых ключей. Перенесённые ячейки старой таблицы
+    помечаются удалёнными, чтобы не рвать цепочки проб оставшихся ключей.
     """
 
-    def __init__(self, initial_capacity: int = 17, method: str = 'linear', hash_fn: HashFunction = None):
+    _MIN_CAPACITY = 17
+    _REHASH_STEP = 4
+
+    def __init__(self, initial_capacity: int = 17, method: str = 'linear', hash_fn: HashFunction = None,
+                 incremental: bool = False, instrumented: bool = False):
         self._capacity = initial_capacity
         self._keys = [None] * self._capacity
         self._values = [None] * self._capacity
+        self._hashes = [0] * self._capacity
         self._size = 0
+        self._tombstones = 0
         self._deleted = _Deleted()
         self._method = method
+        self._max_load = 0.9 if method == 'robin_hood' else 0.6
+        self._min_load = 0.15
         self._hash_fn = hash_fn or HashFunction(lambda k: sum(ord(c) for c in k), "sum_hash")
+        self._incremental = incremental
+        self._old_keys = None
+        self._old_values = None
+        self._old_hashes = None
+        self._rehash_idx = 0
+        self._rehash_start = 0
+        # Счётчик перестроек (для modules.hash_analytics), ведётся только по флагу
+        self._instrumented = instrumented
+        self.resize_count = 0
 
     @property
     def size(self):
@@ -28,76 +65,323 @@ class OpenAddressingHashTable:
     def capacity(self):
         return self._capacity
 
+    @property
+    def rehashing(self) -> bool:
+        return self._old_keys is not None
+
+    def _entries(self):
+        """Живые (ключ, значение, хеш) из текущей и старой таблиц."""
+        deleted = self._deleted
+        tables = [(self._keys, self._values, self._hashes)]
+        if self._old_keys is not None:
+            tables.append((self._old_keys, self._old_values, self._old_hashes))
+        for keys, values, hashes in tables:
+            for k, v, h in zip(keys, values, hashes):
+                if k is not None and k is not deleted:
+                    yield k, v, h
+
     def _resize(self, new_capacity: int) -> None:
-        old_keys = self._keys
-        old_values = self._values
+        if self._incremental:
+            if self._instrumented:
+                self.resize_count += 1
+            if self._old_keys is not None:
+                self._rehash_step(len(self._old_keys))
+            self._old_keys, self._old_values, self._old_hashes = self._keys, self._values, self._hashes
+            self._rehash_idx = 0
+            # Обход начинается с пустой ячейки — на границе кластера
+            self._rehash_start = self._keys.index(None) if None in self._keys else 0
+            self._capacity = new_capacity
+            self._keys = [None] * self._capacity
+            self._values = [None] * self._capacity
+            self._hashes = [0] * self._capacity
+            self._tombstones = 0
+            return
+        self._rebuild(new_capacity)
+
+    def _rebuild(self, new_capacity: int) -> None:
+        """Синхронная перестройка: все живые ключи (из обеих таблиц) в новый массив."""
+        if self._instrumented:
+            self.resize_count += 1
+        entries = list(self._entries())
+        self._old_keys = self._old_values = self._old_hashes = None
 
         self._capacity = new_capacity
         self._keys = [None] * self._capacity
         self._values = [None] * self._capacity
+        self._hashes = [0] * self._capacity
         self._size = 0
+        self._tombstones = 0
 
-        for k, v in zip(old_keys, old_values):
-            if k is not None and k is not self._deleted:
-                self.insert(k, v)
+        # Сохранённые хеши позволяют не пересчитывать хеш-функцию
+        for k, v, h in entries:
+            self._place(k, v, h)
 
+    def _rehash_step(self, n: int = None) -> None:
+        """Перенести n живых ключей из старой таблицы (не более 10·n пустых ячеек подряд)."""
+        n = n or self._REHASH_STEP
+        keys, values, hashes = self._old_keys, self._old_values, self._old_hashes
+        cap = len(keys)
+        deleted = self._deleted
+        empty_visits = n * 10
+        # При линейных пробах кластер переносится целиком и очищается:
+        # промах в старой таблице обрывается на уже перенесённом участке.
+        # При двойном хешировании пути проб не непрерывны — ставим маркеры.
+        whole_clusters = self._method != 'double'
 
-    def _probe(self, key: str, i: int) -> int:
-        h1 = self._hash_fn(key) % self._capacity
-        if self._method == 'linear':
-            return (h1 + i) % self._capacity
-        elif self._method == 'double':
-            h2 = 1 + (self._hash_fn(key) % (self._capacity - 1))
-            return (h1 + i * h2) % self._capacity
-        else:
-            return (h1 + i) % self._capacity
+        # Цикл прерывается, если _place перестроил таблицу целиком
+        while self._old_keys is keys and self._rehash_idx < cap:
+            idx = (self._rehash_start + self._rehash_idx) % cap
+            k = keys[idx]
+            at_boundary = k is None or not whole_clusters
+            if n <= 0 and at_boundary:
+                break
+            self._rehash_idx += 1
+
+            if k is None or k is deleted:
+                if whole_clusters:
+                    keys[idx] = None
+                empty_visits -= 1
+                if empty_visits <= 0 and at_boundary:
+                    break
+                continue
+
+            keys[idx] = None if whole_clusters else deleted
+            self._size -= 1
+            self._place(k, values[idx], hashes[idx])
+            values[idx] = None
+            n -= 1
 
-    def _find_slot(self, key: str) -> int:
-        for i in range(self._capacity):
-            idx = self._probe(key, i)
-            k = self._keys[idx]
-            if k is None or k is self._deleted or k == key:
+        if self._old_keys is keys and self._rehash_idx == cap:
+            self._old_keys = self._old_values = self._old_hashes = None
+            self._rehash_idx = 0
+
+    def _find_old(self, key: str, h: int) -> int:
+        """Индекс key в старой таблице или -1 (перенесённые ячейки — удалённые)."""
+        keys, hashes, deleted = self._old_keys, self._old_hashes, self._deleted
+        cap = len(keys)
+        idx = h % cap
+        step = 1 + h % (cap - 1) if self._method == 'double' else 1
+        for _ in range(cap):
+            k = keys[idx]
+            if k is None:
+                return -1
+            if k is not deleted and hashes[idx] == h and k == key:
                 return idx
+            idx = (idx + step) % cap
         return -1
 
-    def insert(self, key: str, value: Any) -> None:
-        if self._size / self._capacity > 0.6:
-            self._resize(self._capacity * 2 + 1)
+    def _probe_start(self, h: int):
+        """Начальный индекс и шаг пробирования для полного хеша h."""
+        if self._method == 'double':
+            return h % self._capacity, 1 + h % (self._capacity - 1)
+        return h % self._capacity, 1
+
+    def _find_slot(self, key: str, h: int) -> int:
+        """Ячейка с ключом key, иначе первая свободная или удалённая на пути."""
+        idx, step = self._probe_start(h)
+        keys, hashes, deleted = self._keys, self._hashes, self._deleted
+        first_deleted = -1
+        for _ in range(self._capacity):
+            k = keys[idx]
+            if k is None:
+                return first_deleted if first_deleted != -1 else idx
+            if k is deleted:
+                if first_deleted == -1:
+                    first_deleted = idx
+            elif hashes[idx] == h and k == key:
+                return idx
+            idx = (idx + step) % self._capacity
+        return first_deleted
+
+    def _find_key(self, key: str, h: int) -> int:
+        idx, step = self._probe_start(h)
+        keys, hashes, deleted = self._keys, self._hashes, self._deleted
+        for _ in range(self._capacity):
+            k = keys[idx]
+            if k is None:
+                return -1
+            if k is not deleted and hashes[idx] == h and k == key:
+                return idx
+            idx = (idx + step) % self._capacity
+        return -1
 
-        slot = self._find_slot(key)
+    def _place(self, key: str, value: Any, h: int) -> None:
+        if self._method == 'robin_hood':
+            self._robin_hood_place(key, value, h)
+            return
+
+        slot = self._find_slot(key, h)
         if slot == -1:
+            # Последовательность проб не нашла места — увеличиваем таблицу
+            self._rebuild(self._capacity * 2 + 1)
+            self._place(key, value, h)
             return
 
         if self._keys[slot] is None or self._keys[slot] is self._deleted:
+            if self._keys[slot] is self._deleted:
+                self._tombstones -= 1
             self._keys[slot] = key
             self._values[slot] = value
+            self._hashes[slot] = h
             self._size += 1
         else:
             self._values[slot] = value
 
-    def get(self, key: str) -> Optional[Any]:
-        for i in range(self._capacity):
-            idx = self._probe(key, i)
-            k = self._keys[idx]
+    def _robin_hood_place(self, key: str, value: Any, h: int) -> None:
+        cap = self._capacity
+        keys, values, hashes = self._keys, self._values, self._hashes
+        idx = h % cap
+        dist = 0
+
+        for _ in range(cap):
+            k = keys[idx]
             if k is None:
-                return None
-            if k is self._deleted:
-                continue
-            if k == key:
-                return self._values[idx]
-        return None
+                keys[idx], values[idx], hashes[idx] = key, value, h
+                self._size += 1
+                return
+            if hashes[idx] == h and k == key:
+                values[idx] = value
+                return
+
+            resident_dist = (idx - hashes[idx]) % cap
+            if resident_dist < dist:
+                # Забираем ячейку у «богатого» ключа и несём его дальше
+                keys[idx], key = key, k
+                values[idx], value = value, values[idx]
+                hashes[idx], h = h, hashes[idx]
+                dist = resident_dist
+
+            idx = (idx + 1) % cap
+            dist += 1
+
+    def _robin_hood_find(self, key: str, h: int) -> int:
+        cap = self._capacity
+        keys, hashes = self._keys, self._hashes
+        idx = h % cap
+
+        for dist in range(cap):
+            k = keys[idx]
+            if k is None or (idx - hashes[idx]) % cap < dist:
+                return -1
+            if hashes[idx] == h and k == key:
+                return idx
+            idx = (idx + 1) % cap
+        return -1
+
+    def _robin_hood_delete(self, idx: int) -> None:
+        """Удаление обратным сдвигом: ключи хвоста кластера сдвигаются на шаг назад."""
+        cap = self._capacity
+        keys, values, hashes = self._keys, self._values, self._hashes
+        nxt = (idx + 1) % cap
+
+        while keys[nxt] is not None and (nxt - hashes[nxt]) % cap > 0:
+            keys[idx], values[idx], hashes[idx] = keys[nxt], values[nxt], hashes[nxt]
+            idx = nxt
+            nxt = (nxt + 1) % cap
+
+        keys[idx] = None
+        values[idx] = None
+        hashes[idx] = 0
+
+    @property
+    def tombstones(self):
+        return self._tombstones
+
+    def insert(self, key: str, value: Any) -> None:
+        self._insert(key, value, self._hash_fn(key))
+
+    def insert_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """Вставка пар (ключ, значение); хеши считаются одним вызовом hash_many."""
+        items = list(items)
+        hashes = self._hash_fn.hash_many([key for key, _ in items])
+        for (key, value), h in zip(items, hashes):
+            self._insert(key, value, h)
+
+    def _insert(self, key: str, value: Any, h: int) -> None:
+        # Удалённые ячейки тоже занимают место в цепочках проб
+        if (self._size + self._tombstones) / self._capacity > self._max_load:
+            if self._size / self._capacity > self._max_load / 2:
+                self._resize(self._capacity * 2 + 1)
+            else:
+                self._resize(self._capacity)
+
+        if self._old_keys is not None:
+            self._rehash_step()
+            if self._old_keys is not None:
+                old_idx = self._find_old(key, h)
+                if old_idx != -1:
+                    self._old_values[old_idx] = value
+                    return
+
+        self._place(key, value, h)
+
+    def _lookup(self, key: str, h: int) -> int:
+        if self._method == 'robin_hood':
+            return self._robin_hood_find(key, h)
+        return self._find_key(key, h)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._get(key, self._hash_fn(key))
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Значения для списка ключей (None для отсутствующих)."""
+        return [self._get(key, h) for key, h in zip(keys, self._hash_fn.hash_many(keys))]
+
+    def _get(self, key: str, h: int) -> Optional[Any]:
+        if self._old_keys is not None:
+            self._rehash_step()
+            if self._old_keys is not None:
+                old_idx = self._find_old(key, h)
+                if old_idx != -1:
+                    return self._old_values[old_idx]
+
+        idx = self._lookup(key, h)
+        return self._values[idx] if idx != -1 else None
 
     def delete(self, key: str) -> bool:
-        for i in range(self._capacity):
-            idx = self._probe(key, i)
-            k = self._keys[idx]
-            if k is None:
-                return False
-            if k is self._deleted:
-                continue
-            if k == key:
-                self._keys[idx] = self._deleted
-                self._values[idx] = None
-                self._size -= 1
-                return True
-        return False
+        h = self._hash_fn(key)
+        if self._old_keys is not None:
+            self._rehash_step()
+            if self._old_keys is not None:
+                old_idx = self._find_old(key, h)
+                if old_idx != -1:
+                    self._old_keys[old_idx] = self._deleted
+                    self._old_values[old_idx] = None
+                    self._size -= 1
+                    return True
+
+        idx = self._lookup(key, h)
+        if idx == -1:
+            return False
+
+        if self._method == 'robin_hood':
+            self._robin_hood_delete(idx)
+        else:
+            self._keys[idx] = self._deleted
+            self._values[idx] = None
+            self._tombstones += 1
+        self._size -= 1
+
+        if self._capacity > self._MIN_CAPACITY and self._size / self._capacity < self._min_load:
+            self._resize(max(self._MIN_CAPACITY, (self._capacity // 2) | 1))
+        return True
+
+    def _probe_length(self, idx: int) -> int:
+        """Число проверенных ячеек, чтобы найти ключ из ячейки idx."""
+        probe_idx, step = self._probe_start(self._hashes[idx])
+        if step == 1:
+            return (idx - probe_idx) % self._capacity + 1
+
+        length = 1
+        while probe_idx != idx:
+            probe_idx = (probe_idx + step) % self._capacity
+            length += 1
+        return length
+
+    def probe_stats(self) -> dict:
+        """Максимальная и средняя длина пробирования по живым ключам. Сложность: O(capacity)"""
+        lengths = [self._probe_length(i) for i, k in enumerate(self._keys)
+                   if k is not None and k is not self._deleted]
+        if not lengths:
+            return {"max_probe": 0, "mean_probe": 0.0}
+        return {"max_probe": max(lengths), "mean_probe": sum(lengths) / len(lengths)}
@@ -0,0 +1,192 @@
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+from modules.hash_functions import HashFunction
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_MAGIC = b"OAHT"
+_VERSION = 1
+
+# magic, версия, ёмкость, число ключей, имя хеш-функции (до _NAME_SIZE байт UTF-8)
+_NAME_SIZE = 32
+_HEADER = struct.Struct(f"<4sIQQ{_NAME_SIZE}s")
+# полный хеш, смещение ключа, смещение значения (0 — пустая ячейка)
+_SLOT = struct.Struct("<QQQ")
+# длина записи в куче строк
+_LENGTH = struct.Struct("<I")
+
+
+def _file_mode(path: str) -> int:
+    """Права для нового файла таблицы: как у заменяемого, иначе по umask (mkstemp создаёт 0600)."""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+class MmapHashTable:
+    """Открытая адресация (линейное пробирование) в файле, отображённом в память.
+
+    Файл: заголовок, массив ячеек (хеш, смещение ключа, смещение значения)
+    и куча строк — записи «длина + байты». Таблица строится один раз
+    методом build/from_table, после чего open лишь читает заголовок
+    и отображает файл (O(1)). Отображение только для чтения, поэтому
+    несколько процессов делят одни и те же страницы кэша.
+
+    get возвращает memoryview на байты значения внутри отображения, без
+    копирования; строковые значения хранятся в UTF-8. Имя хеш-функции
+    записано в заголовке и сверяется при открытии — функция должна быть
+    детерминированной (как sum_hash/poly_hash/djb2_hash), а не hash().
+
+    Временная сложность: open — O(1), get — O(1) в среднем.
+    """
+
+    def __init__(self, path: str, hash_fn: HashFunction):
+        self._hash_fn = hash_fn
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+
+        magic, version, capacity, size, name = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path}: не файл MmapHashTable версии {_VERSION}")
+        name = name.rstrip(b"\0").decode()
+        if name != hash_fn.name:
+            self.close()
+            raise ValueError(f"{path}: таблица построена с {name}, а не с {hash_fn.name}")
+
+        self._capacity = capacity
+        self._size = size
+
+    @classmethod
+    def open(cls, path: str, hash_fn: HashFunction) -> "MmapHashTable":
+        return cls(path, hash_fn)
+
+    @staticmethod
+    def build(path: str, items: Iterable[Tuple[str, Union[str, bytes]]], hash_fn: HashFunction,
+              load_factor: float = 0.5) -> None:
+        """Записать пары (ключ, значение) в файл path. При повторе ключа остаётся последнее значение."""
+        entries = {}
+        for key, value in items:
+            entries[key] = value
+        keys = list(entries)
+        hashes = hash_fn.hash_many(keys)
+        MmapHashTable._write(path, ((k, entries[k], h) for k, h in zip(keys, hashes)),
+                             len(keys), hash_fn, load_factor)
+
+    @staticmethod
+    def from_table(path: str, ht, load_factor: float = 0.5) -> None:
+        """Сохранить OpenAddressingHashTable с уже посчитанными хешами."""
+        MmapHashTable._write(path, ht._entries(), ht.size, ht._hash_fn, load_factor)
+
+    @staticmethod
+    def _write(path: str, entries: Iterable[Tuple[str, Any, int]], count: int,
+               hash_fn: HashFunction, load_factor: float) -> None:
+        if not 0 < load_factor < 1:
+            # При load_factor >= 1 ячеек может не хватить, и линейное пробирование не закончится
+            raise ValueError(f"load_factor должен быть в интервале (0, 1), получено {load_factor}")
+        name = hash_fn.name.encode()
+        if len(name) > _NAME_SIZE:
+            raise ValueError(f"Имя хеш-функции длиннее {_NAME_SIZE} байт: {hash_fn.name!r}")
+
+        capacity = max(17, int(count / load_factor) + 1)
+        slots = bytearray(_SLOT.size * capacity)
+        heap = bytearray()
+        heap_start = _HEADER.size + len(slots)
+
+        def put(data: bytes) -> int:
+            offset = heap_start + len(heap)
+            heap.extend(_LENGTH.pack(len(data)))
+            heap.extend(data)
+            return offset
+
+        for key, value, h in entries:
+            h &= _MASK64
+            data = value if isinstance(value, (bytes, bytearray, memoryview)) else str(value).encode()
+            idx = h % capacity
+            while _SLOT.unpack_from(slots, idx * _SLOT.size)[1] != 0:
+                idx = (idx + 1) % capacity
+            _SLOT.pack_into(slots, idx * _SLOT.size, h, put(key.encode()), put(bytes(data)))
+
+        # Пишем во временный файл рядом и подменяем целиком: процессы, уже
+        # отобразившие старый файл, продолжают читать его, а сбой посреди
+        # записи не оставляет на месте path обрезанную таблицу
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".oaht")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, capacity, count, name))
+                f.write(slots)
+                f.write(heap)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, _file_mode(path))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @property
+    def size(self):
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def capacity(self):
+        return self._capacity
+
+    def _record(self, offset: int) -> memoryview:
+        (length,) = _LENGTH.unpack_from(self._mm, offset)
+        start = offset + _LENGTH.size
+        return self._view[start:start + length]
+
+    def _find(self, key: str) -> int:
+        """Смещение значения для key или 0."""
+        h = self._hash_fn(key) & _MASK64
+        encoded = key.encode()
+        mm, cap = self._mm, self._capacity
+        idx = h % cap
+
+        for _ in range(cap):
+            slot_h, key_off, value_off = _SLOT.unpack_from(mm, _HEADER.size + idx * _SLOT.size)
+            if key_off == 0:
+                return 0
+            if slot_h == h and self._record(key_off) == encoded:
+                return value_off
+            idx = (idx + 1) % cap
+        return 0
+
+    def get(self, key: str) -> Optional[memoryview]:
+        """Байты значения без копирования (memoryview на отображение) или None."""
+        value_off = self._find(key)
+        return self._record(value_off) if value_off else None
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) != 0
+
+    def items(self) -> Iterator[Tuple[str, memoryview]]:
+        for idx in range(self._capacity):
+            _, key_off, value_off = _SLOT.unpack_from(self._mm, _HEADER.size + idx * _SLOT.size)
+            if key_off:
+                yield bytes(self._record(key_off)).decode(), self._record(value_off)
+
+    def close(self) -> None:
+        """Закрыть отображение. Выданные get срезы к этому моменту должны быть отпущены."""
+        if self._mm is None:
+            return
+        self._view.release()
+        self._mm.close()
+        self._file.close()
+        self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,8 +1,19 @@
+import gc
+import random
+import sys
+import threading
+import os
+import tempfile
+import time
 import timeit
+import tracemalloc
 from typing import List, Callable
 from modules.hash_functions import HashFunction, sum_hash, poly_hash, djb2_hash
-from modules.hash_table_chaining import HashTableChaining
+from modules.hash_table_chaining import HashTableChaining, CompactHashTableChaining
 from modules.hash_table_open_addressing import OpenAddressingHashTable
+from modules.hash_table_cuckoo import CuckooHashTable
+from modules.mmap_hash_table import MmapHashTable
+from modules.concurrent_hash_table import ConcurrentHashTableChaining
 
 HASH_FUNCTIONS = [
     HashFunction(sum_hash, "sum_hash"),
@@ -23,6 +34,9 @@ def measure_time(hash_table_class: Callable, hash_fn: HashFunction, load_factor:
     # Вставка
     insert_time = timeit.timeit(lambda: [ht.insert(k, i) for i, k in enumerate(keys)], number=1)
 
+    # Длины проб после заполнения (только для открытой адресации)
+    probe_stats = ht.probe_stats() if hasattr(ht, "probe_stats") else None
+
     # Получение
     get_time = timeit.timeit(lambda: [ht.get(k) for k in keys], number=1)
 
@@ -32,7 +46,11 @@ def measure_time(hash_table_class: Callable, hash_fn: HashFunction, load_factor:
     return {
         "insert_time": insert_time,
         "get_time": get_time,
-        "delete_time": delete_time
+        "delete_time": delete_time,
+        "insert_ops_per_sec": num_keys / insert_time if insert_time > 0 else float('inf'),
+        "get_ops_per_sec": num_keys / get_time if get_time > 0 else float('inf'),
+        "delete_ops_per_sec": num_keys / delete_time if delete_time > 0 else float('inf'),
+        "probe_stats": probe_stats
     }
 
 def analyze_performance():
@@ -43,9 +61,218 @@ def analyze_performance():
         for lf in LOAD_FACTORS:
             chaining_result = measure_time(HashTableChaining, hf, lf)
             open_result = measure_time(lambda **kwargs: OpenAddressingHashTable(method='linear', **kwargs), hf, lf)
+            robin_hood_result = measure_time(lambda **kwargs: OpenAddressingHashTable(method='robin_hood', **kwargs), hf, lf)
+            cuckoo_result = measure_time(lambda **kwargs: CuckooHashTable(num_tables=3, **kwargs), hf, lf)
             results[hf.name][lf] = {
                 "chaining": chaining_result,
-                "open_addressing": open_result
+                "open_addressing": open_result,
+                "robin_hood": robin_hood_result,
+                "cuckoo": cuckoo_result
             }
 
     return results
+
+
+def measure_insert_latency(ht, num_keys: int) -> dict:
+    """Задержка каждой вставки отдельно (нс) и её перцентили.
+
+    Сборщик мусора отключён, как и в timeit: пики должны отражать
+    перехеширование, а не паузы GC.
+    """
+    keys = generate_keys(num_keys)
+    latencies = []
+    clock = time.perf_counter_ns
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i, k in enumerate(keys):
+            start = clock()
+            ht.insert(k, i)
+            latencies.append(clock() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    ordered = sorted(latencies)
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    return {
+        "latencies": latencies,
+        "p50": percentile(0.5),
+        "p99": percentile(0.99),
+        "p999": percentile(0.999),
+        "max": ordered[-1],
+        "total_time": sum(latencies) / 1e9
+    }
+
+def compare_incremental_resize(num_keys: int = 200_000, hash_fn: HashFunction = None) -> dict:
+    """Распределение задержек вставки при обычном и постепенном перехешировании."""
+    hash_fn = hash_fn or HashFunction(djb2_hash, "djb2_hash")
+    factories = {
+        "chaining": lambda inc: HashTableChaining(hash_fn=hash_fn, incremental=inc),
+        "open_addressing": lambda inc: OpenAddressingHashTable(method='linear', hash_fn=hash_fn, incremental=inc),
+    }
+    results = {}
+    for name, factory in factories.items():
+        for incremental in (False, True):
+            label = f"{name}_incremental" if incremental else name
+            results[label] = measure_insert_latency(factory(incremental), num_keys)
+    return results
+
+def compare_chaining_storage(num_keys: int = 100_000, hash_fn: HashFunction = None) -> dict:
+    """Память на запись и скорость поиска: узлы-объекты против плоских массивов.
+
+    Память — прирост, зафиксированный tracemalloc при заполнении таблицы
+    (ключи и значения созданы заранее и в замер не входят).
+    """
+    hash_fn = hash_fn or HashFunction(djb2_hash, "djb2_hash")
+    keys = generate_keys(num_keys)
+    values = list(range(num_keys))
+    results = {}
+
+    for name, table_class in (("nodes", HashTableChaining), ("compact", CompactHashTableChaining)):
+        tracemalloc.start()
+        ht = table_class(hash_fn=hash_fn)
+        for k, v in zip(keys, values):
+            ht.insert(k, v)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Время замеряется отдельно: tracemalloc замедляет выделения
+        ht = table_class(hash_fn=hash_fn)
+        insert_time = timeit.timeit(lambda: [ht.insert(k, v) for k, v in zip(keys, values)], number=1)
+        get_time = timeit.timeit(lambda: [ht.get(k) for k in keys], number=1)
+        results[name] = {
+            "bytes_per_entry": memory / num_keys,
+            "insert_ops_per_sec": num_keys / insert_time,
+            "get_ops_per_sec": num_keys / get_time
+        }
+    return results
+
+def compare_bulk_load(num_keys: int = 100_000, hash_fn: HashFunction = None) -> dict:
+    """Поэлементные insert/get против insert_many/get_many с пакетным хешированием."""
+    hash_fn = hash_fn or HashFunction(djb2_hash, "djb2_hash")
+    keys = generate_keys(num_keys)
+    items = list(zip(keys, range(num_keys)))
+    factories = {
+        "chaining": lambda: HashTableChaining(hash_fn=hash_fn),
+        "open_addressing": lambda: OpenAddressingHashTable(method='linear', hash_fn=hash_fn),
+    }
+    results = {}
+    for name, factory in factories.items():
+        ht = factory()
+        single_insert = timeit.timeit(lambda: [ht.insert(k, v) for k, v in items], number=1)
+        single_get = timeit.timeit(lambda: [ht.get(k) for k in keys], number=1)
+        ht = factory()
+        batch_insert = timeit.timeit(lambda: ht.insert_many(items), number=1)
+        batch_get = timeit.timeit(lambda: ht.get_many(keys), number=1)
+        results[name] = {
+            "insert_time": single_insert,
+            "get_time": single_get,
+            "insert_many_time": batch_insert,
+            "get_many_time": batch_get
+        }
+    return results
+
+def compare_persistent_table(num_keys: int = 200_000, hash_fn: HashFunction = None) -> dict:
+    """Старт процесса: перестройка OpenAddressingHashTable против открытия MmapHashTable."""
+    hash_fn = hash_fn or HashFunction(djb2_hash, "djb2_hash")
+    keys = generate_keys(num_keys)
+    items = [(k, f"value_{i}") for i, k in enumerate(keys)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "table.oaht")
+        build_time = timeit.timeit(lambda: MmapHashTable.build(path, items, hash_fn), number=1)
+
+        ht = OpenAddressingHashTable(hash_fn=hash_fn)
+        rebuild_time = timeit.timeit(lambda: ht.insert_many(items), number=1)
+        get_time = timeit.timeit(lambda: [ht.get(k) for k in keys], number=1)
+
+        start = time.perf_counter()
+        table = MmapHashTable.open(path, hash_fn)
+        open_time = time.perf_counter() - start
+        mmap_get_time = timeit.timeit(lambda: [table.get(k) for k in keys], number=1)
+        table.close()
+
+        return {
+            "file_size": os.path.getsize(path),
+            "build_time": build_time,
+            "rebuild_time": rebuild_time,
+            "open_time": open_time,
+            "get_ops_per_sec": num_keys / get_time,
+            "mmap_get_ops_per_sec": num_keys / mmap_get_time
+        }
+
+class _GlobalLockTable:
+    """HashTableChaining за одной общей блокировкой — исходная схема сервиса."""
+
+    def __init__(self, hash_fn: HashFunction):
+        self._table = HashTableChaining(hash_fn=hash_fn)
+        self._lock = threading.Lock()
+
+    def insert(self, key, value):
+        with self._lock:
+            self._table.insert(key, value)
+
+    def get(self, key):
+        with self._lock:
+            return self._table.get(key)
+
+    def delete(self, key):
+        with self._lock:
+            return self._table.delete(key)
+
+def _run_workload(ht, keys: List[str], num_threads: int, ops_per_thread: int, write_ratio: float) -> float:
+    """Пропускная способность (оп/с) num_threads потоков со смесью get/insert/delete."""
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        plan = [(rng.choice(keys), rng.random()) for _ in range(ops_per_thread)]
+        barrier.wait()
+        for key, r in plan:
+            if r >= write_ratio:
+                ht.get(key)
+            elif r < write_ratio / 2:
+                ht.insert(key, r)
+            else:
+                ht.delete(key)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    return num_threads * ops_per_thread / (time.perf_counter() - start)
+
+def compare_concurrent_tables(thread_counts: List[int] = (1, 2, 4, 8), num_keys: int = 20_000,
+                              ops_per_thread: int = 50_000, hash_fn: HashFunction = None) -> dict:
+    """Масштабирование по потокам: общая блокировка против разделённых.
+
+    Нагрузки: read_heavy (95% get) и mixed (50% get, по 25% insert/delete).
+    На сборке CPython с GIL рост ограничен самим GIL; "gil_enabled"
+    в результате показывает, в какой сборке сделан замер.
+    """
+    hash_fn = hash_fn or HashFunction(djb2_hash, "djb2_hash")
+    keys = generate_keys(num_keys)
+    workloads = {"read_heavy": 0.05, "mixed": 0.5}
+    tables = {
+        "global_lock": lambda: _GlobalLockTable(hash_fn),
+        "striped": lambda: ConcurrentHashTableChaining(hash_fn=hash_fn),
+    }
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    results = {"gil_enabled": is_gil_enabled()}
+    for workload, write_ratio in workloads.items():
+        for name, factory in tables.items():
+            throughput = {}
+            for num_threads in thread_counts:
+                ht = factory()
+                for i, k in enumerate(keys):
+                    ht.insert(k, i)
+                throughput[num_threads] = _run_workload(ht, keys, num_threads, ops_per_thread, write_ratio)
+            results[f"{workload}_{name}"] = throughput
+    return results
@@ -64,14 +64,14 @@ def plot_collision_histogram(hash_table_class, hash_fn, num_keys=1000):
         probe_counts = []
         for i, k in enumerate(keys):
             count = 0
-            idx = ht._find_slot(k)
+            probe_idx, step = ht._probe_start(hash_fn(k))
             # подсчёт коллизий (количество проб)
             for j in range(ht._capacity):
-                probe_idx = ht._probe(k, j)
                 current = ht._keys[probe_idx]
                 count += 1
                 if current is None or current is ht._deleted:
                     break
+                probe_idx = (probe_idx + step) % ht._capacity
             probe_counts.append(count)
             ht.insert(k, i)
 
@@ -86,6 +86,77 @@ def plot_collision_histogram(hash_table_class, hash_fn, num_keys=1000):
         print(f"Сохранено: {filename}")
 
 
+def plot_insert_latency(latency_results: Dict):
+    """
+    Задержка каждой вставки в порядке вставок: пики соответствуют
+    синхронному перехешированию, постепенный режим их сглаживает.
+    """
+    fig, axes = plt.subplots(len(latency_results), 1, figsize=(10, 3 * len(latency_results)),
+                             sharex=True, squeeze=False)
+    for ax, (label, stats) in zip(axes[:, 0], latency_results.items()):
+        latencies_us = np.array(stats['latencies']) / 1e3
+        ax.plot(latencies_us, linewidth=0.5)
+        ax.set_yscale('log')
+        ax.set_ylabel("мкс")
+        ax.set_title(f"{label}: p99={stats['p99'] / 1e3:.1f}мкс, max={stats['max'] / 1e6:.2f}мс")
+        ax.grid(True)
+    axes[-1, 0].set_xlabel("Номер вставки")
+    plt.tight_layout()
+    filename = os.path.join(REPORT_DIR, "insert_latency.png")
+    plt.savefig(filename)
+    plt.close()
+    print(f"Сохранено: {filename}")
+
+
+def plot_hash_quality(df):
+    """
+    Качество хеш-функций по данным modules.hash_analytics:
+    χ²/dof домашних индексов и распределение длин проб по распределениям ключей.
+    """
+    distributions = list(df['distribution'].unique())
+    hash_names = list(df['hash_function'].unique())
+    chaining = df[df['table'] == 'chaining']
+
+    # χ² / dof (≈1 для равномерного хеширования)
+    width = 0.8 / len(hash_names)
+    x = np.arange(len(distributions))
+    plt.figure(figsize=(8, 5))
+    for i, name in enumerate(hash_names):
+        rows = chaining[chaining['hash_function'] == name].set_index('distribution')
+        plt.bar(x + i * width, [rows.loc[d, 'chi2_ratio'] for d in distributions], width, label=name)
+    plt.axhline(1.0, color='black', linestyle='--', linewidth=1)
+    plt.xticks(x + width * (len(hash_names) - 1) / 2, distributions)
+    plt.yscale('log')
+    plt.ylabel("χ² / dof")
+    plt.title("Равномерность домашних индексов (Chaining)")
+    plt.legend()
+    filename = os.path.join(REPORT_DIR, "hash_quality_chi2.png")
+    plt.savefig(filename)
+    plt.close()
+    print(f"Сохранено: {filename}")
+
+    # Гистограммы длин проб открытой адресации
+    open_addr = df[df['table'] == 'open_addressing']
+    fig, axes = plt.subplots(1, len(distributions), figsize=(5 * len(distributions), 4), squeeze=False)
+    for ax, dist in zip(axes[0], distributions):
+        for name in hash_names:
+            row = open_addr[(open_addr['distribution'] == dist) & (open_addr['hash_function'] == name)].iloc[0]
+            hist = row['probe_histogram']
+            ax.step(list(hist.keys()), list(hist.values()), where='mid', label=name)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel("Длина пробирования")
+        ax.set_title(dist)
+        ax.grid(True)
+    axes[0][0].set_ylabel("Количество ключей")
+    axes[0][0].legend()
+    plt.tight_layout()
+    filename = os.path.join(REPORT_DIR, "hash_quality_probes.png")
+    plt.savefig(filename)
+    plt.close()
+    print(f"Сохранено: {filename}")
+
+
 def generate_all_plots(results):
     # Время операций
     plot_operation_times(results)
@@ -1,7 +1,58 @@
+import itertools
+import os
+import tempfile
 import unittest
+import random
+from concurrent.futures import ThreadPoolExecutor
 from modules.hash_functions import sum_hash, poly_hash, djb2_hash, HashFunction
-from modules.hash_table_chaining import HashTableChaining
+from modules.hash_table_chaining import HashTableChaining, CompactHashTableChaining
 from modules.hash_table_open_addressing import OpenAddressingHashTable
+from modules import hash_analytics
+from modules.mmap_hash_table import MmapHashTable
+from modules.concurrent_hash_table import ConcurrentHashTableChaining
+from modules.hash_table_cuckoo import CuckooHashTable
+
+
+def run_churn(test, ht, seed, steps, key_space, delete_ratio, get_ratio=0.0, check=None):
+    """Случайные insert/delete/get над таблицей и эталонным dict с проверкой совпадения.
+
+    check(ht, reference) вызывается после каждой операции — для инвариантов
+    конкретной реализации. Возвращает эталонный dict.
+    """
+    rng = random.Random(seed)
+    reference = {}
+    for step in range(steps):
+        key = f"k{rng.randint(0, key_space)}"
+        op = rng.random()
+        if op < delete_ratio:
+            test.assertEqual(ht.delete(key), reference.pop(key, None) is not None)
+        elif op < delete_ratio + get_ratio:
+            test.assertEqual(ht.get(key), reference.get(key))
+        else:
+            ht.insert(key, step)
+            reference[key] = step
+        if check is not None:
+            check(ht, reference)
+
+    test.assertEqual(ht.size, len(reference))
+    for key, value in reference.items():
+        test.assertEqual(ht.get(key), value)
+    test.assertIsNone(ht.get("missing"))
+    return reference
+
+
+TABLE_VARIANTS = {
+    "chaining": lambda hf: HashTableChaining(hash_fn=hf),
+    "chaining_incremental": lambda hf: HashTableChaining(hash_fn=hf, incremental=True),
+    "compact_chaining": lambda hf: CompactHashTableChaining(hash_fn=hf),
+    "concurrent_chaining": lambda hf: ConcurrentHashTableChaining(hash_fn=hf, num_stripes=4),
+    **{f"{method}{suffix}": (lambda m, inc: lambda hf: OpenAddressingHashTable(method=m, hash_fn=hf, incremental=inc))(method, inc)
+       for method in ('linear', 'double', 'robin_hood')
+       for suffix, inc in (("", False), ("_incremental", True))},
+    "cuckoo_2": lambda hf: CuckooHashTable(hash_fn=hf, num_tables=2, stash_size=2),
+    "cuckoo_3": lambda hf: CuckooHashTable(hash_fn=hf, num_tables=3, stash_size=2),
+}
+
 
 class SimpleTests(unittest.TestCase):
     def test_hash_functions(self):
@@ -34,5 +85,252 @@ class SimpleTests(unittest.TestCase):
         for i in range(7):
             self.assertEqual(oa.get(f"x{i}"), i)
 
+
+class TestDifferential(unittest.TestCase):
+    """Все таблицы против dict: частые удаления на малом наборе ключей и рост/сжатие на большом."""
+
+    def test_heavy_churn(self):
+        for name, factory in TABLE_VARIANTS.items():
+            for hf in (HashFunction(sum_hash), HashFunction(poly_hash)):
+                with self.subTest(table=name, hash_fn=hf.name):
+                    run_churn(self, factory(hf), seed=1, steps=3000, key_space=60, delete_ratio=0.5)
+
+    def test_grow_and_shrink(self):
+        for name, factory in TABLE_VARIANTS.items():
+            with self.subTest(table=name):
+                run_churn(self, factory(HashFunction(djb2_hash)), seed=2, steps=6000, key_space=2000,
+                          delete_ratio=0.35, get_ratio=0.25)
+
+
+class TestOpenAddressing(unittest.TestCase):
+
+    def test_open_addressing_hashes_once(self):
+        calls = []
+        counting = HashFunction(lambda k: calls.append(k) or sum_hash(k), "counting")
+        for method in ('linear', 'double'):
+            oa = OpenAddressingHashTable(initial_capacity=5, method=method, hash_fn=counting)
+            for i in range(20):
+                oa.insert(f"ab{i}", i)
+            self.assertEqual(len(calls), 20)
+            calls.clear()
+
+            for i in range(20):
+                self.assertEqual(oa.get(f"ab{i}"), i)
+            self.assertTrue(oa.delete("ab7"))
+            self.assertEqual(len(calls), 21)
+            calls.clear()
+
+    def test_probe_stats(self):
+        for method in ('linear', 'double', 'robin_hood'):
+            oa = OpenAddressingHashTable(initial_capacity=101, method=method, hash_fn=HashFunction(djb2_hash))
+            self.assertEqual(oa.probe_stats()["max_probe"], 0)
+            for i in range(50):
+                oa.insert(f"key_{i}", i)
+            stats = oa.probe_stats()
+            self.assertGreaterEqual(stats["mean_probe"], 1.0)
+            self.assertGreaterEqual(stats["max_probe"], stats["mean_probe"])
+
+    def test_tombstones_bounded(self):
+        def check(oa, reference):
+            # Пустые ячейки не исчезают, удалённые не копятся
+            self.assertIn(None, oa._keys)
+            self.assertLessEqual(oa.size + oa.tombstones, oa.capacity())
+            live = [k for k in oa._keys if k is not None and k is not oa._deleted]
+            self.assertEqual(len(live), len(reference))
+
+        for method in ('linear', 'double'):
+            oa = OpenAddressingHashTable(initial_capacity=17, method=method, hash_fn=HashFunction(poly_hash))
+            run_churn(self, oa, seed=3, steps=5000, key_space=40, delete_ratio=0.5, check=check)
+
+    def test_robin_hood_without_tombstones(self):
+        oa = OpenAddressingHashTable(initial_capacity=11, method='robin_hood', hash_fn=HashFunction(sum_hash))
+        run_churn(self, oa, seed=4, steps=3000, key_space=300, delete_ratio=0.4)
+        self.assertFalse(any(k is oa._deleted for k in oa._keys))
+
+    def test_shrink(self):
+        oa = OpenAddressingHashTable(initial_capacity=17, method='linear', hash_fn=HashFunction(djb2_hash))
+        for i in range(500):
+            oa.insert(f"key_{i}", i)
+        grown = oa.capacity()
+        for i in range(495):
+            oa.delete(f"key_{i}")
+        self.assertLess(oa.capacity(), grown)
+        self.assertEqual(oa.tombstones, sum(k is oa._deleted for k in oa._keys))
+        for i in range(495, 500):
+            self.assertEqual(oa.get(f"key_{i}"), i)
+
+
+class TestIncrementalRehash(unittest.TestCase):
+
+    def test_rehash_in_progress_is_consistent(self):
+        tables = [HashTableChaining(incremental=True, hash_fn=HashFunction(poly_hash))]
+        tables += [OpenAddressingHashTable(method=m, incremental=True, hash_fn=HashFunction(poly_hash))
+                   for m in ('linear', 'double', 'robin_hood')]
+        for ht in tables:
+            seen = []
+
+            def check(table, reference):
+                seen.append(table.rehashing)
+                self.assertEqual(table.size, len(reference))
+
+            run_churn(self, ht, seed=5, steps=6000, key_space=2000, delete_ratio=0.3, get_ratio=0.2, check=check)
+            self.assertTrue(any(seen))
+
+
+class TestCompactChaining(unittest.TestCase):
+
+    def test_free_list_reuse(self):
+        ht = CompactHashTableChaining(hash_fn=HashFunction(sum_hash))
+        reference = run_churn(self, ht, seed=6, steps=4000, key_space=500, delete_ratio=0.4)
+        # Записи из списка свободных переиспользуются, массивы не растут без меры
+        self.assertLessEqual(len(ht._keys), 2 * max(len(reference), 11))
+
+
+class TestBulkOperations(unittest.TestCase):
+
+    def test_hash_many(self):
+        keys = [f"key_{i}" for i in range(300)] + ["", "a", "ключ_ü", "x" * 40, "a\ud800", "\udc80b\U0001F600"]
+        for fn in (sum_hash, poly_hash, djb2_hash, lambda k: len(k)):
+            hf = HashFunction(fn, "fn")
+            self.assertEqual(hf.hash_many(keys), [hf(k) for k in keys])
+        self.assertEqual(HashFunction(djb2_hash).hash_many([]), [])
+
+    def test_insert_many_get_many(self):
+        items = [(f"key_{i}", i) for i in range(500)]
+        query = [f"key_{i}" for i in range(0, 600, 7)]
+        tables = [HashTableChaining(hash_fn=HashFunction(djb2_hash)),
+                  HashTableChaining(hash_fn=HashFunction(djb2_hash), incremental=True)]
+        tables += [OpenAddressingHashTable(method=m, hash_fn=HashFunction(poly_hash))
+                   for m in ('linear', 'double', 'robin_hood')]
+        for ht in tables:
+            ht.insert_many(items)
+            self.assertEqual(ht.size, len(items))
+            self.assertEqual(ht.get_many(query), [ht.get(k) for k in query])
+            self.assertEqual(ht.get_many(query)[:3], [0, 7, 14])
+            self.assertIsNone(ht.get_many(["key_599"])[0])
+
+
+class TestHashAnalytics(unittest.TestCase):
+
+    def test_table_stats(self):
+        keys = hash_analytics.KEY_DISTRIBUTIONS["anagrams"](500)
+        tables = [HashTableChaining(hash_fn=HashFunction(sum_hash), instrumented=True),
+                  CompactHashTableChaining(hash_fn=HashFunction(djb2_hash), instrumented=True),
+                  OpenAddressingHashTable(method='double', hash_fn=HashFunction(djb2_hash), instrumented=True)]
+        for ht in tables:
+            for i, k in enumerate(keys):
+                ht.insert(k, i)
+            stats = hash_analytics.table_stats(ht)
+            self.assertGreater(stats["resizes"], 0)
+            self.assertEqual(sum(stats["bucket_histogram"].values()), ht.capacity())
+            self.assertEqual(sum(stats["probe_histogram"].values()), len(keys))
+
+        # Все анаграммы у sum_hash попадают в один бакет
+        sum_stats = hash_analytics.table_stats(tables[0])
+        self.assertEqual(sum_stats["max_bucket"], len(keys))
+        self.assertGreater(sum_stats["chi2_ratio"], 100)
+        self.assertLess(hash_analytics.table_stats(tables[1])["chi2_ratio"], 2)
+
+        plain = HashTableChaining()
+        plain.insert_many((k, i) for i, k in enumerate(keys))
+        self.assertEqual(plain.resize_count, 0)
+
+
+class TestMmapHashTable(unittest.TestCase):
+
+    def test_build_open_rebuild(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "table.oaht")
+            items = [(f"key_{i}", f"value_{i}") for i in range(1000)] + [("ключ", b"\x00\xff")]
+            MmapHashTable.build(path, items, HashFunction(djb2_hash, "djb2_hash"))
+
+            with MmapHashTable.open(path, HashFunction(djb2_hash, "djb2_hash")) as table:
+                self.assertEqual(len(table), len(items))
+                value = table.get("key_42")
+                self.assertIsInstance(value, memoryview)
+                self.assertEqual(value.tobytes(), b"value_42")
+                self.assertEqual(table.get("ключ").tobytes(), b"\x00\xff")
+                self.assertIsNone(table.get("missing"))
+                self.assertIn("key_999", table)
+                self.assertEqual(sum(1 for _ in table.items()), len(items))
+                del value
+
+            with self.assertRaises(ValueError):
+                MmapHashTable.open(path, HashFunction(poly_hash, "poly_hash"))
+            with self.assertRaises(ValueError):
+                MmapHashTable.build(path, items, HashFunction(djb2_hash, "djb2_hash_" + "x" * 30))
+            for load_factor in (0, 1, 1.5):
+                with self.assertRaises(ValueError):
+                    MmapHashTable.build(path, items, HashFunction(djb2_hash, "djb2_hash"), load_factor=load_factor)
+
+            oa = OpenAddressingHashTable(method='double', hash_fn=HashFunction(poly_hash, "poly_hash"))
+            for i in range(300):
+                oa.insert(f"k{i}", i)
+            with MmapHashTable.open(path, HashFunction(djb2_hash, "djb2_hash")) as old:
+                # Перестройка подменяет файл целиком: открытая таблица читает прежние данные
+                MmapHashTable.from_table(path, oa)
+                self.assertEqual(old.get("key_42").tobytes(), b"value_42")
+            self.assertEqual(os.listdir(tmp), ["table.oaht"])
+            with MmapHashTable.open(path, HashFunction(poly_hash, "poly_hash")) as table:
+                for i in range(300):
+                    self.assertEqual(table.get(f"k{i}").tobytes(), str(i).encode())
+
+
+class TestConcurrentHashTable(unittest.TestCase):
+
+    def test_parallel_writers(self):
+        ht = ConcurrentHashTableChaining(hash_fn=HashFunction(djb2_hash), num_stripes=4)
+
+        def writer(t):
+            for i in range(2000):
+                ht.insert(f"t{t}_{i}", i)
+            return [ht.delete(f"t{t}_{i}") for i in range(0, 2000, 2)]
+
+        # Результаты и исключения потоков проверяются в главном потоке
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            futures = [pool.submit(writer, t) for t in range(6)]
+        for future in futures:
+            self.assertTrue(all(future.result()))
+
+        self.assertEqual(ht.size, 6 * 1000)
+        self.assertGreater(ht.capacity(), 11)
+        for t in range(6):
+            self.assertIsNone(ht.get(f"t{t}_0"))
+            self.assertEqual(ht.get(f"t{t}_1999"), 1999)
+            self.assertIn(f"t{t}_1", ht)
+
+
+class TestCuckoo(unittest.TestCase):
+
+    def test_stash_within_limit(self):
+        def check(ht, reference):
+            self.assertLessEqual(len(ht._stash), 2)
+
+        for num_tables in (2, 3):
+            ht = CuckooHashTable(hash_fn=HashFunction(djb2_hash), num_tables=num_tables, stash_size=2)
+            run_churn(self, ht, seed=7, steps=6000, key_space=1500, delete_ratio=0.3, check=check)
+
+    def test_degenerate_hash(self):
+        # Все перестановки "abcde" дают один sum_hash: их ячейки совпадают во всех таблицах
+        keys = ["".join(p) for p in itertools.permutations("abcde")]
+        for hash_fn, max_stash in ((None, 1), (HashFunction(sum_hash), len(keys) - 2)):
+            ht = CuckooHashTable(hash_fn=hash_fn, stash_size=1)
+            for i, k in enumerate(keys):
+                ht.insert(k, i)
+            self.assertEqual(ht.size, len(keys))
+            self.assertLessEqual(len(ht._stash), max_stash)
+            for i, k in enumerate(keys):
+                self.assertEqual(ht.get(k), i)
+
+    def test_placement_follows_hash_fn(self):
+        # Размещение задаёт hash_fn: две таблицы с разными функциями раскладывают ключи по-разному
+        layouts = []
+        for hash_fn in (HashFunction(poly_hash), HashFunction(djb2_hash)):
+            ht = CuckooHashTable(hash_fn=hash_fn)
+            for i in range(50):
+                ht.insert(f"key_{i}", i)
+            layouts.append(ht._keys)
+        self.assertNotEqual(layouts[0], layouts[1])
+
 if __name__ == '__main__':
     unittest.main()
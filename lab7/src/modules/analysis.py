@@ -1,7 +1,10 @@
 import time
 import random
+import heapq
 import matplotlib.pyplot as plt
-from modules.heap import SmallHeap
+from modules.heap import SmallHeap, DAryHeap
+from modules.pairing_heap import PairingHeap
+from modules.priority_queue import TaskQueue
 from modules.heapsort import inplace_heapsort, heapsort_using_smallheap
 import sys
 import os
@@ -50,9 +53,39 @@ def measure_heap_operations():
 
         print(f"{size:6} | {build_time:9.2f} | {insert_time:13.2f} | {extract_time:13.2f}")
 
-    plt.figure(figsize=(12, 5))
+    arities = [2, 4, 8]
+    dary_insert_times = {d: [] for d in arities}
+    dary_extract_times = {d: [] for d in arities}
 
-    plt.subplot(1, 2, 1)
+    print("\nd-арная куча: вставка / извлечение всех элементов (мс)")
+    print("Размер | " + " | ".join(f"d={d} push  d={d} pop" for d in arities))
+    print("-" * 75)
+
+    for size in sizes:
+        array = random.sample(range(size * 10), size)
+        row = []
+
+        for d in arities:
+            heap = DAryHeap(arity=d)
+            start_time = time.perf_counter()
+            for value in array:
+                heap.push(value)
+            insert_time = (time.perf_counter() - start_time) * 1000
+
+            start_time = time.perf_counter()
+            while len(heap) > 0:
+                heap.pop()
+            extract_time = (time.perf_counter() - start_time) * 1000
+
+            dary_insert_times[d].append(insert_time)
+            dary_extract_times[d].append(extract_time)
+            row.append(f"{insert_time:9.2f} {extract_time:9.2f}")
+
+        print(f"{size:6} | " + " | ".join(row))
+
+    plt.figure(figsize=(18, 5))
+
+    plt.subplot(1, 3, 1)
     plt.plot(sizes, build_heap_times, 'o-', label='Build Heap (O(n))', linewidth=2)
     plt.plot(sizes, sequential_insert_times, 's-', label='Sequential Insert (O(n log n))', linewidth=2)
     plt.xlabel('Количество элементов')
@@ -61,7 +94,7 @@ def measure_heap_operations():
     plt.legend()
     plt.grid(True, alpha=0.3)
 
-    plt.subplot(1, 2, 2)
+    plt.subplot(1, 3, 2)
     plt.plot(sizes, extract_all_times, 'o-', label='Extract All', linewidth=2)
     plt.xlabel('Количество элементов')
     plt.ylabel('Время (мс)')
@@ -69,11 +102,21 @@ def measure_heap_operations():
     plt.legend()
     plt.grid(True, alpha=0.3)
 
+    plt.subplot(1, 3, 3)
+    for d in arities:
+        plt.plot(sizes, dary_insert_times[d], 'o-', label=f'push, d={d}', linewidth=2)
+        plt.plot(sizes, dary_extract_times[d], 's--', label=f'pop, d={d}', linewidth=2)
+    plt.xlabel('Количество элементов')
+    plt.ylabel('Время (мс)')
+    plt.title('d-арная куча')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
     plt.tight_layout()
     plt.savefig(measure_output_path, dpi=300, bbox_inches='tight')
     plt.show()
 
-    return sizes, build_heap_times, sequential_insert_times, extract_all_times
+    return sizes, build_heap_times, sequential_insert_times, extract_all_times, dary_insert_times, dary_extract_times
 
 def compare_sorting_algorithms():
     print("\n=== СРАВНЕНИЕ АЛГОРИТМОВ СОРТИРОВКИ ===\n")
@@ -165,8 +208,123 @@ def compare_sorting_algorithms():
 
     return sizes, heapsort_times, quicksort_times, mergesort_times, builtin_sort_times
 
+def compare_batch_operations():
+    print("\n=== ПАКЕТНЫЕ ОПЕРАЦИИ: SmallHeap vs heapq ===\n")
+
+    sizes = [1000, 10000, 100000]
+
+    print("Куча n/10 элементов, пакет из n убывающих значений\n")
+    print("Размер | push×n (мс) | push_many (мс) | heappush×n (мс) | heapify (мс) | "
+          "nsmallest(100) (мс) | heapq.nsmallest (мс) | merge (мс)")
+    print("-" * 130)
+
+    for size in sizes:
+        base = random.sample(range(size * 10), size // 10)
+        batch = sorted(random.sample(range(size * 10), size), reverse=True)
+
+        heap = SmallHeap(base)
+        start_time = time.perf_counter()
+        for value in batch:
+            heap.push(value)
+        push_time = (time.perf_counter() - start_time) * 1000
+
+        heap = SmallHeap(base)
+        start_time = time.perf_counter()
+        heap.push_many(batch)
+        push_many_time = (time.perf_counter() - start_time) * 1000
+
+        reference = base[:]
+        heapq.heapify(reference)
+        start_time = time.perf_counter()
+        for value in batch:
+            heapq.heappush(reference, value)
+        heappush_time = (time.perf_counter() - start_time) * 1000
+
+        reference = base + batch
+        start_time = time.perf_counter()
+        heapq.heapify(reference)
+        heapify_time = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        heap.nsmallest(100)
+        nsmallest_time = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        heapq.nsmallest(100, reference)
+        heapq_nsmallest_time = (time.perf_counter() - start_time) * 1000
+
+        other = SmallHeap(batch)
+        heap = SmallHeap(base)
+        start_time = time.perf_counter()
+        heap.merge(other)
+        merge_time = (time.perf_counter() - start_time) * 1000
+
+        print(f"{size:6} | {push_time:11.2f} | {push_many_time:14.2f} | {heappush_time:15.2f} | "
+              f"{heapify_time:12.2f} | {nsmallest_time:19.2f} | {heapq_nsmallest_time:20.2f} | "
+              f"{merge_time:10.2f}")
+
+def compare_pairing_heap():
+    print("\n=== PAIRING-КУЧА vs SmallHeap ===\n")
+
+    sizes = [1000, 10000, 50000]
+    shards = 16
+
+    print(f"Слияние {shards} шардов в один")
+    print("Размер | pop+push SmallHeap (мс) | SmallHeap.merge (мс) | PairingHeap.meld (мс)")
+    print("-" * 80)
+
+    for size in sizes:
+        values = random.sample(range(size * 10), size)
+        parts = [values[i::shards] for i in range(shards)]
+
+        small_heaps = [SmallHeap(part) for part in parts]
+        start_time = time.perf_counter()
+        target = small_heaps[0]
+        for heap in small_heaps[1:]:
+            while len(heap) > 0:
+                target.push(heap.pop())
+        transfer_time = (time.perf_counter() - start_time) * 1000
+
+        small_heaps = [SmallHeap(part) for part in parts]
+        start_time = time.perf_counter()
+        for heap in small_heaps[1:]:
+            small_heaps[0].merge(heap)
+        merge_time = (time.perf_counter() - start_time) * 1000
+
+        pairing_heaps = [PairingHeap(part) for part in parts]
+        start_time = time.perf_counter()
+        for heap in pairing_heaps[1:]:
+            pairing_heaps[0].meld(heap)
+        meld_time = (time.perf_counter() - start_time) * 1000
+
+        print(f"{size:6} | {transfer_time:23.2f} | {merge_time:20.2f} | {meld_time:21.2f}")
+
+    print("\nTaskQueue: n вставок, n повышений приоритета, n извлечений")
+    print("Размер | binary (мс) | pairing (мс)")
+    print("-" * 40)
+
+    for size in sizes:
+        priorities = [random.randint(size, size * 10) for _ in range(size)]
+        updates = [(random.randrange(size), random.randint(0, size)) for _ in range(size)]
+        row = []
+
+        for backend in ('binary', 'pairing'):
+            queue = TaskQueue(backend=backend)
+            start_time = time.perf_counter()
+            handles = [queue.push_with_priority(i, p) for i, p in enumerate(priorities)]
+            for index, priority in updates:
+                if priority < handles[index].priority:
+                    queue.change_priority(handles[index], priority)
+            while not queue.empty():
+                queue.pop_priority()
+            row.append((time.perf_counter() - start_time) * 1000)
+
+        print(f"{size:6} | {row[0]:11.2f} | {row[1]:12.2f}")
+
 if __name__ == "__main__":
     random.seed(42)
 
     measure_heap_operations()
     compare_sorting_algorithms()
+    compare_batch_operations()
+    compare_pairing_heap()
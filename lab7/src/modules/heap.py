@@ -78,9 +78,61 @@ class SmallHeap:
     def heapify(self, array):
         """Построение кучи из массива. Сложность: O(n)"""
         self.heap = array[:]
+        self._rebuild()
+
+    def _rebuild(self):
         for i in range(len(self.heap) // 2 - 1, -1, -1):
             self._sink_down(i)
 
+    def push_many(self, values):
+        """
+        Пакетная вставка. Сложность: O(min(k log(n + k), n + k))
+
+        Если пакет больше текущей кучи, k вставок по O(log(n + k))
+        дороже перестройки за O(n + k): элементы дописываются в конец
+        и куча перестраивается. Иначе выполняются обычные вставки.
+        """
+        values = list(values)
+        if len(values) > len(self.heap):
+            self.heap.extend(values)
+            self._rebuild()
+        else:
+            for value in values:
+                self.push(value)
+
+    def pop_many(self, k):
+        """Извлечь до k элементов в порядке приоритета. Сложность: O(k log n)"""
+        result = []
+        while self.heap and len(result) < k:
+            result.append(self.pop())
+        return result
+
+    def nsmallest(self, k):
+        """
+        k наименьших элементов без изменения кучи. Сложность: O(k log k)
+
+        Обход идёт по дереву кучи: вспомогательная куча хранит границу
+        из ещё не выданных потомков уже выданных узлов.
+        """
+        result = []
+        if not self.heap or k <= 0:
+            return result
+
+        frontier = SmallHeap()
+        frontier.push((self.heap[0], 0))
+        while frontier and len(result) < k:
+            value, index = frontier.pop()
+            result.append(value)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(self.heap):
+                    frontier.push((self.heap[child], child))
+        return result
+
+    def merge(self, other):
+        """Слить другую кучу в текущую (other не меняется). Сложность: O(n + m)"""
+        self.heap.extend(other.heap)
+        self._rebuild()
+
     def validate_heap(self):
         """Проверка свойства min-кучи. Сложность: O(n)"""
         for i in range(len(self.heap)):
@@ -194,9 +246,61 @@ class LargeHeap:
     def heapify(self, array):
         """Построение max-кучи из массива. Сложность: O(n)"""
         self.heap = array[:]
+        self._rebuild()
+
+    def _rebuild(self):
         for i in range(len(self.heap) // 2 - 1, -1, -1):
             self._sink_down(i)
 
+    def push_many(self, values):
+        """
+        Пакетная вставка. Сложность: O(min(k log(n + k), n + k))
+
+        Если пакет больше текущей кучи, k вставок по O(log(n + k))
+        дороже перестройки за O(n + k): элементы дописываются в конец
+        и куча перестраивается. Иначе выполняются обычные вставки.
+        """
+        values = list(values)
+        if len(values) > len(self.heap):
+            self.heap.extend(values)
+            self._rebuild()
+        else:
+            for value in values:
+                self.push(value)
+
+    def pop_many(self, k):
+        """Извлечь до k элементов в порядке приоритета. Сложность: O(k log n)"""
+        result = []
+        while self.heap and len(result) < k:
+            result.append(self.pop())
+        return result
+
+    def nlargest(self, k):
+        """
+        k наибольших элементов без изменения кучи. Сложность: O(k log k)
+
+        Обход идёт по дереву кучи: вспомогательная куча хранит границу
+        из ещё не выданных потомков уже выданных узлов.
+        """
+        result = []
+        if not self.heap or k <= 0:
+            return result
+
+        frontier = LargeHeap()
+        frontier.push((self.heap[0], 0))
+        while frontier and len(result) < k:
+            value, index = frontier.pop()
+            result.append(value)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(self.heap):
+                    frontier.push((self.heap[child], child))
+        return result
+
+    def merge(self, other):
+        """Слить другую кучу в текущую (other не меняется). Сложность: O(n + m)"""
+        self.heap.extend(other.heap)
+        self._rebuild()
+
     def validate_heap(self):
         """Проверка свойства max-кучи. Сложность: O(n)"""
         for i in range(len(self.heap)):
@@ -228,3 +332,198 @@ class LargeHeap:
             return result
 
         return _rec(0)
+
+
+class DAryHeap:
+    """
+    d-арная мин-куча: у узла i потомки d*i+1 … d*i+d, родитель (i-1)//d.
+
+    Дерево высотой log_d n: вставка делает меньше шагов вверх, зато
+    просеивание вниз сравнивает до d потомков. Индексы считаются
+    на месте, а просеивание двигает «дырку» вместо попарных обменов.
+
+    Сложность: build O(n), push O(log_d n), pop O(d log_d n)
+    """
+
+    def __init__(self, array=None, arity=4):
+        if arity < 2:
+            raise ValueError("Арность кучи должна быть не меньше 2")
+        self.arity = arity
+        self.heap = []
+        if array is not None:
+            self.heapify(array)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __str__(self):
+        return f"DAryHeap(d={self.arity}, {self.heap})"
+
+    def _bubble_up(self, index):
+        heap = self.heap
+        arity = self.arity
+        item = heap[index]
+        while index > 0:
+            parent = (index - 1) // arity
+            if heap[parent] <= item:
+                break
+            heap[index] = heap[parent]
+            index = parent
+        heap[index] = item
+
+    def _sink_down(self, index):
+        heap = self.heap
+        arity = self.arity
+        size = len(heap)
+        item = heap[index]
+        while True:
+            first = arity * index + 1
+            if first >= size:
+                break
+            smallest = first
+            for child in range(first + 1, min(first + arity, size)):
+                if heap[child] < heap[smallest]:
+                    smallest = child
+            if heap[smallest] >= item:
+                break
+            heap[index] = heap[smallest]
+            index = smallest
+        heap[index] = item
+
+    def push(self, value):
+        """Вставка. Сложность: O(log_d n)"""
+        self.heap.append(value)
+        self._bubble_up(len(self.heap) - 1)
+
+    def pop(self):
+        """Извлечь минимум. Сложность: O(d log_d n)"""
+        if not self.heap:
+            return None
+
+        last = self.heap.pop()
+        if not self.heap:
+            return last
+
+        root = self.heap[0]
+        self.heap[0] = last
+        self._sink_down(0)
+        return root
+
+    def top(self):
+        """Просмотр минимума. Сложность: O(1)"""
+        return self.heap[0] if self.heap else None
+
+    def heapify(self, array):
+        """Построение кучи из массива. Сложность: O(n)"""
+        self.heap = array[:]
+        for i in range((len(self.heap) - 2) // self.arity, -1, -1):
+            self._sink_down(i)
+
+    def validate_heap(self):
+        """Проверка свойства min-кучи. Сложность: O(n)"""
+        for i in range(1, len(self.heap)):
+            if self.heap[(i - 1) // self.arity] > self.heap[i]:
+                return False
+        return True
+
+
+class IndexedHeap:
+    """
+    Индексированная мин-куча пар (приоритет, ключ) с картой позиций.
+
+    Каждый ключ хранится в куче не более одного раза, поэтому вместо
+    повторной вставки используется decrease_key. Арность задаётся
+    параметром arity (2 — двоичная куча).
+
+    Сложность: push/pop/decrease_key O(log n), contains/priority O(1)
+    """
+
+    def __init__(self, arity=2):
+        if arity < 2:
+            raise ValueError("Арность кучи должна быть не меньше 2")
+        self.arity = arity
+        self.heap = []
+        self.position = {}
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, key):
+        return key in self.position
+
+    def __str__(self):
+        return f"IndexedHeap({self.heap})"
+
+    def _swap(self, i, j):
+        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.position[self.heap[i][1]] = i
+        self.position[self.heap[j][1]] = j
+
+    def _bubble_up(self, index):
+        while index > 0:
+            parent = (index - 1) // self.arity
+            if self.heap[parent][0] <= self.heap[index][0]:
+                break
+            self._swap(parent, index)
+            index = parent
+
+    def _sink_down(self, index):
+        size = len(self.heap)
+        while True:
+            first = self.arity * index + 1
+            smallest = index
+            for child in range(first, min(first + self.arity, size)):
+                if self.heap[child][0] < self.heap[smallest][0]:
+                    smallest = child
+
+            if smallest == index:
+                break
+            self._swap(index, smallest)
+            index = smallest
+
+    def push(self, key, priority):
+        """Вставка нового ключа. Сложность: O(log n)"""
+        if key in self.position:
+            raise KeyError(f"Ключ {key!r} уже в куче")
+        self.heap.append([priority, key])
+        self.position[key] = len(self.heap) - 1
+        self._bubble_up(len(self.heap) - 1)
+
+    def pop(self):
+        """Извлечь (приоритет, ключ) с минимальным приоритетом. Сложность: O(log n)"""
+        if not self.heap:
+            return None
+
+        self._swap(0, len(self.heap) - 1)
+        priority, key = self.heap.pop()
+        del self.position[key]
+        if self.heap:
+            self._sink_down(0)
+        return priority, key
+
+    def top(self):
+        """Просмотр минимума. Сложность: O(1)"""
+        if not self.heap:
+            return None
+        priority, key = self.heap[0]
+        return priority, key
+
+    def priority(self, key):
+        """Текущий приоритет ключа. Сложность: O(1)"""
+        return self.heap[self.position[key]][0]
+
+    def decrease_key(self, key, priority):
+        """Уменьшить приоритет ключа. Сложность: O(log n)"""
+        index = self.position[key]
+        if priority > self.heap[index][0]:
+            raise ValueError("Новый приоритет больше текущего")
+        self.heap[index][0] = priority
+        self._bubble_up(index)
+
+    def validate_heap(self):
+        """Проверка свойства min-кучи и карты позиций. Сложность: O(n)"""
+        for i in range(1, len(self.heap)):
+            if self.heap[(i - 1) // self.arity][0] > self.heap[i][0]:
+                return False
+        return all(self.heap[i][1] == key for key, i in self.position.items()) \
+            and len(self.position) == len(self.heap)
@@ -0,0 +1,174 @@
+class PairingNode:
+    """
+    Узел pairing-кучи. Служит дескриптором для decrease_key и remove.
+
+    child — первый потомок, sibling — следующий брат,
+    prev — предыдущий брат или родитель (для первого потомка).
+    """
+
+    __slots__ = ('value', 'child', 'sibling', 'prev')
+
+    def __init__(self, value):
+        self.value = value
+        self.child = None
+        self.sibling = None
+        self.prev = None
+
+    def __repr__(self):
+        return f"PairingNode({self.value})"
+
+
+class PairingHeap:
+    """
+    Pairing-куча (мин-куча) — сливаемая куча на многодетном дереве.
+
+    Сложность: push O(1), meld O(1), top O(1),
+    pop O(log n) амортизированно, decrease_key O(log n) амортизированно
+    (на практике близко к O(1)), remove O(log n) амортизированно
+    """
+
+    def __init__(self, array=None):
+        self.root = None
+        self.size = 0
+        if array is not None:
+            for value in array:
+                self.push(value)
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return f"PairingHeap(size={self.size}, top={self.top()})"
+
+    def __iter__(self):
+        """Обход значений в порядке дерева (не отсортированном)."""
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.sibling:
+                stack.append(node.sibling)
+            if node.child:
+                stack.append(node.child)
+
+    @staticmethod
+    def _link(first, second):
+        """Связать два корня: больший становится первым потомком меньшего."""
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if second.value < first.value:
+            first, second = second, first
+
+        second.prev = first
+        second.sibling = first.child
+        if first.child:
+            first.child.prev = second
+        first.child = second
+        first.sibling = None
+        first.prev = None
+        return first
+
+    @staticmethod
+    def _merge_pairs(first):
+        """Двухпроходное слияние списка братьев в одно дерево."""
+        pairs = []
+        node = first
+        while node:
+            second = node.sibling
+            following = second.sibling if second else None
+            node.sibling = node.prev = None
+            if second:
+                second.sibling = second.prev = None
+            pairs.append(PairingHeap._link(node, second))
+            node = following
+
+        root = None
+        for tree in reversed(pairs):
+            root = PairingHeap._link(tree, root)
+        return root
+
+    def _cut(self, node):
+        """Отрезать поддерево node от родителя."""
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling:
+            node.sibling.prev = node.prev
+        node.sibling = None
+        node.prev = None
+
+    def push(self, value):
+        """Вставка, возвращает узел-дескриптор. Сложность: O(1)"""
+        node = PairingNode(value)
+        self.root = self._link(self.root, node)
+        self.size += 1
+        return node
+
+    def top(self):
+        """Просмотр минимума. Сложность: O(1)"""
+        return self.root.value if self.root else None
+
+    def pop(self):
+        """Извлечь минимум. Сложность: O(log n) амортизированно"""
+        if self.root is None:
+            return None
+
+        root = self.root
+        self.root = self._merge_pairs(root.child)
+        root.child = None
+        self.size -= 1
+        return root.value
+
+    def meld(self, other):
+        """Забрать все элементы other (other становится пустой). Сложность: O(1)"""
+        self.root = self._link(self.root, other.root)
+        self.size += other.size
+        other.root = None
+        other.size = 0
+
+    def decrease_key(self, node, value):
+        """Уменьшить значение узла. Сложность: O(log n) амортизированно"""
+        if self.root is not node and node.prev is None:
+            raise ValueError("Узел не принадлежит куче")
+        if value > node.value:
+            raise ValueError("Новое значение больше текущего")
+
+        node.value = value
+        if node is not self.root:
+            self._cut(node)
+            self.root = self._link(self.root, node)
+
+    def remove(self, node):
+        """Удалить произвольный узел. Сложность: O(log n) амортизированно"""
+        if node is self.root:
+            return self.pop()
+        if node.prev is None:
+            raise ValueError("Узел не принадлежит куче")
+
+        self._cut(node)
+        subtree = self._merge_pairs(node.child)
+        node.child = None
+        self.root = self._link(self.root, subtree)
+        self.size -= 1
+        return node.value
+
+    def validate_heap(self):
+        """Проверка свойства min-кучи и размера. Сложность: O(n)"""
+        if self.root is None:
+            return self.size == 0
+
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            child = node.child
+            while child:
+                if child.value < node.value:
+                    return False
+                stack.append(child)
+                child = child.sibling
+        return count == self.size
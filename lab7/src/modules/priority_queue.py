@@ -1,13 +1,20 @@
 from modules.heap import SmallHeap
+from modules.pairing_heap import PairingHeap
 
 class QueueItem:
     """
     Элемент очереди с приоритетом.
+
+    Служит дескриптором (handle) задачи: index — текущая позиция
+    в двоичной куче (-1, если элемента в ней нет), node — узел
+    в pairing-куче.
     """
 
     def __init__(self, priority, value):
         self.priority = priority
         self.value = value
+        self.index = -1
+        self.node = None
 
     def __lt__(self, other):
         return self.priority < other.priority
@@ -22,29 +29,183 @@ class QueueItem:
         return f"QueueItem({self.priority}, {self.value})"
 
 
+class _TrackedHeap(SmallHeap):
+    """
+    Min-куча QueueItem, которая поддерживает item.index при каждом обмене.
+
+    Просеивания переопределены здесь, а не через общий метод обмена
+    в SmallHeap, чтобы не замедлять обычные кучи.
+    """
+
+    def _bubble_up(self, index):
+        heap = self.heap
+        item = heap[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if not heap[parent] > item:
+                break
+            heap[index] = heap[parent]
+            heap[index].index = index
+            index = parent
+        heap[index] = item
+        item.index = index
+
+    def _sink_down(self, index):
+        heap = self.heap
+        size = len(heap)
+        item = heap[index]
+        while True:
+            smallest = 2 * index + 1
+            if smallest >= size:
+                break
+            right = smallest + 1
+            if right < size and heap[right] < heap[smallest]:
+                smallest = right
+            if not heap[smallest] < item:
+                break
+            heap[index] = heap[smallest]
+            heap[index].index = index
+            index = smallest
+        heap[index] = item
+        item.index = index
+
+    def _rebuild(self):
+        for i, item in enumerate(self.heap):
+            item.index = i
+        super()._rebuild()
+
+    def items(self):
+        return list(self.heap)
+
+    def holds(self, item):
+        return item.index != -1
+
+    def push(self, item):
+        item.index = len(self.heap)
+        super().push(item)
+
+    def pop(self):
+        if not self.heap:
+            return None
+        return self.remove_at(0)
+
+    def remove_at(self, index):
+        """Удалить элемент по позиции. Сложность: O(log n)"""
+        last = self.heap.pop()
+        if index == len(self.heap):
+            last.index = -1
+            return last
+
+        removed = self.heap[index]
+        self.heap[index] = last
+        last.index = index
+        self._bubble_up(index)
+        self._sink_down(last.index)
+
+        removed.index = -1
+        return removed
+
+    def remove_item(self, item):
+        self.remove_at(item.index)
+
+    def priority_changed(self, item, old_priority):
+        if item.priority < old_priority:
+            self._bubble_up(item.index)
+        elif item.priority > old_priority:
+            self._sink_down(item.index)
+
+    def meld(self, other):
+        """Слить кучи перестройкой. Сложность: O(n + m)"""
+        self.merge(other)
+        other.heap = []
+
+
+class _PairingBackend(PairingHeap):
+    """
+    Pairing-куча QueueItem: узел хранится в item.node.
+    """
+
+    def items(self):
+        return list(self)
+
+    def holds(self, item):
+        return item.node is not None
+
+    def push(self, item):
+        item.node = super().push(item)
+
+    def pop(self):
+        item = super().pop()
+        if item is not None:
+            item.node = None
+        return item
+
+    def remove_item(self, item):
+        self.remove(item.node)
+        item.node = None
+
+    def priority_changed(self, item, old_priority):
+        if item.priority < old_priority:
+            self.decrease_key(item.node, item)
+        elif item.priority > old_priority:
+            self.remove_item(item)
+            self.push(item)
+
+
 class TaskQueue:
     """
     Приоритетная очередь поверх min-кучи. Меньшее число = выше приоритет.
+
+    Очередь хранит карту value -> дескрипторы, а каждый дескриптор знает
+    своё место в куче, поэтому изменение приоритета и удаление
+    произвольной задачи стоят O(log n), а проверка наличия — O(1).
+    Значения задач должны быть хешируемыми.
+
+    backend: 'binary' — двоичная куча (SmallHeap), 'pairing' — pairing-куча
+    с O(1) вставкой и слиянием очередей.
     """
 
-    def __init__(self):
-        self.heap = SmallHeap()
+    _BACKENDS = {'binary': _TrackedHeap, 'pairing': _PairingBackend}
+
+    def __init__(self, backend='binary'):
+        if backend not in self._BACKENDS:
+            raise ValueError(f"Неизвестная реализация кучи: {backend}")
+        self.backend = backend
+        self.heap = self._BACKENDS[backend]()
+        self._handles = {}
 
     def __len__(self):
         return len(self.heap)
 
     def __str__(self):
-        return f"TaskQueue({[str(item) for item in self.heap.heap]})"
+        return f"TaskQueue({[str(item) for item in self.heap.items()]})"
+
+    def __contains__(self, value):
+        return value in self._handles
 
     def push_with_priority(self, value, priority=0):
-        """Добавление по приоритету. Сложность: O(log n)"""
+        """Добавление по приоритету, возвращает дескриптор задачи. Сложность: O(log n)"""
         item = QueueItem(priority, value)
         self.heap.push(item)
+        self._handles.setdefault(value, []).append(item)
+        return item
+
+    def _forget(self, item):
+        handles = self._handles[item.value]
+        for i, handle in enumerate(handles):
+            if handle is item:
+                del handles[i]
+                break
+        if not handles:
+            del self._handles[item.value]
 
     def pop_priority(self):
         """Извлечение элемента с высшим приоритетом. Сложность: O(log n)"""
         item = self.heap.pop()
-        return item.value if item else None
+        if item is None:
+            return None
+        self._forget(item)
+        return item.value
 
     def peek_priority(self):
         """Просмотр без извлечения. Сложность: O(1)"""
@@ -54,19 +215,58 @@ class TaskQueue:
     def empty(self):
         return len(self.heap) == 0
 
+    def change_priority(self, handle, new_priority):
+        """Изменить приоритет задачи по дескриптору. Сложность: O(log n)"""
+        if not self.heap.holds(handle):
+            return False
+
+        old_priority = handle.priority
+        handle.priority = new_priority
+        self.heap.priority_changed(handle, old_priority)
+        return True
+
     def update_priority(self, value, new_priority):
         """
-        Изменить приоритет (неэффективно: O(n)).
+        Изменить приоритет задачи по значению. Сложность: O(log n)
         """
-        for i, item in enumerate(self.heap.heap):
-            if item.value == value:
-                old_priority = item.priority
-                item.priority = new_priority
-
-                if new_priority < old_priority:
-                    self.heap._bubble_up(i)
-                elif new_priority > old_priority:
-                    self.heap._sink_down(i)
-                return True
-
-        return False
+        handles = self._handles.get(value)
+        if not handles:
+            return False
+        return self.change_priority(handles[0], new_priority)
+
+    def remove_handle(self, handle):
+        """Удалить задачу по дескриптору. Сложность: O(log n)"""
+        if not self.heap.holds(handle):
+            return False
+        self.heap.remove_item(handle)
+        self._forget(handle)
+        return True
+
+    def remove(self, value):
+        """Удалить задачу по значению. Сложность: O(log n)"""
+        handles = self._handles.get(value)
+        if not handles:
+            return False
+        return self.remove_handle(handles[0])
+
+    def merge(self, other):
+        """
+        Перенести все задачи из other в эту очередь (other становится пустой).
+
+        Сложность: O(1) для 'pairing' и O(n + m) для 'binary' плюс
+        O(число различных значений в меньшей очереди) на карту дескрипторов.
+        """
+        if other is self:
+            raise ValueError("Нельзя слить очередь с самой собой")
+        if other.backend != self.backend:
+            raise ValueError("Слияние возможно только для очередей с одинаковой кучей")
+
+        self.heap.meld(other.heap)
+
+        small, large = other._handles, self._handles
+        if len(small) > len(large):
+            small, large = large, small
+        for value, handles in small.items():
+            large.setdefault(value, []).extend(handles)
+        self._handles = large
+        other._handles = {}
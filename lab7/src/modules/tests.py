@@ -1,8 +1,9 @@
 import unittest
 import random
-from modules.heap import SmallHeap, LargeHeap
+from modules.heap import SmallHeap, LargeHeap, DAryHeap, IndexedHeap
 from modules.heapsort import heapsort_using_smallheap, heapsort_using_largeheap, inplace_heapsort
 from modules.priority_queue import TaskQueue
+from modules.pairing_heap import PairingHeap
 
 class TestSmallHeap(unittest.TestCase):
     """Тесты для SmallHeap."""
@@ -70,6 +71,34 @@ class TestSmallHeap(unittest.TestCase):
 
         self.assertEqual(extracted, sorted(values))
 
+    def test_push_many(self):
+        for batch in ([4, 1], random.sample(range(1000), 500)):
+            heap = SmallHeap(random.sample(range(1000, 2000), 100))
+            heap.push_many(batch)
+            self.assertTrue(heap.validate_heap())
+            self.assertEqual(len(heap), 100 + len(batch))
+            self.assertEqual(heap.top(), min(batch))
+
+    def test_pop_many_and_nsmallest(self):
+        values = random.sample(range(10000), 300)
+        heap = SmallHeap(values)
+
+        self.assertEqual(heap.nsmallest(10), sorted(values)[:10])
+        self.assertEqual(heap.nsmallest(1000), sorted(values))
+        self.assertEqual(len(heap), 300)
+        self.assertEqual(heap.pop_many(5), sorted(values)[:5])
+        self.assertEqual(len(heap), 295)
+        self.assertEqual(heap.nsmallest(0), [])
+
+    def test_merge(self):
+        first = SmallHeap([5, 9, 1])
+        second = SmallHeap([4, 0, 7])
+        first.merge(second)
+
+        self.assertTrue(first.validate_heap())
+        self.assertEqual(first.pop_many(6), [0, 1, 4, 5, 7, 9])
+        self.assertEqual(len(second), 3)
+
 class TestLargeHeap(unittest.TestCase):
     """Тесты для LargeHeap."""
 
@@ -100,6 +129,138 @@ class TestLargeHeap(unittest.TestCase):
             self.assertGreaterEqual(prev, current)
             prev = current
 
+    def test_batch_operations(self):
+        values = random.sample(range(10000), 200)
+        heap = LargeHeap(values[:50])
+        heap.push_many(values[50:])
+
+        self.assertTrue(heap.validate_heap())
+        self.assertEqual(heap.nlargest(7), sorted(values, reverse=True)[:7])
+        self.assertEqual(heap.pop_many(3), sorted(values, reverse=True)[:3])
+
+        other = LargeHeap([100000])
+        heap.merge(other)
+        self.assertEqual(heap.top(), 100000)
+
+class TestDAryHeap(unittest.TestCase):
+    """Тесты для DAryHeap."""
+
+    def test_push_pop_all_arities(self):
+        values = random.sample(range(10000), 500)
+        for arity in (2, 3, 4, 8):
+            heap = DAryHeap(arity=arity)
+            for value in values:
+                heap.push(value)
+            self.assertTrue(heap.validate_heap())
+
+            extracted = [heap.pop() for _ in range(len(values))]
+            self.assertEqual(extracted, sorted(values))
+            self.assertIsNone(heap.pop())
+
+    def test_heapify(self):
+        values = [random.randint(0, 50) for _ in range(200)]
+        for arity in (2, 4, 8):
+            heap = DAryHeap(values, arity=arity)
+            self.assertTrue(heap.validate_heap())
+            self.assertEqual(heap.top(), min(values))
+
+    def test_invalid_arity(self):
+        with self.assertRaises(ValueError):
+            DAryHeap(arity=1)
+
+class TestIndexedHeap(unittest.TestCase):
+    """Тесты для IndexedHeap."""
+
+    def test_push_pop_order(self):
+        heap = IndexedHeap()
+        for key, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+            heap.push(key, priority)
+
+        self.assertTrue(heap.validate_heap())
+        self.assertEqual(heap.top(), (1, "d"))
+        self.assertEqual([heap.pop()[1] for _ in range(4)], ["d", "b", "a", "c"])
+        self.assertIsNone(heap.pop())
+
+    def test_decrease_key(self):
+        heap = IndexedHeap()
+        for i in range(10):
+            heap.push(i, 10 + i)
+
+        heap.decrease_key(7, 0)
+        self.assertTrue(heap.validate_heap())
+        self.assertEqual(heap.priority(7), 0)
+        self.assertEqual(heap.pop(), (0, 7))
+        self.assertNotIn(7, heap)
+        self.assertIn(8, heap)
+
+    def test_decrease_key_rejects_increase(self):
+        heap = IndexedHeap()
+        heap.push("x", 1)
+        with self.assertRaises(ValueError):
+            heap.decrease_key("x", 2)
+        with self.assertRaises(KeyError):
+            heap.push("x", 0)
+
+    def test_dary_random(self):
+        for arity in (2, 3, 4, 8):
+            heap = IndexedHeap(arity)
+            priorities = {i: random.randint(0, 1000) for i in range(300)}
+            for key, priority in priorities.items():
+                heap.push(key, priority)
+            for key in random.sample(range(300), 100):
+                priorities[key] -= random.randint(0, 500)
+                heap.decrease_key(key, priorities[key])
+
+            self.assertTrue(heap.validate_heap())
+            extracted = [heap.pop()[0] for _ in range(300)]
+            self.assertEqual(extracted, sorted(priorities.values()))
+
+class TestPairingHeap(unittest.TestCase):
+    """Тесты для PairingHeap."""
+
+    def test_push_pop(self):
+        values = random.sample(range(10000), 500)
+        heap = PairingHeap(values)
+
+        self.assertTrue(heap.validate_heap())
+        self.assertEqual(heap.top(), min(values))
+        self.assertEqual([heap.pop() for _ in range(500)], sorted(values))
+        self.assertIsNone(heap.pop())
+
+    def test_meld(self):
+        first = PairingHeap([5, 3, 9])
+        second = PairingHeap([4, 1])
+        first.meld(second)
+
+        self.assertEqual(len(first), 5)
+        self.assertEqual(len(second), 0)
+        self.assertIsNone(second.top())
+        self.assertEqual([first.pop() for _ in range(5)], [1, 3, 4, 5, 9])
+
+    def test_decrease_key_and_remove(self):
+        heap = PairingHeap()
+        nodes = {value: heap.push(value) for value in random.sample(range(1000), 200)}
+        for _ in range(5):
+            heap.pop()
+
+        remaining = sorted(heap)
+        target = remaining[-1]
+        heap.decrease_key(nodes[target], -1)
+        self.assertEqual(heap.top(), -1)
+
+        removed = remaining[len(remaining) // 2]
+        self.assertEqual(heap.remove(nodes[removed]), removed)
+        self.assertTrue(heap.validate_heap())
+
+        expected = sorted([-1] + [v for v in remaining if v not in (target, removed)])
+        self.assertEqual([heap.pop() for _ in range(len(heap))], expected)
+
+    def test_decrease_key_rejects_increase(self):
+        heap = PairingHeap()
+        node = heap.push(5)
+        with self.assertRaises(ValueError):
+            heap.decrease_key(node, 6)
+
 class TestHeapsort(unittest.TestCase):
     """Тесты для heapsort."""
 
@@ -178,5 +339,101 @@ class TestTaskQueue(unittest.TestCase):
         for expected in expected_order:
             self.assertEqual(self.pq.pop_priority(), expected)
 
+    def test_update_priority(self):
+        for i in range(10):
+            self.pq.push_with_priority(f"task{i}", i)
+
+        self.assertTrue(self.pq.update_priority("task7", -1))
+        self.assertTrue(self.pq.update_priority("task0", 100))
+        self.assertFalse(self.pq.update_priority("missing", 0))
+        self.assertTrue(self.pq.heap.validate_heap())
+
+        self.assertEqual(self.pq.pop_priority(), "task7")
+        self.assertEqual(self.pq.pop_priority(), "task1")
+
+    def test_handles_and_remove(self):
+        handles = [self.pq.push_with_priority(f"task{i}", i) for i in range(20)]
+
+        self.assertIn("task5", self.pq)
+        self.assertTrue(self.pq.remove("task5"))
+        self.assertNotIn("task5", self.pq)
+        self.assertFalse(self.pq.remove_handle(handles[5]))
+
+        self.assertTrue(self.pq.change_priority(handles[12], -5))
+        self.assertTrue(self.pq.remove_handle(handles[0]))
+        self.assertTrue(self.pq.heap.validate_heap())
+        for i, item in enumerate(self.pq.heap.heap):
+            self.assertEqual(item.index, i)
+
+        self.assertEqual(self.pq.pop_priority(), "task12")
+        self.assertEqual(handles[12].index, -1)
+        self.assertEqual(len(self.pq), 17)
+
+    def test_duplicate_values(self):
+        first = self.pq.push_with_priority("job", 1)
+        second = self.pq.push_with_priority("job", 1)
+
+        self.assertTrue(self.pq.remove_handle(second))
+        self.assertIn("job", self.pq)
+        self.assertTrue(self.pq.update_priority("job", 0))
+        self.assertEqual(first.priority, 0)
+
+class TestPairingTaskQueue(TestTaskQueue):
+    """Тесты TaskQueue на pairing-куче (повторяют тесты двоичной версии)."""
+
+    def setUp(self):
+        self.pq = TaskQueue(backend='pairing')
+
+    def test_update_priority(self):
+        for i in range(10):
+            self.pq.push_with_priority(f"task{i}", i)
+
+        self.assertTrue(self.pq.update_priority("task7", -1))
+        self.assertTrue(self.pq.update_priority("task0", 100))
+        self.assertTrue(self.pq.heap.validate_heap())
+        self.assertEqual(self.pq.pop_priority(), "task7")
+        self.assertEqual(self.pq.pop_priority(), "task1")
+
+    def test_handles_and_remove(self):
+        handles = [self.pq.push_with_priority(f"task{i}", i) for i in range(20)]
+
+        self.assertTrue(self.pq.remove("task5"))
+        self.assertFalse(self.pq.remove_handle(handles[5]))
+        self.assertTrue(self.pq.change_priority(handles[12], -5))
+        self.assertTrue(self.pq.heap.validate_heap())
+        self.assertEqual(self.pq.pop_priority(), "task12")
+        self.assertEqual(len(self.pq), 18)
+
+    def test_merge(self):
+        other = TaskQueue(backend='pairing')
+        for i in range(5):
+            self.pq.push_with_priority(f"a{i}", 2 * i)
+            other.push_with_priority(f"b{i}", 2 * i + 1)
+
+        self.pq.merge(other)
+        self.assertTrue(other.empty())
+        self.assertNotIn("b0", other)
+        self.assertIn("b0", self.pq)
+        self.assertTrue(self.pq.update_priority("b4", -1))
+        self.assertEqual([self.pq.pop_priority() for _ in range(3)], ["b4", "a0", "b0"])
+
+    def test_merge_binary(self):
+        first = TaskQueue()
+        second = TaskQueue()
+        first.push_with_priority("x", 3)
+        second.push_with_priority("y", 1)
+        first.merge(second)
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 0)
+        self.assertTrue(first.remove("x"))
+        self.assertEqual(first.pop_priority(), "y")
+
+        with self.assertRaises(ValueError):
+            first.merge(TaskQueue(backend='pairing'))
+        with self.assertRaises(ValueError):
+            first.merge(first)
+        self.assertEqual(len(first), 0)
+
 if __name__ == "__main__":
     unittest.main()
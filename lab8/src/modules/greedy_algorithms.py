@@ -137,10 +137,14 @@ class GreedyMethods:
         return res
 
     @staticmethod
-    def prim_mst(vertices, edges):
+    def prim_mst(vertices, edges, heap_factory=None):
         """
         Построение минимального остовного дерева методом Прима.
         Сложность: O(E log V) — использование кучи для рёбер.
+
+        heap_factory — необязательная фабрика индексированной кучи
+        (push/pop/decrease_key/in, например IndexedHeap из lab7):
+        тогда в куче хранится одна запись на вершину вместо O(E) рёбер.
         """
         if not vertices:
             return []
@@ -150,6 +154,9 @@ class GreedyMethods:
             graph[u].append((v, w))
             graph[v].append((u, w))
 
+        if heap_factory is not None:
+            return GreedyMethods._prim_indexed(vertices, graph, heap_factory)
+
         visited = set()
         mst = []
         start = vertices[0]
@@ -172,6 +179,34 @@ class GreedyMethods:
 
         return mst
 
+    @staticmethod
+    def _prim_indexed(vertices, graph, heap_factory):
+        """Прим с decrease_key: ключ вершины — лёгкое ребро в дерево."""
+        visited = set()
+        link = {}
+        mst = []
+
+        heap = heap_factory()
+        heap.push(vertices[0], 0)
+
+        while heap:
+            w, v = heap.pop()
+            visited.add(v)
+            if v in link:
+                mst.append(GraphEdge(link[v], v, w))
+
+            for neigh, nw in graph[v]:
+                if neigh in visited:
+                    continue
+                if neigh not in heap:
+                    heap.push(neigh, nw)
+                    link[neigh] = v
+                elif nw < heap.priority(neigh):
+                    heap.decrease_key(neigh, nw)
+                    link[neigh] = v
+
+        return mst
+
 class PackSolver:
     """
     Разные точные подходы для дискретного рюкзака.
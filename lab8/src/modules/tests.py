@@ -1,6 +1,12 @@
 import unittest
+import os
+import random
+import sys
 from modules.greedy_algorithms import GreedyMethods, PackSolver, TimeInterval, PackItem
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from lab_loader import load_lab_module
+
 class TestGreedyAlgorithms(unittest.TestCase):
     """Тесты жадных методов."""
 
@@ -104,6 +110,21 @@ class TestGreedyAlgorithms(unittest.TestCase):
 
         self.assertEqual(connected, set(vertices))
 
+    def test_prim_indexed_heap(self):
+        IndexedHeap = load_lab_module('lab7', 'heap').IndexedHeap
+
+        random.seed(5)
+        vertices = list(range(40))
+        edges = [(i, i + 1, random.randint(1, 50)) for i in range(39)]
+        edges += [(random.randrange(40), random.randrange(40), random.randint(1, 50))
+                  for _ in range(200)]
+
+        expected = sum(e.weight for e in GreedyMethods.prim_mst(vertices, edges))
+        mst_edges = GreedyMethods.prim_mst(vertices, edges, heap_factory=IndexedHeap)
+
+        self.assertEqual(len(mst_edges), len(vertices) - 1)
+        self.assertEqual(sum(e.weight for e in mst_edges), expected)
+
 class TestPackSolver(unittest.TestCase):
     """Тесты точных методов для рюкзака."""
 
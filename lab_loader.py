@@ -0,0 +1,26 @@
+"""Загрузка модулей соседних лабораторных.
+
+Код каждой лабораторной лежит в пакете modules, поэтому обычный import
+из другой лабы конфликтует по имени пакета. Модуль загружается из файла
+под уникальным именем вида lab7_heap и кэшируется в sys.modules.
+Подходит для модулей без импортов из своего пакета modules.
+"""
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_lab_module(lab: str, module: str):
+    """Модуль lab/src/modules/<module>.py, например load_lab_module('lab7', 'heap')."""
+    name = f"{lab}_{module}"
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = os.path.join(ROOT, lab, 'src', 'modules', f"{module}.py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    loaded = importlib.util.module_from_spec(spec)
+    sys.modules[name] = loaded
+    spec.loader.exec_module(loaded)
+    return loaded